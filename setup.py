@@ -49,6 +49,7 @@ if sys.version_info < (3, ):
 EXTRAS_REQUIRE = {
     'indra': ['indra'],
     'neo4j': ['py2neo==3.1.2'],
+    'csr': ['numpy'],
 }
 TESTS_REQUIRE = [
     'mock',
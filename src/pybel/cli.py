@@ -13,6 +13,8 @@ problems--the code will get executed twice:
 Also see (1) from http://click.pocoo.org/5/setuptools/#setuptools-integration
 """
 
+import itertools as itt
+import json
 import logging
 import os
 import sys
@@ -23,14 +25,16 @@ from click_plugins import with_plugins
 from pkg_resources import iter_entry_points
 
 from .canonicalize import to_bel
-from .constants import get_cache_connection
+from .constants import RELATION, get_cache_connection
 from .examples import braf_graph, egf_graph, homology_graph, sialic_acid_graph, statin_graph
 from .io import from_path, from_pickle, to_csv, to_graphml, to_gsea, to_json_file, to_neo4j, to_pickle, to_sif, to_web
 from .io.web import _get_host
 from .manager import Manager
 from .manager.database_io import to_database
-from .manager.models import Edge, Namespace
+from .manager.models import Namespace
+from .manager.query_manager import iter_edges_with_data
 from .struct import get_unused_annotations, get_unused_namespaces
+from .struct.pipeline import Pipeline
 from .utils import get_corresponding_pickle_path
 
 log = logging.getLogger(__name__)
@@ -159,6 +163,21 @@ def _print_summary(graph, ticks=False):
         click.echo('```')
 
 
+@main.command()
+@graph_pickle_argument
+@click.argument('pipeline', type=click.File())
+@click.option('-o', '--output', type=click.File('w'), help='Path to output the measurements as JSON.')
+def profile(graph, pipeline, output):
+    """Run a pipeline from a JSON file on a graph and measure each step."""
+    pipeline = Pipeline.load(pipeline)
+    pipeline.run(graph, profile=True)
+
+    click.echo(pipeline.profile.to_table())
+
+    if output is not None:
+        json.dump(pipeline.profile.to_json(), output, indent=2)
+
+
 @main.command()
 @graph_pickle_argument
 def warnings(graph):
@@ -339,7 +358,7 @@ def networks():
 @click.pass_obj
 def ls(manager):
     """List network names, versions, and optionally, descriptions."""
-    for n in manager.list_networks():
+    for n in manager.iter_networks():
         click.echo('{}\t{}\t{}'.format(n.id, n.name, n.version))
 
 
@@ -362,21 +381,45 @@ def edges():
 
 
 @edges.command()
-@click.option('--offset', type=int)
+@click.option('--offset', type=int, help='Number of edges to skip')
+@click.option('--after', type=int, help='Only list edges whose identifiers are larger than this one')
 @click.option('--limit', type=int, default=10)
+@click.option('--show-id', is_flag=True, help='Show the identifier of each edge before its BEL, for use with --after')
 @click.pass_obj
-def ls(manager, offset, limit):
-    """List edges."""
-    q = manager.session.query(Edge)
+def ls(manager, offset, after, limit, show_id):
+    """List edges.
 
-    if offset:
-        q = q.offset(offset)
+    Use the identifier of the last edge listed with ``--show-id`` and ``--after`` to get the next page.
+    """
+    it = manager.iter_edges(offset=offset, after=after, batch_size=limit if limit > 0 else None)
 
     if limit > 0:
-        q = q.limit(limit)
+        it = itt.islice(it, limit)
 
-    for e in q:
-        click.echo(e.bel)
+    for e in it:
+        if show_id:
+            click.echo('{}\t{}'.format(e.id, e.bel))
+        else:
+            click.echo(e.bel)
+
+
+@edges.command()
+@click.option('-o', '--output', type=click.File('w'), default='-', help='Output file. Defaults to stdout.')
+@click.option('-f', '--fmt', type=click.Choice(['jsonl', 'tsv']), default='jsonl', show_default=True,
+              help='Output format: one JSON object per line or tab-separated source, relation, and target.')
+@click.option('--batch-size', type=int, help='Number of edges to load from the database at a time')
+@click.pass_obj
+def export(manager, output, fmt, batch_size):
+    """Export all edges, streaming them from the database."""
+    edges_it = iter_edges_with_data(manager.iter_edges(batch_size=batch_size))
+
+    if fmt == 'tsv':
+        for edge, u, v, data in edges_it:
+            click.echo('\t'.join([u.as_bel(), data[RELATION], v.as_bel(), edge.sha512]), file=output)
+
+    else:
+        for edge, u, v, data in edges_it:
+            click.echo(json.dumps({'source': u, 'target': v, 'key': edge.sha512, 'data': data}), file=output)
 
 
 @manage.command()
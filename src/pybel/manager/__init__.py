@@ -8,11 +8,15 @@ downloading and parsing upon each compilation.
 
 """
 
-from . import base_manager, cache_manager, citation_utils, database_io, make_json_serializable, models, query_manager
+from . import (
+    base_manager, cache_manager, citation_utils, database_io, fulltext, make_json_serializable, models,
+    query_manager,
+)
 from .base_manager import *
 from .cache_manager import *
 from .citation_utils import *
 from .database_io import *
+from .fulltext import *
 from .models import *
 from .query_manager import *
 
@@ -21,6 +25,7 @@ __all__ = (
     cache_manager.__all__ +
     citation_utils.__all__ +
     database_io.__all__ +
+    fulltext.__all__ +
     models.__all__ +
     query_manager.__all__
 )
@@ -6,7 +6,8 @@ from __future__ import unicode_literals
 
 import logging
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from .models import Base
@@ -14,14 +15,169 @@ from ..constants import config
 
 __all__ = [
     'BaseManager',
+    'build_engine',
     'build_engine_session',
+    'iter_query_by_keyset',
 ]
 
 log = logging.getLogger(__name__)
 
+#: The default number of rows loaded at a time by :func:`iter_query_by_keyset`
+DEFAULT_BATCH_SIZE = 1000
+
+
+def iter_query_by_keyset(query, key, batch_size=None, offset=None, after=None):
+    """Iterate over the results of a query in batches using keyset pagination.
+
+    Instead of using ``OFFSET``, which gets slower the further into the table it goes, each batch starts after the
+    largest key of the previous batch. Only one batch is held in memory at a time.
+
+    :param sqlalchemy.orm.query.Query query: A query
+    :param key: A unique, orderable column of the queried model, like its primary key
+    :param Optional[int] batch_size: The number of rows to load at a time. Defaults to 1000.
+    :param Optional[int] offset: The number of rows to skip. Only the first batch uses ``OFFSET`` in the database.
+    :param after: Only get the rows whose key is larger than this, like the last key of a previous iteration
+    :rtype: iter
+    """
+    batch_size = batch_size if batch_size is not None else DEFAULT_BATCH_SIZE
+    last = after
+
+    while True:
+        batch_query = query if last is None else query.filter(key > last)
+        batch_query = batch_query.order_by(key).limit(batch_size)
+
+        if offset:
+            batch_query = batch_query.offset(offset)
+            offset = None
+
+        batch = batch_query.all()
+
+        if not batch:
+            return
+
+        for result in batch:
+            yield result
+
+        if len(batch) < batch_size:
+            return
+
+        last = getattr(batch[-1], key.key)
+
+
+#: SQLite pragmas used when ``PYBEL_MANAGER_SQLITE_PERFORMANCE`` is set in the configuration. Write-ahead logging
+#: lets readers work concurrently with a writer, and with it, ``synchronous=NORMAL`` is still safe from corruption
+#: while only syncing at checkpoints.
+SQLITE_PERFORMANCE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 268435456,  # 256 MiB
+    'cache_size': -65536,  # negative values are in KiB, so this is 64 MiB
+}
+
+
+def get_sqlite_pragmas():
+    """Get the SQLite pragmas to set on each new connection from the configuration.
+
+    Uses :data:`SQLITE_PERFORMANCE_PRAGMAS` if ``PYBEL_MANAGER_SQLITE_PERFORMANCE`` is true, updated with the
+    dictionary in ``PYBEL_MANAGER_SQLITE_PRAGMAS``.
+
+    :rtype: dict[str,str]
+    """
+    rv = {}
+
+    if config.get('PYBEL_MANAGER_SQLITE_PERFORMANCE', False):
+        rv.update(SQLITE_PERFORMANCE_PRAGMAS)
+
+    rv.update(config.get('PYBEL_MANAGER_SQLITE_PRAGMAS', {}))
+
+    return rv
+
+
+def _set_read_only_statement(backend):
+    """Get the statement that makes a connection read-only for the given backend, if it's supported.
+
+    :param str backend: The name of the database backend, like ``sqlite`` or ``postgresql``
+    :rtype: Optional[str]
+    """
+    if backend == 'sqlite':
+        return 'PRAGMA query_only=ON'
+
+    if backend == 'postgresql':
+        return 'SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY'
+
+    if backend == 'mysql':
+        return 'SET SESSION TRANSACTION READ ONLY'
+
+
+def build_engine(connection, echo=False, read_only=None, pool_size=None, max_overflow=None):
+    """Build an engine, tuned with the options from the configuration.
+
+    :param str connection: An RFC-1738 database connection string
+    :param bool echo: Turn on echoing SQL
+    :param Optional[bool] read_only: Should all connections be read-only, like for query workers? Defaults to False
+     if not specified in kwargs or configuration (``PYBEL_MANAGER_READ_ONLY``).
+    :param Optional[int] pool_size: The number of connections to keep open. Not used for SQLite. Defaults to the
+     SQLAlchemy default if not specified in kwargs or configuration (``PYBEL_MANAGER_POOL_SIZE``).
+    :param Optional[int] max_overflow: The number of connections to allow above the pool size. Not used for SQLite.
+     Defaults to the SQLAlchemy default if not specified in kwargs or configuration (``PYBEL_MANAGER_MAX_OVERFLOW``).
+    :rtype: sqlalchemy.engine.Engine
+
+    For SQLite, the pragmas from :func:`get_sqlite_pragmas` are set on each new connection.
+    """
+    backend = make_url(connection).get_backend_name()
+
+    if read_only is None:
+        read_only = config.get('PYBEL_MANAGER_READ_ONLY', False)
+
+    engine_kwargs = {}
+
+    if backend != 'sqlite':
+        if pool_size is None:
+            pool_size = config.get('PYBEL_MANAGER_POOL_SIZE')
+
+        if max_overflow is None:
+            max_overflow = config.get('PYBEL_MANAGER_MAX_OVERFLOW')
+
+        if pool_size is not None:
+            engine_kwargs['pool_size'] = pool_size
+
+        if max_overflow is not None:
+            engine_kwargs['max_overflow'] = max_overflow
+
+    engine = create_engine(connection, echo=echo, **engine_kwargs)
+
+    statements = []
+
+    if backend == 'sqlite':
+        statements.extend(
+            'PRAGMA {}={}'.format(key, value)
+            for key, value in sorted(get_sqlite_pragmas().items())
+        )
+
+    if read_only:
+        read_only_statement = _set_read_only_statement(backend)
+
+        if read_only_statement is None:
+            log.warning('read-only connections are not supported for %s', backend)
+        else:
+            statements.append(read_only_statement)
+
+    if statements:
+        log.debug('setting on each connection: %s', statements)
+
+        @event.listens_for(engine, 'connect')
+        def set_connection_options(dbapi_connection, connection_record):
+            """Run the tuning statements on each new connection."""
+            cursor = dbapi_connection.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.close()
+
+    return engine
+
 
 def build_engine_session(connection, echo=False, autoflush=None, autocommit=None, expire_on_commit=None,
-                         scopefunc=None):
+                         scopefunc=None, read_only=None, pool_size=None, max_overflow=None):
     """Build an engine and a session.
 
     :param str connection: An RFC-1738 database connection string
@@ -30,6 +186,10 @@ def build_engine_session(connection, echo=False, autoflush=None, autocommit=None
     :param Optional[bool] autocommit: Defaults to False if not specified in kwargs or configuration.
     :param Optional[bool] expire_on_commit: Defaults to False if not specified in kwargs or configuration.
     :param scopefunc: Scoped function to pass to :func:`sqlalchemy.orm.scoped_session`
+    :param Optional[bool] read_only: Should all connections be read-only? See :func:`build_engine`.
+    :param Optional[int] pool_size: The number of connections to keep open. See :func:`build_engine`.
+    :param Optional[int] max_overflow: The number of connections to allow above the pool size. See
+     :func:`build_engine`.
     :rtype: tuple[Engine,Session]
 
     From the Flask-SQLAlchemy documentation:
@@ -43,7 +203,8 @@ def build_engine_session(connection, echo=False, autoflush=None, autocommit=None
     if connection is None:
         raise ValueError('can not build engine when connection is None')
 
-    engine = create_engine(connection, echo=echo)
+    engine = build_engine(connection, echo=echo, read_only=read_only, pool_size=pool_size,
+                          max_overflow=max_overflow)
 
     if autoflush is None:
         autoflush = config.get('PYBEL_MANAGER_AUTOFLUSH', False)
@@ -111,12 +272,20 @@ class BaseManager(object):
         """
         return self.session.query(model_cls).count()
 
-    def list_citations(self, model_cls):
+    def _list_model(self, model_cls):
         """List the models in the database.
 
         :rtype: list
         """
         return self.session.query(model_cls).all()
 
+    def _iter_model(self, model_cls, batch_size=None):
+        """Iterate over the models in the database without loading them all at once.
+
+        :param int batch_size: The number of models to load at a time. Defaults to 1000.
+        :rtype: iter
+        """
+        return iter_query_by_keyset(self.session.query(model_cls), model_cls.id, batch_size=batch_size)
+
     def __repr__(self):
         return '<{} connection={}>'.format(self.__class__.__name__, self.engine.url)
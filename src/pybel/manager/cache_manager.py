@@ -8,6 +8,7 @@ enable this option, but can specify a database location if they choose.
 
 from __future__ import unicode_literals
 
+import json
 import logging
 from copy import deepcopy
 
@@ -16,15 +17,15 @@ import time
 from itertools import chain
 from six import string_types
 from sqlalchemy import and_, exists, func
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import aliased, defer
 from tqdm import tqdm
 
-from .base_manager import BaseManager, build_engine_session
+from .base_manager import BaseManager, build_engine_session, iter_query_by_keyset
 from .exc import EdgeAddError
 from .lookup_manager import LookupManager
 from .models import (
-    Author, Citation, Edge, Evidence, Modification, Namespace, NamespaceEntry, Network, Node, Property, edge_annotation,
-    edge_property, network_edge, network_node,
+    Author, Citation, Edge, Evidence, Modification, Namespace, NamespaceEntry, Network, NetworkSummary, Node, Property,
+    edge_annotation, edge_property, network_edge, network_node,
 )
 from .query_manager import QueryManager
 from .utils import extract_shared_optional, extract_shared_required, update_insert_values
@@ -33,9 +34,9 @@ from ..constants import (
     CITATION_ISSUE, CITATION_LAST_AUTHOR, CITATION_NAME, CITATION_PAGES, CITATION_REFERENCE, CITATION_TITLE,
     CITATION_TYPE, CITATION_TYPE_PUBMED, CITATION_VOLUME, DEGRADATION, EFFECT, EVIDENCE, FRAGMENT, FRAGMENT_MISSING,
     FRAGMENT_START, FRAGMENT_STOP, FUSION, FUSION_REFERENCE, FUSION_START, FUSION_STOP, GMOD, GOCC_KEYWORD, GOCC_LATEST,
-    HGVS, IDENTIFIER, KIND, LINE, LOCATION, METADATA_INSERT_KEYS, MODIFIER, NAME, NAMESPACE, OBJECT, PARTNER_3P,
-    PARTNER_5P, PMOD, PMOD_CODE, PMOD_POSITION, RANGE_3P, RANGE_5P, RELATION, SUBJECT, TRANSLOCATION, UNQUALIFIED_EDGES,
-    VARIANTS, belns_encodings, get_cache_connection,
+    HGVS, IDENTIFIER, KIND, LINE, LOCATION, METADATA_INSERT_KEYS, METADATA_NAME, METADATA_VERSION, MODIFIER, NAME,
+    NAMESPACE, OBJECT, PARTNER_3P, PARTNER_5P, PMOD, PMOD_CODE, PMOD_POSITION, RANGE_3P, RANGE_5P, RELATION, SUBJECT,
+    TRANSLOCATION, UNQUALIFIED_EDGES, VARIANTS, belns_encodings, get_cache_connection,
 )
 from ..language import (
     BEL_DEFAULT_NAMESPACE_URL, BEL_DEFAULT_NAMESPACE_VERSION, activity_mapping, gmod_mappings, pmod_mappings,
@@ -118,6 +119,26 @@ def _normalize_url(graph, keyword):  # FIXME move to utilities and unit test
     return graph.namespace_url.get(keyword)
 
 
+def make_network_summary(graph):
+    """Calculate the summary of a BEL graph to store with its network.
+
+    :param BELGraph graph: A BEL graph
+    :rtype: NetworkSummary
+    """
+    summary = graph.get_summary()
+
+    return NetworkSummary(
+        number_nodes=summary.number_of_nodes,
+        number_edges=summary.number_of_edges,
+        number_citations=summary.number_of_citations,
+        number_warnings=summary.number_of_warnings,
+        functions=json.dumps(summary.functions),
+        relations=json.dumps(summary.relations),
+        namespaces=json.dumps(summary.namespaces),
+        annotations=json.dumps(summary.annotations),
+    )
+
+
 class NamespaceManager(BaseManager):
     """Manages BEL namespaces."""
 
@@ -128,6 +149,14 @@ class NamespaceManager(BaseManager):
         """
         return self.session.query(Namespace).all()
 
+    def iter_namespaces(self, batch_size=None):
+        """Iterate over all namespaces without loading them all at once.
+
+        :param Optional[int] batch_size: The number of namespaces to load at a time
+        :rtype: iter[Namespace]
+        """
+        return self._iter_model(Namespace, batch_size=batch_size)
+
     def count_namespaces(self):
         """Count the number of namespaces in the database.
 
@@ -431,6 +460,81 @@ class NetworkManager(NamespaceManager):
         """
         return self.session.query(Network).all()
 
+    def iter_networks(self, batch_size=None):
+        """Iterate over all networks in the database without loading them all at once.
+
+        The networks' blobs aren't loaded unless they're accessed.
+
+        :param Optional[int] batch_size: The number of networks to load at a time
+        :rtype: iter[Network]
+        """
+        query = self.session.query(Network).options(defer(Network.blob))
+        return iter_query_by_keyset(query, Network.id, batch_size=batch_size)
+
+    def get_network_summary_by_id(self, network_id):
+        """Get the precomputed summary of a network, without deserializing it.
+
+        Networks that were inserted before summaries were stored have theirs calculated and stored the first time.
+
+        :param int network_id: The network's database identifier
+        :return: A dictionary from :meth:`NetworkSummary.to_json`, or none if the network doesn't exist
+        :rtype: Optional[dict]
+        """
+        summary = self.session.query(NetworkSummary).get(network_id)
+
+        if summary is None:
+            network = self.session.query(Network).get(network_id)
+
+            if network is None:
+                return
+
+            summary = self._store_network_summary(network)
+
+        return summary.to_json()
+
+    def list_network_summaries(self):
+        """List the metadata and precomputed summaries of all networks, without deserializing them.
+
+        Networks that were inserted before summaries were stored have theirs calculated and stored the first time.
+
+        :return: A list of dictionaries with the network's identifier, name, version, and creation date merged with
+         its summary from :meth:`NetworkSummary.to_json`
+        :rtype: list[dict]
+        """
+        missing = self.session.query(Network).filter(~Network.summary.has()).all()
+        for network in missing:
+            log.info('calculating missing summary for %s', network)
+            self._store_network_summary(network)
+
+        query = self.session.query(Network.id, Network.name, Network.version, Network.created, NetworkSummary) \
+            .join(NetworkSummary, NetworkSummary.network_id == Network.id) \
+            .order_by(Network.id)
+
+        rv = []
+
+        for network_id, name, version, created, summary in query:
+            result = summary.to_json()
+            result.update({
+                'id': network_id,
+                METADATA_NAME: name,
+                METADATA_VERSION: version,
+                'created': str(created),
+            })
+            rv.append(result)
+
+        return rv
+
+    def _store_network_summary(self, network):
+        """Calculate and store the summary of a network that doesn't have one.
+
+        :param Network network: A network model
+        :rtype: NetworkSummary
+        """
+        summary = network.summary = make_network_summary(network.as_bel())
+        self.session.add(summary)
+        self.session.commit()
+        return summary
+
     def list_recent_networks(self):
         """List the most recently created version of each network (by name).
 
@@ -504,6 +608,10 @@ class NetworkManager(NamespaceManager):
         # delete the now-orphaned edges
         self.session.query(Edge).filter(Edge.id.in_(edge_ids)).delete(synchronize_session=False)
 
+        # delete the network's summary
+        self.session.query(NetworkSummary).filter(NetworkSummary.network_id == network.id).delete(
+            synchronize_session=False)
+
         # delete the network
         self.session.query(Network).filter(Network.id == network.id).delete(synchronize_session=False)
 
@@ -720,6 +828,7 @@ class InsertManager(NamespaceManager, LookupManager):
         })
 
         network.store_bel(graph)
+        network.summary = make_network_summary(graph)
 
         if store_parts:
             network.nodes, network.edges = self._store_graph_parts(graph, use_tqdm=use_tqdm)
@@ -1197,6 +1306,84 @@ class InsertManager(NamespaceManager, LookupManager):
         self.session.add(author)
         return author
 
+    def get_or_create_authors(self, names, chunk_size=None):
+        """Get or create several authors with one query per chunk of names instead of one per name.
+
+        :param iter[str] names: Authors' names
+        :param Optional[int] chunk_size: The number of names to look up at a time. Defaults to 500.
+        :return: A dictionary from names to authors
+        :rtype: dict[str,Author]
+        """
+        chunk_size = chunk_size if chunk_size is not None else 500
+
+        rv = {}
+        missing = {}
+
+        for name in set(names):
+            author = self.object_cache_author.get(name)
+
+            if author is not None:
+                self.session.add(author)
+                rv[name] = author
+            else:
+                missing[Author.hash_name(name)] = name
+
+        hashes = list(missing)
+        for i in range(0, len(hashes), chunk_size):
+            query = self.session.query(Author).filter(Author.sha512.in_(hashes[i:i + chunk_size]))
+
+            for author in query:
+                rv[author.name] = self.object_cache_author[author.name] = author
+                del missing[author.sha512]
+
+        for name in missing.values():
+            rv[name] = self.object_cache_author[name] = Author.from_name(name=name)
+            self.session.add(rv[name])
+
+        return rv
+
+    def get_or_create_citations(self, references, type=None, chunk_size=None):
+        """Get or create several citations with one query per chunk of references instead of one per reference.
+
+        :param iter[str] references: Identifiers of the citations (e.g. PubMed identifiers)
+        :param Optional[str] type: Citation type. Defaults to PubMed.
+        :param Optional[int] chunk_size: The number of references to look up at a time. Defaults to 500.
+        :return: A dictionary from references to citations
+        :rtype: dict[str,Citation]
+        """
+        if type is None:
+            type = CITATION_TYPE_PUBMED
+
+        chunk_size = chunk_size if chunk_size is not None else 500
+
+        rv = {}
+        missing = {}
+
+        for reference in set(references):
+            sha512 = hash_citation(type=type, reference=reference)
+            citation = self.object_cache_citation.get(sha512)
+
+            if citation is not None:
+                self.session.add(citation)
+                rv[reference] = citation
+            else:
+                missing[sha512] = reference
+
+        hashes = list(missing)
+        for i in range(0, len(hashes), chunk_size):
+            query = self.session.query(Citation).filter(Citation.sha512.in_(hashes[i:i + chunk_size]))
+
+            for citation in query:
+                rv[citation.reference] = self.object_cache_citation[citation.sha512] = citation
+                del missing[citation.sha512]
+
+        for sha512, reference in missing.items():
+            citation = Citation(type=type, reference=reference, sha512=sha512)
+            rv[reference] = self.object_cache_citation[sha512] = citation
+            self.session.add(citation)
+
+        return rv
+
     def get_modification_by_hash(self, sha512):
         """Get a modification by a SHA512 hash.
 
@@ -1471,8 +1658,20 @@ class _Manager(QueryManager, InsertManager, NetworkManager):
         return self._count_model(Citation)
 
     def list_citations(self):
+        """List all citations in the database.
+
+        :rtype: list[Citation]
+        """
         return self._list_model(Citation)
 
+    def iter_citations(self, batch_size=None):
+        """Iterate over all citations in the database without loading them all at once.
+
+        :param Optional[int] batch_size: The number of citations to load at a time
+        :rtype: iter[Citation]
+        """
+        return self._iter_model(Citation, batch_size=batch_size)
+
 
 class Manager(_Manager):
     """A manager for the PyBEL database."""
@@ -1503,6 +1702,14 @@ class Manager(_Manager):
         :param Optional[bool] autocommit: Defaults to False if not specified in kwargs or configuration.
         :param Optional[bool] expire_on_commit: Defaults to False if not specified in kwargs or configuration.
         :param scopefunc: Scoped function to pass to :func:`sqlalchemy.orm.scoped_session`
+        :param Optional[bool] read_only: Should all connections be read-only? Defaults to False if not specified in
+         kwargs or configuration.
+        :param Optional[int] pool_size: The number of connections to keep open for server databases
+        :param Optional[int] max_overflow: The number of connections to allow above the pool size for server databases
+
+        The SQLite performance profile (WAL journaling, ``synchronous=NORMAL``, memory mapping, and a larger page
+        cache) can be turned on by setting ``PYBEL_MANAGER_SQLITE_PERFORMANCE`` to true in the configuration. See
+        :func:`pybel.manager.base_manager.build_engine`.
 
         From the Flask-SQLAlchemy documentation:
 
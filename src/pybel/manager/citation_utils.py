@@ -4,8 +4,10 @@
 
 import logging
 import re
+import threading
 import time
 from datetime import datetime
+from multiprocessing.pool import ThreadPool
 
 import requests
 from six.moves import zip_longest
@@ -18,12 +20,18 @@ from ..struct.summary.provenance import get_pubmed_identifiers
 __all__ = [
     'get_citations_by_pmids',
     'enrich_pubmed_citations',
+    'TokenBucket',
 ]
 
 log = logging.getLogger(__name__)
 
 EUTILS_URL_FMT = "http://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi?db=pubmed&retmode=json&id={}"
 
+#: The number of requests per second NCBI allows without an API key
+DEFAULT_RATE = 3
+
+_clock = getattr(time, 'monotonic', time.time)
+
 re1 = re.compile('^[12][0-9]{3} [a-zA-Z]{3} \d{1,2}$')
 re2 = re.compile('^[12][0-9]{3} [a-zA-Z]{3}$')
 re3 = re.compile('^[12][0-9]{3}$')
@@ -88,22 +96,92 @@ def clean_pubmed_identifiers(pmids):
     return sorted({str(pmid).strip() for pmid in pmids})
 
 
-def get_pubmed_citation_response(pubmed_identifiers):
+class TokenBucket(object):
+    """A thread-safe token bucket for limiting the rate of requests.
+
+    Tokens are refilled continuously at ``rate`` per second up to ``capacity``. Each call to :meth:`acquire` takes one
+    token, waiting until one is available.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """Build a token bucket.
+
+        :param float rate: The number of tokens added per second
+        :param Optional[float] capacity: The maximum number of tokens that can be saved up. Defaults to one.
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive: {}'.format(rate))
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else 1
+        self.tokens = self.capacity
+        self.timestamp = _clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token from the bucket, blocking until one is available."""
+        while True:
+            with self._lock:
+                now = _clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+                self.timestamp = now
+
+                if 1 <= self.tokens:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def get_pubmed_citation_response(pubmed_identifiers, url_fmt=None, session=None):
     """Get the response from PubMed E-Utils for a given list of PubMed identifiers.
 
     :param list[str] pubmed_identifiers:
+    :param Optional[str] url_fmt: The URL format string for the eUtils service. Defaults to :data:`EUTILS_URL_FMT`.
+    :param Optional[requests.Session] session: A session to reuse connections
     :rtype: dict
     """
     pubmed_identifiers = list(pubmed_identifiers)
-    url = EUTILS_URL_FMT.format(','.join(
+    url = (url_fmt or EUTILS_URL_FMT).format(','.join(
         pubmed_identifier
         for pubmed_identifier in pubmed_identifiers
         if pubmed_identifier
     ))
-    response = requests.get(url)
+    response = (session or requests).get(url)
+    response.raise_for_status()
     return response.json()
 
 
+def _get_pubmed_citation_response_with_retries(pubmed_identifiers, rate_limiter, retries, backoff, url_fmt=None,
+                                               session=None):
+    """Get the response from PubMed E-Utils, waiting for the rate limiter and backing off exponentially on failures.
+
+    :param list[str] pubmed_identifiers:
+    :param TokenBucket rate_limiter: The rate limiter shared by all requests
+    :param int retries: The number of times to retry a failed request
+    :param float backoff: The number of seconds to wait before the first retry. Doubles for each retry.
+    :param Optional[str] url_fmt: The URL format string for the eUtils service
+    :param Optional[requests.Session] session: A session to reuse connections
+    :return: The PubMed identifiers and the response, or none if all attempts failed
+    :rtype: tuple[list[str],Optional[dict]]
+    """
+    for attempt in range(retries + 1):
+        rate_limiter.acquire()
+
+        try:
+            return pubmed_identifiers, get_pubmed_citation_response(pubmed_identifiers, url_fmt=url_fmt,
+                                                                    session=session)
+        except (requests.RequestException, ValueError) as e:
+            log.warning('attempt %d failed for %d PubMed identifiers: %s', attempt + 1, len(pubmed_identifiers), e)
+
+            if attempt < retries:
+                time.sleep(backoff * 2 ** attempt)
+
+    return pubmed_identifiers, None
+
+
 def enrich_citation_model(manager, citation, p):
     """Enrich a citation model with the information from PubMed.
 
@@ -141,20 +219,36 @@ def enrich_citation_model(manager, citation, p):
     return True
 
 
-def get_citations_by_pmids(manager, pmids, group_size=None, sleep_time=None):
+def get_citations_by_pmids(manager, pmids, group_size=None, sleep_time=None, max_workers=None, rate=None,
+                           retries=None, backoff=None, url_fmt=None):
     """Get citation information for the given list of PubMed identifiers using the NCBI's eUtils service.
 
+    The citations already in the database are looked up in bulk. The rest are requested from eUtils in groups by
+    several threads that share a token bucket rate limiter, while the main thread stores the results as they arrive.
+
     :type manager: pybel.Manager
     :param pmids: an iterable of PubMed identifiers
     :type pmids: iter[str] or iter[int]
     :param int group_size: The number of PubMed identifiers to query at a time. Defaults to 200 identifiers.
-    :param int sleep_time: Number of seconds to sleep between queries. Defaults to 1 second.
+    :param int sleep_time: Number of seconds to wait between queries. Only used if ``rate`` isn't given. Defaults to
+                           the rate allowed by NCBI without an API key.
+    :param Optional[int] max_workers: The number of concurrent requests. Defaults to 3.
+    :param Optional[float] rate: The maximum number of requests per second. Defaults to 3.
+    :param Optional[int] retries: The number of times to retry a failed request. Defaults to 3.
+    :param Optional[float] backoff: The number of seconds to wait before retrying a failed request, which doubles
+                                    with each attempt. Defaults to 1 second.
+    :param Optional[str] url_fmt: The URL format string for the eUtils service. Defaults to :data:`EUTILS_URL_FMT`.
     :return: A dictionary of {pmid: pmid data dictionary} or a pair of this dictionary and a set ot erroneous
             pmids if return_errors is :data:`True`
     :rtype: tuple[dict[str,dict],set[str]]
     """
     group_size = group_size if group_size is not None else 200
-    sleep_time = sleep_time if sleep_time is not None else 1
+    max_workers = max_workers if max_workers is not None else 3
+    retries = retries if retries is not None else 3
+    backoff = backoff if backoff is not None else 1
+
+    if rate is None:
+        rate = 1 / float(sleep_time) if sleep_time else DEFAULT_RATE
 
     pmids = clean_pubmed_identifiers(pmids)
     log.info('Ensuring %d PubMed identifiers', len(pmids))
@@ -162,9 +256,7 @@ def get_citations_by_pmids(manager, pmids, group_size=None, sleep_time=None):
     result = {}
     unenriched_pmids = {}
 
-    for pmid in pmids:
-        citation = manager.get_or_create_citation(type=CITATION_TYPE_PUBMED, reference=pmid)
-
+    for pmid, citation in manager.get_or_create_citations(pmids, type=CITATION_TYPE_PUBMED).items():
         if not citation.date or not citation.name or not citation.authors:
             unenriched_pmids[pmid] = citation
             continue
@@ -184,35 +276,92 @@ def get_citations_by_pmids(manager, pmids, group_size=None, sleep_time=None):
     errors = set()
     t = time.time()
 
-    for pmid_group_index, pmid_list in enumerate(grouper(group_size, unenriched_pmids), start=1):
-        pmid_list = list(pmid_list)
-        log.info('Getting group %d having %d PubMed identifiers', pmid_group_index, len(pmid_list))
+    rate_limiter = TokenBucket(rate)
+    http_session = requests.Session()
+    pool = ThreadPool(max_workers)
+
+    def _fetch(pmid_list):
+        """Get a group of PubMed identifiers in a worker thread."""
+        return _get_pubmed_citation_response_with_retries(
+            pmid_list,
+            rate_limiter=rate_limiter,
+            retries=retries,
+            backoff=backoff,
+            url_fmt=url_fmt,
+            session=http_session,
+        )
+
+    pmid_lists = (
+        [pmid for pmid in pmid_list if pmid is not None]
+        for pmid_list in grouper(group_size, sorted(unenriched_pmids))
+    )
+
+    try:
+        for pmid_group_index, (pmid_list, response) in enumerate(pool.imap_unordered(_fetch, pmid_lists), start=1):
+            log.info('Got group %d having %d PubMed identifiers', pmid_group_index, len(pmid_list))
+
+            if response is None:
+                errors.update(pmid_list)
+                continue
 
-        response = get_pubmed_citation_response(pmid_list)
-        response_pmids = response['result']['uids']
+            _enrich_citation_models(manager, unenriched_pmids, response, result, errors)
+            manager.session.commit()  # commit in groups
+    finally:
+        pool.close()
+        pool.join()
+        http_session.close()
 
-        for pmid in response_pmids:
-            p = response['result'][pmid]
-            citation = unenriched_pmids[pmid]
+    log.info('retrieved %d PubMed identifiers in %.02f seconds', len(unenriched_pmids), time.time() - t)
 
-            successful_enrichment = enrich_citation_model(manager, citation, p)
+    return result, errors
 
-            if not successful_enrichment:
-                log.warning("Error downloading PubMed identifier: %s", pmid)
-                errors.add(pmid)
-                continue
 
-            result[pmid] = citation.to_json()
-            manager.session.add(citation)
+def _enrich_citation_models(manager, citations, response, result, errors):
+    """Enrich the citation models with a response from eUtils, creating all of the authors at once.
 
-        manager.session.commit()  # commit in groups
+    :param pybel.manager.Manager manager:
+    :param dict[str,Citation] citations: A dictionary from PubMed identifiers to citation models
+    :param dict response: The response from PubMed E-Utils
+    :param dict[str,dict] result: A dictionary to put the JSON for the enriched citations in
+    :param set[str] errors: A set to put the PubMed identifiers that couldn't be enriched in
+    """
+    response_pmids = response['result']['uids']
 
-        # Don't want to hit that rate limit
-        time.sleep(sleep_time)
+    manager.get_or_create_authors(
+        name
+        for pmid in response_pmids
+        for name in _iter_author_names(response['result'][pmid])
+    )
 
-    log.info('retrieved %d PubMed identifiers in %.02f seconds', len(unenriched_pmids), time.time() - t)
+    for pmid in response_pmids:
+        p = response['result'][pmid]
+        citation = citations[pmid]
 
-    return result, errors
+        successful_enrichment = enrich_citation_model(manager, citation, p)
+
+        if not successful_enrichment:
+            log.warning("Error downloading PubMed identifier: %s", pmid)
+            errors.add(pmid)
+            continue
+
+        result[pmid] = citation.to_json()
+        manager.session.add(citation)
+
+
+def _iter_author_names(p):
+    """Iterate over the names of the authors in a dictionary from PubMed E-Utils.
+
+    :param dict p: The dictionary from PubMed E-Utils corresponding to d["result"][pmid]
+    :rtype: iter[str]
+    """
+    if 'error' in p:
+        return
+
+    yield p['sortfirstauthor']
+    yield p['lastauthor']
+
+    for author in p.get('authors', []):
+        yield author['name']
 
 
 def enrich_pubmed_citations(manager, graph, group_size=None, sleep_time=None):
@@ -239,6 +388,10 @@ def enrich_pubmed_citations(manager, graph, group_size=None, sleep_time=None):
             errors.add(pmid)
             continue
 
-        graph[u][v][k][CITATION].update(pmid_data[pmid])
+        # the citation might be shared with a copy of this graph, so it's replaced instead of modified
+        citation = graph[u][v][k][CITATION].copy()
+        citation.update(pmid_data[pmid])
+        graph[u][v][k][CITATION] = citation
+        graph.reindex_edge(u, v, k)
 
     return errors
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+"""Optional full-text indexes for the PyBEL database.
+
+Without these indexes, searching evidences and BEL statements is done with ``LIKE '%...%'`` queries that have to scan
+every row. They can be created with :meth:`pybel.Manager.create_full_text_index` on:
+
+- SQLite, with an external content `FTS5 <https://www.sqlite.org/fts5.html>`_ virtual table for each indexed column.
+  Triggers keep them in sync when rows are inserted, updated, or deleted, so inserting and dropping networks maintains
+  them automatically.
+- PostgreSQL, with a `GIN <https://www.postgresql.org/docs/current/textsearch-indexes.html>`_ index on the
+  ``tsvector`` of each indexed column, which PostgreSQL maintains itself.
+
+When they exist, the indexes are also used to narrow down the rows that the ``LIKE`` patterns of
+:meth:`pybel.Manager.search_edges_with_evidence`, :meth:`pybel.Manager.search_edges_with_bel`, and
+:meth:`pybel.manager.models.Node.bel_contains` are checked against, without changing their results. Only the words of a
+pattern that are known to start a word in the matching rows are looked up, so in ``%witter users%`` only "users" is
+used, and patterns like ``%witter%`` are still checked against every row. For ranked searches that only use the index,
+see :meth:`pybel.Manager.search_evidences` and the other ``search_*`` methods.
+"""
+
+import re
+
+from sqlalchemy import text
+
+from .models import EDGE_TABLE_NAME, EVIDENCE_TABLE_NAME, NODE_TABLE_NAME
+
+__all__ = [
+    'FULL_TEXT_INDEXES',
+    'supports_full_text_index',
+    'has_full_text_index',
+    'create_full_text_index',
+    'drop_full_text_index',
+    'search_full_text_index',
+    'get_full_text_filter',
+    'iter_full_text_tokens',
+]
+
+#: The indexed columns. Maps the name of each index to the table and column it covers and the PostgreSQL text search
+#: configuration used for it. Evidences are natural language, while BEL is better tokenized without stemming.
+FULL_TEXT_INDEXES = {
+    'evidence': (EVIDENCE_TABLE_NAME, 'text', 'english'),
+    'edge': (EDGE_TABLE_NAME, 'bel', 'simple'),
+    'node': (NODE_TABLE_NAME, 'bel', 'simple'),
+}
+
+_token_re = re.compile(r'\w+', re.UNICODE)
+_like_word_re = re.compile(r'[^\W_]+', re.UNICODE)
+_like_wildcards = {'%', '_'}
+
+_SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column}, content='{table}', content_rowid='id')",
+    """CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+        INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column});
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+        INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column});
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+        INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column});
+        INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column});
+    END""",
+    # index the rows that were already in the table
+    "INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+]
+
+_SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS {fts}_ai',
+    'DROP TRIGGER IF EXISTS {fts}_ad',
+    'DROP TRIGGER IF EXISTS {fts}_au',
+    'DROP TABLE IF EXISTS {fts}',
+]
+
+
+def _get_fts_name(table):
+    """Get the name of the full-text index for the given table.
+
+    :param str table: The name of the indexed table
+    :rtype: str
+    """
+    return '{}_fts'.format(table)
+
+
+def _get_format_kwargs(name):
+    """Get the names used to build the statements for the given full-text index.
+
+    :param str name: The name of the index in :data:`FULL_TEXT_INDEXES`
+    :rtype: dict[str,str]
+    """
+    table, column, config = FULL_TEXT_INDEXES[name]
+    return dict(table=table, column=column, config=config, fts=_get_fts_name(table))
+
+
+def _get_dialect_name(bind):
+    """Get the name of the SQL dialect used by an engine, connection, or session.
+
+    :rtype: str
+    """
+    if not hasattr(bind, 'dialect'):  # sessions and scoped sessions
+        bind = bind.get_bind()
+
+    return bind.dialect.name
+
+
+def supports_full_text_index(bind):
+    """Check if full-text indexes can be built for the database behind the given engine or connection.
+
+    :param bind: A SQLAlchemy engine, connection, or session
+    :rtype: bool
+    """
+    return _get_dialect_name(bind) in {'sqlite', 'postgresql'}
+
+
+def has_full_text_index(bind, name):
+    """Check if the given full-text index exists.
+
+    :param bind: A SQLAlchemy engine, connection, or session
+    :param str name: The name of the index in :data:`FULL_TEXT_INDEXES`
+    :rtype: bool
+    """
+    fts = _get_format_kwargs(name)['fts']
+    dialect = _get_dialect_name(bind)
+
+    if dialect == 'sqlite':
+        statement = text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :fts")
+    elif dialect == 'postgresql':
+        statement = text('SELECT 1 FROM pg_indexes WHERE indexname = :fts')
+    else:
+        return False
+
+    return bind.execute(statement, {'fts': fts}).scalar() is not None
+
+
+def create_full_text_index(bind):
+    """Create the full-text indexes for the evidences, edges, and nodes and index the rows already in the database.
+
+    :param bind: A SQLAlchemy engine, connection, or session
+    :raises ValueError: if the database does not support full-text indexes
+    """
+    dialect = _get_dialect_name(bind)
+
+    for name in FULL_TEXT_INDEXES:
+        kwargs = _get_format_kwargs(name)
+
+        if dialect == 'sqlite':
+            statements = _SQLITE_DDL
+        elif dialect == 'postgresql':
+            statements = [
+                "CREATE INDEX IF NOT EXISTS {fts} ON {table} USING GIN (to_tsvector('{config}', {column}))",
+            ]
+        else:
+            raise ValueError('full-text indexes are not supported for {}'.format(dialect))
+
+        for statement in statements:
+            bind.execute(text(statement.format(**kwargs)))
+
+
+def drop_full_text_index(bind):
+    """Drop the full-text indexes, if they exist.
+
+    :param bind: A SQLAlchemy engine, connection, or session
+    """
+    dialect = _get_dialect_name(bind)
+
+    for name in FULL_TEXT_INDEXES:
+        kwargs = _get_format_kwargs(name)
+
+        if dialect == 'sqlite':
+            statements = _SQLITE_DROP
+        elif dialect == 'postgresql':
+            statements = ['DROP INDEX IF EXISTS {fts}']
+        else:
+            return
+
+        for statement in statements:
+            bind.execute(text(statement.format(**kwargs)))
+
+
+def iter_full_text_tokens(query):
+    """Iterate over the words in a search string.
+
+    :param str query: A search string
+    :rtype: iter[str]
+    """
+    return iter(_token_re.findall(query))
+
+
+def _build_sqlite_match(query, prefix=False):
+    """Build an FTS5 query that matches all of the words in the query, so punctuation like in BEL is not parsed.
+
+    :param str query: A search string
+    :param bool prefix: Should the words match the beginnings of the indexed words instead of whole words?
+    :rtype: str
+    """
+    return ' '.join(
+        '"{}"{}'.format(token, '*' if prefix else '')
+        for token in iter_full_text_tokens(query)
+    )
+
+
+def _build_postgresql_prefix_query(query):
+    """Build a ``tsquery`` that matches the beginnings of all of the words in the query.
+
+    :param str query: A search string
+    :rtype: str
+    """
+    return ' & '.join(
+        '{}:*'.format(token)
+        for token in iter_full_text_tokens(query)
+    )
+
+
+def _iter_like_pattern_words(pattern):
+    """Iterate over the words of a ``LIKE`` pattern that start a word in every row matching the pattern.
+
+    Words right after a wildcard might be the end of a longer word, and words right before a ``_`` wildcard might
+    continue with any character, so they're skipped.
+
+    :param str pattern: A ``LIKE`` pattern
+    :return: Pairs of each word and whether it's a whole word, rather than the beginning of one followed by ``%``
+    :rtype: iter[tuple[str,bool]]
+    """
+    for match in _like_word_re.finditer(pattern):
+        start, end = match.span()
+
+        if 0 < start and pattern[start - 1] in _like_wildcards:
+            continue
+
+        following = pattern[end] if end < len(pattern) else None
+
+        if following == '_':
+            continue
+
+        yield match.group(), following != '%'
+
+
+def get_full_text_filter(bind, name, id_column, pattern):
+    """Build a filter for the rows that have all of the words of a ``LIKE`` pattern, if the index exists.
+
+    This doesn't replace the ``LIKE`` filter, but lets the database only check it on the rows found in the index. Every
+    row matching the pattern passes the filter, so it doesn't change the results.
+
+    :param bind: A SQLAlchemy engine, connection, or session
+    :param str name: The name of the index in :data:`FULL_TEXT_INDEXES`
+    :param id_column: The identifier column of the indexed model
+    :param str pattern: A ``LIKE`` pattern
+    :return: A filter on the identifier column, or None if the index doesn't exist or none of the words in the pattern
+     are known to start a word
+    """
+    kwargs = _get_format_kwargs(name)
+    dialect = _get_dialect_name(bind)
+
+    words = list(_iter_like_pattern_words(pattern))
+
+    # stemming changes the ends of words, so only whole words are sure to match the stems of the indexed words
+    if dialect == 'postgresql' and kwargs['config'] != 'simple':
+        words = [(word, whole) for word, whole in words if whole]
+
+    query = ' '.join(word for word, _ in words)
+
+    if not query or not has_full_text_index(bind, name):
+        return
+
+    if dialect == 'sqlite':
+        statement = 'SELECT rowid FROM {fts} WHERE {fts} MATCH :{fts}_query'
+        match = _build_sqlite_match(query, prefix=True)
+    else:
+        statement = (
+            "SELECT id FROM {table} "
+            "WHERE to_tsvector('{config}', {column}) @@ to_tsquery('{config}', :{fts}_query)"
+        )
+        match = _build_postgresql_prefix_query(query)
+
+    # the parameter is named after the index so filters on different indexes can be used in the same query
+    subquery = text(statement.format(**kwargs)).bindparams(**{'{}_query'.format(kwargs['fts']): match})
+    return id_column.in_(subquery.columns(id_column))
+
+
+def search_full_text_index(session, name, query, limit=None):
+    """Search the given full-text index.
+
+    :param session: A SQLAlchemy session
+    :param str name: The name of the index in :data:`FULL_TEXT_INDEXES`
+    :param str query: A search string. All of its words have to match.
+    :param Optional[int] limit: The maximum number of results
+    :return: Pairs of the identifier of each matching row and its rank, best first. On SQLite, the rank is the
+     BM25 score, where lower is better. On PostgreSQL, it is the ``ts_rank``, where higher is better.
+    :rtype: list[tuple[int,float]]
+    """
+    kwargs = _get_format_kwargs(name)
+    dialect = _get_dialect_name(session)
+
+    if dialect == 'sqlite':
+        match = _build_sqlite_match(query)
+        if not match:
+            return []
+
+        statement = 'SELECT rowid, bm25({fts}) AS rank FROM {fts} WHERE {fts} MATCH :query ORDER BY rank'
+        params = {'query': match}
+
+    elif dialect == 'postgresql':
+        statement = (
+            "SELECT id, ts_rank(to_tsvector('{config}', {column}), plainto_tsquery('{config}', :query)) AS rank "
+            "FROM {table} WHERE to_tsvector('{config}', {column}) @@ plainto_tsquery('{config}', :query) "
+            "ORDER BY rank DESC"
+        )
+        params = {'query': query}
+
+    else:
+        raise ValueError('full-text indexes are not supported for {}'.format(dialect))
+
+    if limit is not None:
+        statement += ' LIMIT :limit'
+        params['limit'] = limit
+
+    return [
+        (row_id, rank)
+        for row_id, rank in session.execute(text(statement.format(**kwargs)), params)
+    ]
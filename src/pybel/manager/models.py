@@ -4,10 +4,11 @@
 
 import datetime
 import hashlib
+import json
 from collections import defaultdict
 
 from sqlalchemy import (
-    Boolean, Column, Date, DateTime, ForeignKey, Integer, LargeBinary, String, Table, Text, UniqueConstraint,
+    Boolean, Column, Date, DateTime, ForeignKey, Integer, LargeBinary, String, Table, Text, UniqueConstraint, and_,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import backref, relationship
@@ -32,6 +33,7 @@ __all__ = [
     'Namespace',
     'NamespaceEntry',
     'Network',
+    'NetworkSummary',
     'Node',
     'Modification',
     'Author',
@@ -68,6 +70,7 @@ EVIDENCE_TABLE_NAME = 'pybel_evidence'
 NETWORK_TABLE_NAME = 'pybel_network'
 NETWORK_NODE_TABLE_NAME = 'pybel_network_node'
 NETWORK_EDGE_TABLE_NAME = 'pybel_network_edge'
+NETWORK_SUMMARY_TABLE_NAME = 'pybel_network_summary'
 NETWORK_NAMESPACE_TABLE_NAME = 'pybel_network_namespace'
 NETWORK_ANNOTATION_TABLE_NAME = 'pybel_network_annotation'
 
@@ -371,6 +374,46 @@ class Network(Base):
         self.blob = to_bytes(graph)
 
 
+class NetworkSummary(Base):
+    """Holds statistics about a network that are calculated when it is inserted, so they can be shown without
+    deserializing the network.
+    """
+
+    __tablename__ = NETWORK_SUMMARY_TABLE_NAME
+
+    network_id = Column(Integer, ForeignKey('{}.id'.format(NETWORK_TABLE_NAME)), primary_key=True)
+    network = relationship(Network, backref=backref('summary', uselist=False))
+
+    number_nodes = Column(Integer, nullable=False, doc='The number of nodes in the network')
+    number_edges = Column(Integer, nullable=False, doc='The number of edges in the network')
+    number_citations = Column(Integer, nullable=False, doc='The number of unique citations in the network')
+    number_warnings = Column(Integer, nullable=False, doc='The number of warnings from compiling the network')
+
+    functions = Column(Text, nullable=False, doc='JSON dictionary from functions to the number of their nodes')
+    relations = Column(Text, nullable=False, doc='JSON dictionary from relations to the number of their edges')
+    namespaces = Column(Text, nullable=False, doc='JSON dictionary from namespaces to the number of their nodes')
+    annotations = Column(Text, nullable=False, doc='JSON dictionary from annotations to the number of their edges')
+
+    def __repr__(self):
+        return '<NetworkSummary network_id={}>'.format(self.network_id)
+
+    def to_json(self):
+        """Return this summary as JSON.
+
+        :rtype: dict
+        """
+        return {
+            'number_nodes': self.number_nodes,
+            'number_edges': self.number_edges,
+            'number_citations': self.number_citations,
+            'number_warnings': self.number_warnings,
+            'functions': json.loads(self.functions),
+            'relations': json.loads(self.relations),
+            'namespaces': json.loads(self.namespaces),
+            'annotations': json.loads(self.annotations),
+        }
+
+
 node_modification = Table(
     NODE_MODIFICATION_TABLE_NAME, Base.metadata,
     Column('node_id', Integer, ForeignKey('{}.id'.format(NODE_TABLE_NAME)), primary_key=True),
@@ -496,16 +539,28 @@ class Node(Base):
     namespace_entry_id = Column(Integer, ForeignKey('{}.id'.format(NAME_TABLE_NAME)), nullable=True)
     namespace_entry = relationship(NamespaceEntry, foreign_keys=[namespace_entry_id])
 
-    modifications = relationship(Modification, secondary=node_modification, lazy='dynamic',
-                                 backref=backref('nodes', lazy='dynamic'))
+    modifications = relationship(Modification, secondary=node_modification, backref=backref('nodes', lazy='dynamic'))
 
     @classmethod
-    def bel_contains(cls, bel_query):
+    def bel_contains(cls, bel_query, bind=None):
         """Build a filter for nodes whose BEL contain the query.
 
         :type bel_query: str
+        :param bind: A SQLAlchemy engine, connection, or session. If given and the full-text index for nodes exists,
+         it's used so only the nodes it finds are checked. See :mod:`pybel.manager.fulltext`.
         """
-        return cls.bel.contains(bel_query)
+        rv = cls.bel.contains(bel_query)
+
+        if bind is None:
+            return rv
+
+        from .fulltext import get_full_text_filter
+        full_text_filter = get_full_text_filter(bind, 'node', cls.id, '%{}%'.format(bel_query))
+
+        if full_text_filter is None:
+            return rv
+
+        return and_(full_text_filter, rv)
 
     def __str__(self):
         return self.bel
@@ -896,20 +951,31 @@ class Edge(Base):
     def get_data_json(self):
         """Get the PyBEL edge data dictionary this edge represents.
 
+        :rtype: dict
+        """
+        return self._get_data_json_helper(self.get_annotations_json(), self.properties)
+
+    def _get_data_json_helper(self, annotations, properties):
+        """Build the PyBEL edge data dictionary from this edge's annotations and properties.
+
+        Allows the annotations and properties to be loaded for many edges at once, like in
+        :func:`pybel.manager.query_manager.graph_from_edges`.
+
+        :param Optional[dict[str,dict[str,bool]]] annotations: The annotations JSON of this edge
+        :param iter[Property] properties: The properties of this edge
         :rtype: dict
         """
         data = {
             RELATION: self.relation,
         }
 
-        annotations = self.get_annotations_json()
         if annotations:
             data[ANNOTATIONS] = annotations
 
         if self.evidence:
             data.update(self.evidence.to_json())
 
-        for prop in self.properties:  # FIXME this is also probably broken for translocations or mixed activity/degrad
+        for prop in properties:  # FIXME this is also probably broken for translocations or mixed activity/degrad
             if prop.side not in data:
                 data[prop.side] = prop.to_json()
             else:
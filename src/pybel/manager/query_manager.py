@@ -3,13 +3,22 @@
 """The query manager for the database."""
 
 import datetime
-from collections import Iterable
+from collections import Iterable, defaultdict
 
 from six import string_types
-from sqlalchemy import and_, func, or_
-
+from sqlalchemy import and_, func, or_, sql
+from sqlalchemy.orm import joinedload, object_session
+
+from .base_manager import iter_query_by_keyset
+from .fulltext import (
+    create_full_text_index, drop_full_text_index, get_full_text_filter, has_full_text_index, iter_full_text_tokens,
+    search_full_text_index,
+)
 from .lookup_manager import LookupManager
-from .models import Author, Citation, Edge, Evidence, Namespace, NamespaceEntry, Node
+from .models import (
+    Author, Citation, Edge, Evidence, Modification, Namespace, NamespaceEntry, Node, Property, edge_annotation,
+    edge_property, network_edge, network_node,
+)
 from ..constants import CITATION_TYPE_PUBMED
 from ..struct import BELGraph
 from ..utils import parse_datetime
@@ -19,21 +28,176 @@ __all__ = [
 ]
 
 
-def graph_from_edges(edges, **kwargs):
+#: The number of edges whose related data are loaded at the same time by :func:`graph_from_edges`. This keeps
+#: the number of parameters in each ``IN`` clause below SQLite's limit.
+EDGE_LOADING_CHUNK_SIZE = 500
+
+
+def graph_from_edges(edges, eager=True, **kwargs):
     """Build a BEL graph from edges.
 
+    By default, the nodes, evidences, citations, annotations, and properties of the edges are loaded in batches
+    instead of with several queries for each edge. Each node is only converted to its PyBEL DSL form once.
+
     :param iter[Edge] edges: An iterable of edges from the database
+    :param bool eager: Should the data for the edges be loaded in batches? Defaults to true.
     :param kwargs: Arguments to pass to :class:`pybel.BELGraph`
     :rtype: BELGraph
     """
     graph = BELGraph(**kwargs)
 
-    for edge in edges:
-        edge.insert_into_graph(graph)
+    if not eager:
+        for edge in edges:
+            edge.insert_into_graph(graph)
+
+        return graph
+
+    for edge, u, v, data in iter_edges_with_data(edges):
+        graph.add_edge(graph.add_node_from_data(u), graph.add_node_from_data(v), key=edge.sha512, **data)
 
     return graph
 
 
+def iter_edges_with_data(edges):
+    """Iterate over edges with their source and target as PyBEL DSL objects and their data dictionaries.
+
+    The data for the edges are loaded for chunks of :data:`EDGE_LOADING_CHUNK_SIZE` edges at a time, so this can be
+    used to stream over the results of :meth:`QueryManager.iter_edges`.
+
+    :param iter[Edge] edges: An iterable of edges from the database
+    :rtype: iter[tuple[Edge,pybel.dsl.BaseEntity,pybel.dsl.BaseEntity,dict]]
+    """
+    dsl_cache = {}
+
+    def _get_dsl(node):
+        """Get the DSL for a node model, only building it once."""
+        rv = dsl_cache.get(node.id)
+
+        if rv is None:
+            rv = dsl_cache[node.id] = node.to_json()
+
+        return rv
+
+    for chunk in _iter_chunks(edges, EDGE_LOADING_CHUNK_SIZE):
+        session = object_session(chunk[0])
+
+        if session is None:
+            for edge in chunk:
+                yield edge, edge.source.to_json(), edge.target.to_json(), edge.get_data_json()
+            continue
+
+        edge_ids = [edge.id for edge in chunk]
+
+        _load_edge_relationships(session, edge_ids)
+        annotations = _get_annotations_by_edge(session, edge_ids)
+        properties = _get_properties_by_edge(session, edge_ids)
+
+        for edge in chunk:
+            data = edge._get_data_json_helper(annotations.get(edge.id), properties.get(edge.id, []))
+            yield edge, _get_dsl(edge.source), _get_dsl(edge.target), data
+
+
+def _iter_chunks(iterable, size):
+    """Iterate over lists of the given size from the iterable, with the last one possibly shorter.
+
+    :param iter iterable:
+    :param int size:
+    :rtype: iter[list]
+    """
+    chunk = []
+
+    for element in iterable:
+        chunk.append(element)
+
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _load_edge_relationships(session, edge_ids):
+    """Load the nodes and provenance for the given edges into the session in one query.
+
+    The modifications of the nodes are loaded with one more query for all of the edges.
+
+    :param sqlalchemy.orm.Session session: A database session
+    :param list[int] edge_ids: Database edge identifiers
+    """
+    citation_loader = joinedload(Edge.evidence).joinedload(Evidence.citation)
+
+    options = _get_node_loaders(Edge.source) + _get_node_loaders(Edge.target) + [
+        citation_loader.joinedload(Citation.first),
+        citation_loader.joinedload(Citation.last),
+        citation_loader.selectinload(Citation.authors),
+    ]
+
+    session.query(Edge).filter(Edge.id.in_(edge_ids)).options(*options).all()
+
+
+def _get_node_loaders(relationship):
+    """Get the loader options for a node of an edge, its namespace entry, and its modifications.
+
+    :param relationship: Either :data:`Edge.source` or :data:`Edge.target`
+    :rtype: list[sqlalchemy.orm.Load]
+    """
+    node_loader = joinedload(relationship)
+    modification_loader = node_loader.selectinload(Node.modifications)
+
+    return [
+        node_loader.joinedload(Node.namespace_entry).joinedload(NamespaceEntry.namespace),
+        modification_loader.joinedload(Modification.identifier).joinedload(NamespaceEntry.namespace),
+        modification_loader.joinedload(Modification.p3_partner).joinedload(NamespaceEntry.namespace),
+        modification_loader.joinedload(Modification.p5_partner).joinedload(NamespaceEntry.namespace),
+    ]
+
+
+def _get_annotations_by_edge(session, edge_ids):
+    """Get the annotations JSON for each of the given edges in one query.
+
+    :param sqlalchemy.orm.Session session: A database session
+    :param list[int] edge_ids: Database edge identifiers
+    :rtype: dict[int,dict[str,dict[str,bool]]]
+    """
+    query = session.query(edge_annotation.c.edge_id, Namespace.keyword, NamespaceEntry.name) \
+        .select_from(edge_annotation) \
+        .join(NamespaceEntry, NamespaceEntry.id == edge_annotation.c.name_id) \
+        .join(Namespace, Namespace.id == NamespaceEntry.namespace_id) \
+        .filter(edge_annotation.c.edge_id.in_(edge_ids))
+
+    rv = defaultdict(lambda: defaultdict(dict))
+
+    for edge_id, keyword, name in query:
+        rv[edge_id][keyword][name] = True
+
+    return {
+        edge_id: dict(annotations)
+        for edge_id, annotations in rv.items()
+    }
+
+
+def _get_properties_by_edge(session, edge_ids):
+    """Get the properties for each of the given edges in one query.
+
+    :param sqlalchemy.orm.Session session: A database session
+    :param list[int] edge_ids: Database edge identifiers
+    :rtype: dict[int,list[Property]]
+    """
+    query = session.query(edge_property.c.edge_id, Property) \
+        .select_from(edge_property) \
+        .join(Property, Property.id == edge_property.c.property_id) \
+        .filter(edge_property.c.edge_id.in_(edge_ids)) \
+        .options(joinedload(Property.effect).joinedload(NamespaceEntry.namespace))
+
+    rv = defaultdict(list)
+
+    for edge_id, prop in query:
+        rv[edge_id].append(prop)
+
+    return rv
+
+
 class QueryManager(LookupManager):
     """An extension to the Manager to make queries over the database."""
 
@@ -85,6 +249,21 @@ class QueryManager(LookupManager):
 
         return q.all()
 
+    def query_nodes_by_hashes(self, node_hashes, network_ids=None):
+        """Look up several nodes by their hashes, optionally only keeping the ones contained in the given networks.
+
+        :param iter[str] node_hashes: The hashes of PyBEL nodes
+        :param Optional[iter[int]] network_ids: Only keep nodes from these networks
+        :rtype: list[Node]
+        """
+        query = self.session.query(Node).filter(Node.sha512.in_(list(node_hashes)))
+
+        if network_ids:
+            node_ids = self.session.query(network_node.c.node_id).filter(network_node.c.network_id.in_(network_ids))
+            query = query.filter(Node.id.in_(node_ids))
+
+        return query.all()
+
     def count_edges(self):
         """Count the number of edges in the database.
 
@@ -111,18 +290,144 @@ class QueryManager(LookupManager):
     def search_edges_with_evidence(self, evidence):
         """Search edges with the given evidence.
 
+        If the full-text index for evidences exists, only the evidences it finds are checked against the pattern.
+        See :mod:`pybel.manager.fulltext`.
+
         :param str evidence: A string to search evidences. Can use wildcard percent symbol (%).
         :rtype: list[Edge]
         """
-        return self.session.query(Edge).join(Evidence).filter(Evidence.text.like(evidence)).all()
+        query = self.session.query(Edge).join(Evidence).filter(Evidence.text.like(evidence))
+
+        full_text_filter = get_full_text_filter(self.session, 'evidence', Evidence.id, evidence)
+        if full_text_filter is not None:
+            query = query.filter(full_text_filter)
+
+        return query.all()
 
     def search_edges_with_bel(self, bel):
         """Search edges with given BEL.
 
-        :param str bel: A BEL string to use as a search
+        If the full-text index for edges exists, only the edges it finds are checked against the pattern. See
+        :mod:`pybel.manager.fulltext`.
+
+        :param str bel: A BEL string to use as a search. Can use wildcard percent symbol (%).
+        :rtype: list[Edge]
+        """
+        query = self.session.query(Edge).filter(Edge.bel.like(bel))
+
+        full_text_filter = get_full_text_filter(self.session, 'edge', Edge.id, bel)
+        if full_text_filter is not None:
+            query = query.filter(full_text_filter)
+
+        return query.all()
+
+    def create_full_text_index(self):
+        """Create full-text indexes for evidences and for the BEL of edges and nodes.
+
+        Once created, the indexes are kept up to date when networks are inserted and dropped and are used by
+        :meth:`search_evidences`, :meth:`search_edges_by_evidence`, :meth:`search_edges_by_bel`, and
+        :meth:`search_nodes_by_bel`. This is supported for SQLite (with FTS5) and PostgreSQL.
+
+        :raises ValueError: if the database does not support full-text indexes
+        """
+        create_full_text_index(self.session)
+        self.session.commit()
+
+    def drop_full_text_index(self):
+        """Drop the full-text indexes, if they exist."""
+        drop_full_text_index(self.session)
+        self.session.commit()
+
+    def has_full_text_index(self, name='evidence'):
+        """Check if the given full-text index exists.
+
+        :param str name: One of ``evidence``, ``edge``, or ``node``
+        :rtype: bool
+        """
+        return has_full_text_index(self.session, name)
+
+    def drop_all(self, checkfirst=True):
+        """Drop all data, tables, and databases for the PyBEL cache, including the full-text indexes."""
+        self.drop_full_text_index()
+        super(QueryManager, self).drop_all(checkfirst=checkfirst)
+
+    def _search_full_text(self, model, column, name, query, limit=None):
+        """Search the given model with a full-text index if it exists, or with ``LIKE`` otherwise.
+
+        :param model: A model class
+        :param column: The column of the model to search
+        :param str name: The name of the full-text index on the column
+        :param str query: A search string. All of its words have to match.
+        :param Optional[int] limit: The maximum number of results
+        :return: The matching instances, ranked best first if the full-text index exists
+        :rtype: list
+        """
+        if not self.has_full_text_index(name):
+            tokens = list(iter_full_text_tokens(query))
+            if not tokens:
+                return []
+
+            q = self.session.query(model).filter(and_(*(column.contains(token) for token in tokens)))
+            if limit is not None:
+                q = q.limit(limit)
+            return q.all()
+
+        ranks = search_full_text_index(self.session, name, query, limit=limit)
+        if not ranks:
+            return []
+
+        instances = {
+            instance.id: instance
+            for instance in self.session.query(model).filter(model.id.in_([row_id for row_id, _ in ranks]))
+        }
+
+        return [
+            instances[row_id]
+            for row_id, _ in ranks
+            if row_id in instances
+        ]
+
+    def search_evidences(self, query, limit=None):
+        """Search evidences by their text, best matches first.
+
+        :param str query: A search string. All of its words have to appear in the text.
+        :param Optional[int] limit: The maximum number of results
+        :rtype: list[Evidence]
+        """
+        return self._search_full_text(Evidence, Evidence.text, 'evidence', query, limit=limit)
+
+    def search_edges_by_evidence(self, query, limit=None):
+        """Search edges by the text of their evidences, best matches first.
+
+        :param str query: A search string. All of its words have to appear in the text.
+        :param Optional[int] limit: The maximum number of evidences whose edges are returned
         :rtype: list[Edge]
         """
-        return self.session.query(Edge).filter(Edge.bel.like(bel)).all()
+        evidences = self.search_evidences(query, limit=limit)
+        if not evidences:
+            return []
+
+        position = {evidence.id: i for i, evidence in enumerate(evidences)}
+        edges = self.session.query(Edge).filter(Edge.evidence_id.in_(list(position))).all()
+        return sorted(edges, key=lambda edge: (position[edge.evidence_id], edge.id))
+
+    def search_edges_by_bel(self, query, limit=None):
+        """Search edges by the words in their BEL statements, best matches first.
+
+        :param str query: A search string, like ``HGNC:AKT1 increases``
+        :param Optional[int] limit: The maximum number of results
+        :rtype: list[Edge]
+        """
+        return self._search_full_text(Edge, Edge.bel, 'edge', query, limit=limit)
+
+    def search_nodes_by_bel(self, query, limit=None):
+        """Search nodes by the words in their BEL terms, best matches first.
+
+        :param str query: A search string, like ``HGNC:AKT1``
+        :param Optional[int] limit: The maximum number of results
+        :rtype: list[Node]
+        """
+        return self._search_full_text(Node, Node.bel, 'node', query, limit=limit)
 
     def get_edges_with_annotation(self, annotation, value):
         """Search edges with the given annotation/value pair.
@@ -154,8 +459,43 @@ class QueryManager(LookupManager):
         :param str relation: The relation that should be present between source and target node.
         :rtype: list[Edge]
         """
+        query = self._build_edge_query(bel=bel, source_function=source_function, source=source,
+                                       target_function=target_function, target=target, relation=relation)
+
+        if query is None:
+            return []
+
+        return query.all()
+
+    def iter_edges(self, bel=None, source_function=None, source=None, target_function=None, target=None,
+                   relation=None, batch_size=None, offset=None, after=None):
+        """Iterate over the edges in the database matching the query without loading them all at once.
+
+        Takes the same arguments as :meth:`query_edges`, but loads ``batch_size`` edges at a time using keyset
+        pagination on their identifiers.
+
+        :param Optional[int] batch_size: The number of edges to load at a time. Defaults to 1000.
+        :param Optional[int] offset: The number of edges to skip
+        :param Optional[int] after: Only get the edges whose identifiers are larger than this one, like the last one
+         from a previous iteration
+        :rtype: iter[Edge]
+        """
+        query = self._build_edge_query(bel=bel, source_function=source_function, source=source,
+                                       target_function=target_function, target=target, relation=relation)
+
+        if query is None:
+            return iter([])
+
+        return iter_query_by_keyset(query, Edge.id, batch_size=batch_size, offset=offset, after=after)
+
+    def _build_edge_query(self, bel=None, source_function=None, source=None, target_function=None, target=None,
+                          relation=None):
+        """Build a query for edges. See :meth:`query_edges`.
+
+        :rtype: Optional[sqlalchemy.orm.query.Query]
+        """
         if bel:
-            return self.search_edges_with_bel(bel)
+            return self.session.query(Edge).filter(Edge.bel.like(bel))
 
         query = self.session.query(Edge)
 
@@ -172,7 +512,7 @@ class QueryManager(LookupManager):
             if isinstance(source, string_types):
                 source = self.query_nodes(bel=source)
                 if len(source) == 0:
-                    return []
+                    return
                 source = source[0]  # FIXME what if this matches multiple?
                 query = query.filter(Edge.source == source)
             elif isinstance(source, Node):
@@ -190,7 +530,7 @@ class QueryManager(LookupManager):
             else:
                 raise TypeError('Invalid type of {}: {}'.format(target, target.__class__.__name__))
 
-        return query.all()
+        return query
 
     def query_citations(self, type=None, reference=None, name=None, author=None, date=None, evidence_text=None):
         """Query citations in the database.
@@ -258,16 +598,31 @@ class QueryManager(LookupManager):
             Edge.target_id.in_(node_ids),
         )
 
-    def query_induction(self, nodes):
+    def _filter_edges_by_networks(self, query, network_ids=None):
+        """Restrict a query over edges to the edges contained in the given networks.
+
+        :param sqlalchemy.orm.query.Query query: A query over :class:`Edge`
+        :param Optional[iter[int]] network_ids: Database network identifiers. If none, does not restrict the query.
+        :rtype: sqlalchemy.orm.query.Query
+        """
+        if not network_ids:
+            return query
+
+        edge_ids = self.session.query(network_edge.c.edge_id).filter(network_edge.c.network_id.in_(network_ids))
+        return query.filter(Edge.id.in_(edge_ids))
+
+    def query_induction(self, nodes, network_ids=None):
         """Get all edges between any of the given nodes.
 
         :param list[Node] nodes: A list of nodes (length > 2)
+        :param Optional[iter[int]] network_ids: Only keep edges from these networks
         :rtype: list[Edge]
         """
         if len(nodes) < 2:
             raise ValueError('not enough nodes given to induce over')
 
-        return self.session.query(Edge).filter(self._edge_both_nodes(nodes)).all()
+        query = self.session.query(Edge).filter(self._edge_both_nodes(nodes))
+        return self._filter_edges_by_networks(query, network_ids=network_ids).all()
 
     @staticmethod
     def _edge_one_node(nodes):
@@ -291,10 +646,53 @@ class QueryManager(LookupManager):
             Edge.target_id.in_(node_ids),
         )
 
-    def query_neighbors(self, nodes):
+    def query_neighbors(self, nodes, network_ids=None):
         """Get all edges incident to any of the given nodes.
 
         :param list[Node] nodes: A list of nodes
+        :param Optional[iter[int]] network_ids: Only keep edges from these networks
+        :rtype: list[Edge]
+        """
+        query = self.session.query(Edge).filter(self._edge_one_node(nodes))
+        return self._filter_edges_by_networks(query, network_ids=network_ids).all()
+
+    def _edge_annotation_values(self, annotation, values):
+        """Build a sub-query for the identifiers of edges annotated with any of the values for the given annotation.
+
+        :param str annotation: The annotation keyword
+        :param iter[str] values: The values of the annotation to keep
+        """
+        if isinstance(values, string_types):
+            values = [values]
+
+        return self.session.query(edge_annotation.c.edge_id) \
+            .join(NamespaceEntry, NamespaceEntry.id == edge_annotation.c.name_id) \
+            .join(Namespace) \
+            .filter(Namespace.keyword == annotation) \
+            .filter(NamespaceEntry.name.in_(list(values)))
+
+    def query_edges_by_annotations(self, annotations, or_=None, network_ids=None):
+        """Get all edges matching the given annotation filters.
+
+        This is the database counterpart to :func:`pybel.struct.mutation.get_subgraph_by_annotations`.
+
+        :param dict[str,iter[str]] annotations: A dictionary from annotation keywords to the values to keep
+        :param boolean or_: if True any annotation should be present, if False all annotations should be present in the
+                            edge. Defaults to True.
+        :param Optional[iter[int]] network_ids: Only keep edges from these networks
         :rtype: list[Edge]
         """
-        return self.session.query(Edge).filter(self._edge_one_node(nodes)).all()
+        if not annotations:
+            return []
+
+        clauses = [
+            Edge.id.in_(self._edge_annotation_values(annotation, values))
+            for annotation, values in annotations.items()
+        ]
+
+        query = self.session.query(Edge).filter(
+            sql.or_(*clauses)
+            if (or_ is None or or_) else
+            sql.and_(*clauses)
+        )
+        return self._filter_edges_by_networks(query, network_ids=network_ids).all()
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+"""An integer-indexed, compressed sparse row (CSR) representation of a BEL graph for numeric kernels.
+
+The nodes are numbered in the order of their BEL strings and the edges in the order of their source, target, and key,
+so the numbering only depends on the contents of the graph and not on the order nodes and edges were added. The
+relations, citations, and annotations of the edges are encoded as integers against sorted lists of labels.
+
+This requires :mod:`numpy`, which can be installed with ``pip install pybel[csr]``.
+"""
+
+from ..constants import ANNOTATIONS, CITATION, CITATION_REFERENCE, CITATION_TYPE, RELATION
+
+__all__ = [
+    'CSRGraph',
+]
+
+
+class CSRGraph(object):
+    """The adjacency of a BEL graph as :mod:`numpy` arrays in compressed sparse row (CSR) format.
+
+    The successors of the node with index ``i`` are ``indices[indptr[i]:indptr[i + 1]]``, connected by the edges with
+    the same positions in the per-edge arrays. The predecessors are ``pred_indices[pred_indptr[i]:pred_indptr[i + 1]]``,
+    connected by the edges in ``pred_edges`` at the same positions.
+    """
+
+    def __init__(self, nodes, edges, indptr, indices, pred_indptr, pred_indices, pred_edges, relation_labels,
+                 relations, citation_labels, citations, annotation_labels, annotation_indptr, annotation_indices):
+        """Build a CSR graph. Use :meth:`from_graph` instead.
+
+        :param list[BaseEntity] nodes: The nodes, by index
+        :param list[tuple[BaseEntity,BaseEntity,str]] edges: The (source, target, key) triples of the edges, by index
+        :param numpy.ndarray indptr: The offsets of each node's successors in ``indices``
+        :param numpy.ndarray indices: The indices of the targets of the edges
+        :param numpy.ndarray pred_indptr: The offsets of each node's predecessors in ``pred_indices``
+        :param numpy.ndarray pred_indices: The indices of the sources of the edges, grouped by target
+        :param numpy.ndarray pred_edges: The indices of the edges, grouped by target
+        :param list[str] relation_labels: The relations
+        :param numpy.ndarray relations: The index of the relation of each edge
+        :param list[tuple[str,str]] citation_labels: The (type, reference) pairs of the citations
+        :param numpy.ndarray citations: The index of the citation of each edge, or -1 if it doesn't have one
+        :param list[tuple[str,str]] annotation_labels: The (annotation, value) pairs
+        :param numpy.ndarray annotation_indptr: The offsets of each edge's annotations in ``annotation_indices``
+        :param numpy.ndarray annotation_indices: The indices of the annotations of the edges
+        """
+        self.nodes = nodes
+        self.edges = edges
+        self.indptr = indptr
+        self.indices = indices
+        self.pred_indptr = pred_indptr
+        self.pred_indices = pred_indices
+        self.pred_edges = pred_edges
+        self.relation_labels = relation_labels
+        self.relations = relations
+        self.citation_labels = citation_labels
+        self.citations = citations
+        self.annotation_labels = annotation_labels
+        self.annotation_indptr = annotation_indptr
+        self.annotation_indices = annotation_indices
+
+        self.node_to_index = {node: i for i, node in enumerate(nodes)}
+        self.edge_to_index = {edge: i for i, edge in enumerate(edges)}
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build a CSR graph from a BEL graph.
+
+        :param pybel.BELGraph graph: A BEL graph
+        :rtype: CSRGraph
+        """
+        import numpy as np
+
+        nodes = sorted(graph, key=_get_node_sort_key)
+        node_to_index = {node: i for i, node in enumerate(nodes)}
+
+        edge_indexes = sorted(
+            (node_to_index[u], node_to_index[v], key)
+            for u, v, key in graph.edges(keys=True)
+        )
+        edges = [
+            (nodes[source], nodes[target], key)
+            for source, target, key in edge_indexes
+        ]
+
+        n_nodes, n_edges = len(nodes), len(edges)
+
+        sources = np.fromiter((source for source, _, _ in edge_indexes), dtype=np.int64, count=n_edges)
+        indices = np.fromiter((target for _, target, _ in edge_indexes), dtype=np.int64, count=n_edges)
+        indptr = _get_indptr(np.bincount(sources, minlength=n_nodes))
+
+        # a stable sort by target keeps the predecessors of each node in order of their source
+        pred_edges = np.argsort(indices, kind='mergesort')
+        pred_indices = sources[pred_edges]
+        pred_indptr = _get_indptr(np.bincount(indices, minlength=n_nodes))
+
+        data = [graph[u][v][key] for u, v, key in edges]
+
+        relation_labels = sorted({edge_data[RELATION] for edge_data in data})
+        relation_to_index = {relation: i for i, relation in enumerate(relation_labels)}
+        relations = np.fromiter(
+            (relation_to_index[edge_data[RELATION]] for edge_data in data),
+            dtype=np.int64,
+            count=n_edges,
+        )
+
+        edge_citations = [_get_citation(edge_data) for edge_data in data]
+        citation_labels = sorted({citation for citation in edge_citations if citation is not None})
+        citation_to_index = {citation: i for i, citation in enumerate(citation_labels)}
+        citations = np.fromiter(
+            (-1 if citation is None else citation_to_index[citation] for citation in edge_citations),
+            dtype=np.int64,
+            count=n_edges,
+        )
+
+        edge_annotations = [sorted(_iter_annotation_value_pairs(edge_data)) for edge_data in data]
+        annotation_labels = sorted({pair for pairs in edge_annotations for pair in pairs})
+        annotation_to_index = {pair: i for i, pair in enumerate(annotation_labels)}
+        annotation_indptr = _get_indptr(
+            np.fromiter((len(pairs) for pairs in edge_annotations), dtype=np.int64, count=n_edges)
+        )
+        annotation_indices = np.fromiter(
+            (annotation_to_index[pair] for pairs in edge_annotations for pair in pairs),
+            dtype=np.int64,
+            count=int(annotation_indptr[-1]),
+        )
+
+        return cls(
+            nodes=nodes,
+            edges=edges,
+            indptr=indptr,
+            indices=indices,
+            pred_indptr=pred_indptr,
+            pred_indices=pred_indices,
+            pred_edges=pred_edges,
+            relation_labels=relation_labels,
+            relations=relations,
+            citation_labels=citation_labels,
+            citations=citations,
+            annotation_labels=annotation_labels,
+            annotation_indptr=annotation_indptr,
+            annotation_indices=annotation_indices,
+        )
+
+    def number_of_nodes(self):
+        """Get the number of nodes.
+
+        :rtype: int
+        """
+        return len(self.nodes)
+
+    def number_of_edges(self):
+        """Get the number of edges.
+
+        :rtype: int
+        """
+        return len(self.edges)
+
+    def get_successors(self, index):
+        """Get the indices of the targets of the edges from the given node, with one entry per edge.
+
+        :param int index: The index of a node
+        :rtype: numpy.ndarray
+        """
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def get_predecessors(self, index):
+        """Get the indices of the sources of the edges to the given node, with one entry per edge.
+
+        :param int index: The index of a node
+        :rtype: numpy.ndarray
+        """
+        return self.pred_indices[self.pred_indptr[index]:self.pred_indptr[index + 1]]
+
+    def get_out_edges(self, index):
+        """Get the indices of the edges from the given node.
+
+        :param int index: The index of a node
+        :rtype: numpy.ndarray
+        """
+        import numpy as np
+        return np.arange(self.indptr[index], self.indptr[index + 1])
+
+    def get_in_edges(self, index):
+        """Get the indices of the edges to the given node.
+
+        :param int index: The index of a node
+        :rtype: numpy.ndarray
+        """
+        return self.pred_edges[self.pred_indptr[index]:self.pred_indptr[index + 1]]
+
+    def get_edge_annotations(self, edge_index):
+        """Get the indices in :attr:`annotation_labels` of the annotations of the given edge.
+
+        :param int edge_index: The index of an edge
+        :rtype: numpy.ndarray
+        """
+        return self.annotation_indices[self.annotation_indptr[edge_index]:self.annotation_indptr[edge_index + 1]]
+
+    def get_out_degrees(self):
+        """Get the out-degree of each node.
+
+        :rtype: numpy.ndarray
+        """
+        import numpy as np
+        return np.diff(self.indptr)
+
+    def get_in_degrees(self):
+        """Get the in-degree of each node.
+
+        :rtype: numpy.ndarray
+        """
+        import numpy as np
+        return np.diff(self.pred_indptr)
+
+    def get_nodes(self, indices):
+        """Get the nodes with the given indices.
+
+        :param iter[int] indices: Indices of nodes
+        :rtype: list[BaseEntity]
+        """
+        return [self.nodes[index] for index in indices]
+
+    def get_edges(self, edge_indices):
+        """Get the (source, target, key) triples of the edges with the given indices.
+
+        :param iter[int] edge_indices: Indices of edges
+        :rtype: list[tuple[BaseEntity,BaseEntity,str]]
+        """
+        return [self.edges[edge_index] for edge_index in edge_indices]
+
+
+def _get_node_sort_key(node):
+    """Get the key by which nodes are numbered.
+
+    :param BaseEntity node: A PyBEL node
+    :rtype: str
+    """
+    return node.as_bel()
+
+
+def _get_indptr(counts):
+    """Get the offsets of each row in a CSR array from the number of entries in each row.
+
+    :param numpy.ndarray counts: The number of entries in each row
+    :rtype: numpy.ndarray
+    """
+    import numpy as np
+
+    indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr
+
+
+def _get_citation(data):
+    """Get the (type, reference) pair of the citation of an edge, if it has one.
+
+    :param dict data: The data dictionary of an edge
+    :rtype: Optional[tuple[str,str]]
+    """
+    citation = data.get(CITATION)
+
+    if citation is None:
+        return
+
+    return citation[CITATION_TYPE], citation[CITATION_REFERENCE]
+
+
+def _iter_annotation_value_pairs(data):
+    """Iterate over the (annotation, value) pairs of an edge.
+
+    :param dict data: The data dictionary of an edge
+    :rtype: iter[tuple[str,str]]
+    """
+    for annotation, values in data.get(ANNOTATIONS, {}).items():
+        for value in values:
+            yield annotation, value
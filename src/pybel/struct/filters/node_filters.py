@@ -11,6 +11,10 @@ This module contains a set of default functions for filtering lists of nodes and
 
 A general use for a node predicate is to use the built-in :func:`filter` in code like
 :code:`filter(your_node_predicate, graph)`
+
+Node predicates can have a ``node_index_lookup`` attribute, which is a function that takes a
+:class:`pybel.struct.indexes.NodeAttributeIndex` and returns a set of nodes that contains all of the nodes passing the
+predicate. :func:`filter_nodes` uses it to only check those nodes instead of every node in the graph.
 """
 
 from collections import Iterable
@@ -107,11 +111,35 @@ def filter_nodes(graph, node_predicates=None):
             yield node
     else:
         concatenated_predicate = concatenate_node_predicates(node_predicates=node_predicates)
-        for node in graph:
+        for node in _iter_candidate_nodes(graph, node_predicates):
             if concatenated_predicate(graph, node):
                 yield node
 
 
+def _iter_candidate_nodes(graph, node_predicates):
+    """Iterate over the nodes that could pass the predicates, using the graph's node index if any predicate can.
+
+    :param BELGraph graph: A BEL graph
+    :param node_predicates: A node predicate or list/tuple of node predicates
+    :rtype: iter[BaseEntity]
+    """
+    if not isinstance(node_predicates, Iterable):
+        node_predicates = [node_predicates]
+
+    lookups = [
+        node_predicate.node_index_lookup
+        for node_predicate in node_predicates
+        if hasattr(node_predicate, 'node_index_lookup')
+    ]
+
+    if not lookups or not hasattr(graph, 'node_index'):
+        return iter(graph)
+
+    index = graph.node_index
+    candidates = sorted((lookup(index) for lookup in lookups), key=len)
+    return iter(candidates[0].intersection(*candidates[1:]))
+
+
 def get_nodes(graph, node_predicates=None):
     """Get the set of all nodes that pass the predicates.
 
@@ -6,11 +6,14 @@ from collections import Iterable
 
 from six import string_types
 
-from ...constants import NAME
+from ..indexes import iter_node_names
+from ...constants import NAME, NAMESPACE
 from ...dsl import BaseEntity
 
 __all__ = [
     'function_inclusion_filter_builder',
+    'namespace_inclusion_builder',
+    'name_inclusion_builder',
     'data_missing_key_builder',
     'build_node_data_search',
     'build_node_graph_data_search',
@@ -53,6 +56,8 @@ def _single_function_inclusion_filter_builder(func):
         """
         return node.function == func
 
+    function_inclusion_filter.node_index_lookup = lambda index: index.get_nodes_by_function(func)
+
     return function_inclusion_filter
 
 
@@ -77,9 +82,65 @@ def _collection_function_inclusion_builder(funcs):
         """
         return node.function in funcs
 
+    functions_inclusion_filter.node_index_lookup = lambda index: index.get_nodes_by_function(funcs)
+
     return functions_inclusion_filter
 
 
+def namespace_inclusion_builder(namespace):
+    """Build a filter that only passes on nodes in the given namespace(s).
+
+    :param namespace: A namespace or list/set/tuple of namespaces
+    :type namespace: str or iter[str]
+    :return: A node filter (graph, node) -> bool
+    :rtype: (pybel.BELGraph, BaseEntity) -> bool
+    """
+    namespaces = {namespace} if isinstance(namespace, string_types) else set(namespace)
+
+    def namespace_inclusion_filter(graph, node):
+        """Pass only for a node that is in one of the enclosed namespaces.
+
+        :param BELGraph graph: A BEL Graph
+        :param BaseEntity node: A BEL node
+        :rtype: bool
+        """
+        return node.get(NAMESPACE) in namespaces
+
+    namespace_inclusion_filter.node_index_lookup = lambda index: index.get_nodes_by_namespace(namespaces)
+
+    return namespace_inclusion_filter
+
+
+def name_inclusion_builder(namespace, name):
+    """Build a filter that only passes on nodes that reference the given name(s) from a namespace.
+
+    This includes nodes that reference the name through their fusion partners, variants, or members.
+
+    :param str namespace: A namespace
+    :param name: A name or list/set/tuple of names
+    :type name: str or iter[str]
+    :return: A node filter (graph, node) -> bool
+    :rtype: (pybel.BELGraph, BaseEntity) -> bool
+    """
+    names = {name} if isinstance(name, string_types) else set(name)
+
+    def name_inclusion_filter(graph, node):
+        """Pass only for a node that references one of the enclosed names.
+
+        :param BELGraph graph: A BEL Graph
+        :param BaseEntity node: A BEL node
+        :rtype: bool
+        """
+        return any(
+            node_namespace == namespace and node_name in names
+            for node_namespace, node_name in iter_node_names(node)
+        )
+
+    name_inclusion_filter.node_index_lookup = lambda index: index.get_nodes_by_name(namespace, names)
+
+    return name_inclusion_filter
+
+
 def data_missing_key_builder(key):
     """Build a filter that passes only on nodes that don't have the given key in their data dictionary.
 
@@ -3,10 +3,14 @@
 """Functions for getting iterables of nodes."""
 
 from .node_filters import filter_nodes
-from .node_predicate_builders import function_inclusion_filter_builder
+from .node_predicate_builders import (
+    function_inclusion_filter_builder, name_inclusion_builder, namespace_inclusion_builder,
+)
 
 __all__ = [
     'get_nodes_by_function',
+    'get_nodes_by_namespace',
+    'get_nodes_by_name',
 ]
 
 
@@ -19,3 +23,26 @@ def get_nodes_by_function(graph, func):
     :rtype: iter[tuple]
     """
     return filter_nodes(graph, function_inclusion_filter_builder(func))
+
+
+def get_nodes_by_namespace(graph, namespace):
+    """Get all nodes in the given namespace(s).
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param str or iter[str] namespace: The namespace or namespaces to filter by
+    :return: An iterable of all BEL nodes in the given namespace(s)
+    :rtype: iter[BaseEntity]
+    """
+    return filter_nodes(graph, namespace_inclusion_builder(namespace))
+
+
+def get_nodes_by_name(graph, namespace, name):
+    """Get all nodes that reference the given name(s) from a namespace.
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param str namespace: The namespace of the names
+    :param str or iter[str] name: The name or names to filter by, like gene symbols for the ``HGNC`` namespace
+    :return: An iterable of all BEL nodes referencing the given name(s)
+    :rtype: iter[BaseEntity]
+    """
+    return filter_nodes(graph, name_inclusion_builder(namespace, name))
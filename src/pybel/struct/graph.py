@@ -4,13 +4,16 @@
 
 from __future__ import print_function
 
+import hashlib
 import logging
-from copy import deepcopy
 
 import networkx as nx
 from six import string_types
 
+from .csr import CSRGraph
+from .indexes import EdgeProvenanceIndex, NodeAttributeIndex, NodeEquivalenceIndex
 from .operations import left_full_join, left_node_intersection_join, left_outer_join
+from .statistics import GraphSummary
 from ..canonicalize import edge_to_bel
 from ..constants import (
     ANNOTATIONS, ASSOCIATION, CITATION, CITATION_REFERENCE, CITATION_TYPE, CITATION_TYPE_PUBMED, DECREASES, DESCRIPTION,
@@ -38,6 +41,25 @@ RESOURCE_DICTIONARY_NAMES = (
     GRAPH_ANNOTATION_LIST,
 )
 
+#: The methods that are replaced while a graph is frozen, like in :func:`networkx.freeze`
+FROZEN_METHOD_NAMES = (
+    'add_node',
+    'add_nodes_from',
+    'remove_node',
+    'remove_nodes_from',
+    'add_edge',
+    'add_edges_from',
+    'add_weighted_edges_from',
+    'remove_edge',
+    'remove_edges_from',
+    'clear',
+)
+
+
+def _frozen(*args, **kwargs):
+    """Replace the methods that modify a graph while it's frozen, like :func:`networkx.classes.function.frozen`."""
+    raise nx.NetworkXError("Frozen graph can't be modified")
+
 
 def _clean_annotations(annotations_dict):
     """Fix the formatting of annotation dict.
@@ -58,6 +80,24 @@ def _clean_annotations(annotations_dict):
 class BELGraph(nx.MultiDiGraph):
     """An extension to :class:`networkx.MultiDiGraph` to represent BEL."""
 
+    #: An optional index of the edges' provenance, built with :meth:`build_provenance_index`. This is a class
+    #: attribute so graphs pickled before it existed can still be loaded.
+    _provenance_index = None
+
+    #: The index of the nodes by their functions, namespaces, and names. It is built the first time
+    #: :attr:`node_index` is used, then kept up to date as nodes are added and removed.
+    _node_index = None
+
+    #: The union-find index of the classes of equivalent nodes. It is built the first time :attr:`equivalence_index`
+    #: is used, then kept up to date as equivalence edges are added and removed.
+    _equivalence_index = None
+
+    #: The structures derived from the graph that are memoized while it's frozen with :meth:`freeze`
+    _frozen_cache = None
+
+    #: The fingerprint from :meth:`get_fingerprint`, which is kept until nodes or edges are added or removed
+    _fingerprint = None
+
     def __init__(self, name=None, version=None, description=None, authors=None, contact=None, license=None,
                  copyright=None, disclaimer=None, data=None, **kwargs):
         """The default constructor parses a BEL graph using the built-in :mod:`networkx` methods.
@@ -119,6 +159,37 @@ class BELGraph(nx.MultiDiGraph):
         if GRAPH_UNCACHED_NAMESPACES not in self.graph:
             self.graph[GRAPH_UNCACHED_NAMESPACES] = set()
 
+    def __getstate__(self):
+        """Get the state of this graph for pickling, without the indexes and memoized structures.
+
+        The node and equivalence indexes are built again the first time they're needed after loading, as are the
+        memoized structures of a frozen graph. If this graph has a provenance index, it's built again when loading.
+
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        state.pop('_node_index', None)
+        state.pop('_equivalence_index', None)
+
+        if '_frozen_cache' in state:  # the graph is still frozen after loading, but starts with nothing memoized
+            state['_frozen_cache'] = {}
+
+        if state.pop('_provenance_index', None) is not None:
+            state['_rebuild_provenance_index'] = True
+
+        return state
+
+    def __setstate__(self, state):
+        """Load the state of this graph from :meth:`__getstate__`.
+
+        :param dict state: The state of a pickled graph
+        """
+        rebuild_provenance_index = state.pop('_rebuild_provenance_index', False)
+        self.__dict__.update(state)
+
+        if rebuild_provenance_index:
+            self.build_provenance_index()
+
     def fresh_copy(self):
         """Create an unfilled :class:`BELGraph` as a hook for other :mod:`networkx` functions.
     
@@ -128,6 +199,40 @@ class BELGraph(nx.MultiDiGraph):
         """
         return BELGraph()
 
+    def fast_copy(self):
+        """Copy this graph, sharing as much as possible with it.
+
+        Unlike :func:`copy.deepcopy`, the nodes and the dictionaries nested in the edges' data (like citations and
+        annotations) are shared with this graph rather than copied. The adjacency, the node and edge data
+        dictionaries, the warnings, and each entry in the graph's metadata are copied, so nodes, edges, and metadata
+        can be added and removed independently. Functions in PyBEL that modify the dictionaries nested in edge data
+        or the sets in :attr:`annotation_list` replace them instead of modifying them (copy-on-write), so they don't
+        affect graphs that share them.
+
+        :rtype: BELGraph
+        """
+        rv = self.fresh_copy()
+
+        rv.graph = {
+            key: value.copy() if isinstance(value, (dict, set)) else value
+            for key, value in self.graph.items()
+        }
+        rv._warnings = list(self._warnings)
+
+        rv._node = {node: data.copy() for node, data in self._node.items()}
+        rv._succ = rv._adj = {node: {} for node in rv._node}
+        rv._pred = {node: {} for node in rv._node}
+
+        for u, neighbors in self._succ.items():
+            for v, keydict in neighbors.items():
+                # the key dictionary is shared between the successors and predecessors, like in networkx
+                rv._succ[u][v] = rv._pred[v][u] = {key: data.copy() for key, data in keydict.items()}
+
+        if self._provenance_index is not None:
+            rv.build_provenance_index()
+
+        return rv
+
     @property
     def document(self):
         """A dictionary holding the metadata from the "Document" section of the BEL script. All keys are normalized
@@ -354,6 +459,354 @@ class BELGraph(nx.MultiDiGraph):
         """
         self.warnings.append((line_number, line, exception, {} if context is None else context))
 
+    @property
+    def provenance_index(self):
+        """The index of the edges by their annotations, citations, and authors, if it has been built.
+
+        :rtype: Optional[EdgeProvenanceIndex]
+        """
+        return self._provenance_index
+
+    def build_provenance_index(self):
+        """Build an index of the edges by their annotations, citations, and authors.
+
+        Once built, the index is kept up to date as edges are added and removed and is used by functions like
+        :func:`pybel.struct.mutation.get_subgraph_by_annotations` and
+        :func:`pybel.struct.mutation.get_subgraph_by_pubmed` instead of checking every edge. If the data dictionary
+        of an edge is changed in place, it needs to be re-indexed with :meth:`reindex_edge`.
+
+        :rtype: EdgeProvenanceIndex
+        """
+        self._provenance_index = EdgeProvenanceIndex.from_graph(self)
+        return self._provenance_index
+
+    def drop_provenance_index(self):
+        """Stop maintaining the index of the edges by their annotations, citations, and authors."""
+        self._provenance_index = None
+
+    def reindex_edge(self, u, v, key):
+        """Update the provenance index for an edge whose data dictionary was changed in place, if it has been built.
+
+        :param BaseEntity u: The source node
+        :param BaseEntity v: The target node
+        :param str key: The edge's key
+        """
+        if self._provenance_index is not None:
+            self._provenance_index.add(u, v, key, self._adj[u][v][key])
+
+    def freeze(self):
+        """Make the graph immutable and memoize the structures derived from it until :meth:`thaw` is called.
+
+        While frozen, adding or removing nodes and edges raises a :class:`networkx.NetworkXError`, and the undirected
+        graph, weakly connected components, degrees, summary, and CSR adjacency are only calculated the first time
+        they're needed. Changing the data dictionaries of the nodes and edges in place isn't prevented, but won't be
+        reflected in the memoized structures either. Read-only views from
+        :func:`pybel.struct.operations.subgraph_view` are already frozen, so this does nothing to them.
+
+        :return: This graph, for chaining
+        :rtype: BELGraph
+
+        Example usage:
+
+        >>> import pybel
+        >>> universe = pybel.from_path('...').freeze()
+        """
+        if nx.is_frozen(self):
+            return self
+
+        for name in FROZEN_METHOD_NAMES:
+            setattr(self, name, _frozen)
+
+        self.frozen = True
+        self._frozen_cache = {}
+
+        return self
+
+    def thaw(self):
+        """Make a graph frozen with :meth:`freeze` mutable again and clear the memoized structures.
+
+        :return: This graph, for chaining
+        :rtype: BELGraph
+        """
+        if self._frozen_cache is None:
+            return self
+
+        for name in FROZEN_METHOD_NAMES:
+            del self.__dict__[name]
+
+        del self.__dict__['frozen']
+        del self.__dict__['_frozen_cache']
+
+        return self
+
+    def _memoize(self, key, func):
+        """Get the result of the function, which is only calculated once while the graph is frozen.
+
+        :param str key: The key of the result in the memoized structures
+        :param func: A function that takes no arguments
+        """
+        if self._frozen_cache is None:
+            return func()
+
+        if key not in self._frozen_cache:
+            self._frozen_cache[key] = func()
+
+        return self._frozen_cache[key]
+
+    def get_undirected_graph(self):
+        """Get an undirected copy of this graph with :meth:`networkx.MultiDiGraph.to_undirected`.
+
+        While this graph is frozen, the copy is memoized and also frozen.
+
+        :rtype: networkx.MultiGraph
+        """
+        if self._frozen_cache is None:
+            return self.to_undirected()
+
+        return self._memoize('undirected', lambda: nx.freeze(self.to_undirected()))
+
+    def get_weakly_connected_components(self):
+        """Get the weakly connected components of this graph, which are memoized while it's frozen.
+
+        :return: A list of the sets of nodes in each component. Don't modify them, since they might be memoized.
+        :rtype: list[set[BaseEntity]]
+        """
+        return self._memoize('components', lambda: list(nx.weakly_connected_components(self)))
+
+    def get_degrees(self):
+        """Get the degree of each node in this graph, which are memoized while it's frozen.
+
+        :return: A dictionary from each node to its degree. Don't modify it, since it might be memoized.
+        :rtype: dict[BaseEntity,int]
+        """
+        return self._memoize('degrees', lambda: dict(self.degree()))
+
+    def get_fingerprint(self):
+        """Get a hash of the nodes and edges in this graph, which is kept until nodes or edges are added or removed.
+
+        Graphs with the same nodes and edges have the same fingerprint, regardless of the order in which they were
+        added. Since the keys of edges are hashes of their data when they were added, changing the data dictionary of
+        an edge in place doesn't change the fingerprint.
+
+        Read-only views from :func:`pybel.struct.operations.subgraph_view` change with the graph they're made from, so
+        their fingerprint isn't memoized.
+
+        :rtype: str
+        """
+        if self._frozen_cache is not None:
+            return self._memoize('fingerprint', self._get_fingerprint)
+
+        if nx.is_frozen(self):
+            return self._get_fingerprint()
+
+        if self._fingerprint is None:
+            self._fingerprint = self._get_fingerprint()
+
+        return self._fingerprint
+
+    def _get_fingerprint(self):
+        """Calculate the hash of the nodes and edges in this graph.
+
+        :rtype: str
+        """
+        rv = hashlib.sha512()
+
+        for bel in sorted(str(node) for node in self):
+            rv.update('{}\n'.format(bel).encode('utf8'))
+
+        rv.update(b'\0')
+
+        for edge in sorted((str(u), str(v), str(key)) for u, v, key in self.edges(keys=True)):
+            rv.update('{}\n'.format('\t'.join(edge)).encode('utf8'))
+
+        return rv.hexdigest()
+
+    def to_csr(self):
+        """Get the adjacency of this graph as :mod:`numpy` arrays in compressed sparse row (CSR) format.
+
+        This requires :mod:`numpy`. While this graph is frozen, the result is memoized.
+
+        :rtype: pybel.struct.csr.CSRGraph
+        """
+        return self._memoize('csr', lambda: CSRGraph.from_graph(self))
+
+    @property
+    def node_index(self):
+        """The index of the nodes by their functions, namespaces, and names, which is built the first time it's used.
+
+        :rtype: NodeAttributeIndex
+        """
+        # rebuild if nodes were added or removed without going through the methods of this class
+        if self._node_index is None or len(self._node_index) != self.number_of_nodes():
+            self._node_index = NodeAttributeIndex.from_graph(self)
+
+        return self._node_index
+
+    @property
+    def equivalence_index(self):
+        """The union-find index of the classes of equivalent nodes, which is built the first time it's used.
+
+        If equivalence edges are added or removed without going through the methods of this class, use
+        :meth:`drop_equivalence_index` so it's built again.
+
+        :rtype: NodeEquivalenceIndex
+        """
+        if self._equivalence_index is None:
+            self._equivalence_index = NodeEquivalenceIndex.from_graph(self)
+
+        return self._equivalence_index
+
+    def drop_equivalence_index(self):
+        """Drop the index of the classes of equivalent nodes, so it's built again the next time it's used."""
+        self._equivalence_index = None
+
+    def add_node(self, node_for_adding, **attr):
+        """Add a node with :meth:`networkx.MultiDiGraph.add_node` and update the node index."""
+        self._fingerprint = None
+        super(BELGraph, self).add_node(node_for_adding, **attr)
+
+        if self._node_index is not None:
+            self._node_index.add(node_for_adding)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        """Add nodes with :meth:`networkx.MultiDiGraph.add_nodes_from` and update the node index."""
+        self._fingerprint = None
+
+        if self._node_index is None:
+            return super(BELGraph, self).add_nodes_from(nodes_for_adding, **attr)
+
+        nodes_for_adding = list(nodes_for_adding)
+        super(BELGraph, self).add_nodes_from(nodes_for_adding, **attr)
+
+        for node in nodes_for_adding:
+            try:
+                self._node[node]
+            except (KeyError, TypeError):  # this is a (node, attribute dictionary) pair
+                node = node[0]
+            self._node_index.add(node)
+
+    def add_edge(self, u, v, key=None, **attr):
+        """Add an edge with :meth:`networkx.MultiDiGraph.add_edge` and update the indexes.
+
+        :return: The edge's key
+        """
+        self._fingerprint = None
+        key = super(BELGraph, self).add_edge(u, v, key=key, **attr)
+
+        if self._node_index is not None:
+            self._node_index.add(u)
+            self._node_index.add(v)
+
+        if self._provenance_index is not None:
+            self._provenance_index.add(u, v, key, self._adj[u][v][key])
+
+        if self._equivalence_index is not None and attr.get(RELATION) == EQUIVALENT_TO:
+            self._equivalence_index.union(u, v)
+
+        return key
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """Add edges with :meth:`networkx.MultiDiGraph.add_edges_from` and update the indexes.
+
+        :return: The edges' keys
+        """
+        self._fingerprint = None
+
+        if self._provenance_index is None and self._equivalence_index is None:
+            return super(BELGraph, self).add_edges_from(ebunch_to_add, **attr)
+
+        ebunch_to_add = list(ebunch_to_add)
+        keys = super(BELGraph, self).add_edges_from(ebunch_to_add, **attr)
+
+        # the data dictionaries are only filled after networkx adds each edge
+        for edge, key in zip(ebunch_to_add, keys):
+            u, v = edge[0], edge[1]
+            data = self._adj[u][v][key]
+
+            if self._provenance_index is not None:
+                self._provenance_index.add(u, v, key, data)
+
+            if self._equivalence_index is not None and data.get(RELATION) == EQUIVALENT_TO:
+                self._equivalence_index.union(u, v)
+
+        return keys
+
+    def remove_edge(self, u, v, key=None):
+        """Remove an edge with :meth:`networkx.MultiDiGraph.remove_edge` and update the indexes."""
+        self._fingerprint = None
+
+        if self._provenance_index is None and self._equivalence_index is None:
+            return super(BELGraph, self).remove_edge(u, v, key=key)
+
+        keys = set(self._adj[u][v]) if self.has_edge(u, v) else set()
+        super(BELGraph, self).remove_edge(u, v, key=key)
+
+        if self.has_edge(u, v):
+            keys.difference_update(self._adj[u][v])
+
+        if self._provenance_index is not None:
+            for removed_key in keys:
+                self._provenance_index.discard(u, v, removed_key)
+
+        if self._equivalence_index is not None and self._equivalence_index.is_equivalent(u, v):
+            self._equivalence_index.rebuild_class(u, self)
+
+    def _discard_node_from_indexes(self, node):
+        """Remove a node from the node index and its in- and out-edges from the provenance index."""
+        if self._node_index is not None:
+            self._node_index.discard(node)
+
+        if self._provenance_index is not None:
+            self._discard_node_edges_from_index(node)
+
+    def _discard_node_edges_from_index(self, node):
+        """Remove the in- and out-edges of a node from the provenance index."""
+        if node not in self:
+            return
+
+        for u, v, key in list(self.in_edges(node, keys=True)) + list(self.out_edges(node, keys=True)):
+            self._provenance_index.discard(u, v, key)
+
+    def remove_node(self, n):
+        """Remove a node with :meth:`networkx.MultiDiGraph.remove_node` and update the indexes."""
+        self._fingerprint = None
+        self._discard_node_from_indexes(n)
+        super(BELGraph, self).remove_node(n)
+
+        if self._equivalence_index is not None:
+            self._equivalence_index.rebuild_class(n, self)
+
+    def remove_nodes_from(self, nodes):
+        """Remove nodes with :meth:`networkx.MultiDiGraph.remove_nodes_from` and update the indexes."""
+        self._fingerprint = None
+
+        if self._node_index is None and self._provenance_index is None and self._equivalence_index is None:
+            return super(BELGraph, self).remove_nodes_from(nodes)
+
+        nodes = list(nodes)
+        for node in nodes:
+            self._discard_node_from_indexes(node)
+
+        super(BELGraph, self).remove_nodes_from(nodes)
+
+        if self._equivalence_index is not None:
+            for node in nodes:
+                self._equivalence_index.rebuild_class(node, self)
+
+    def clear(self):
+        """Remove all nodes and edges with :meth:`networkx.MultiDiGraph.clear` and clear the indexes."""
+        self._fingerprint = None
+        super(BELGraph, self).clear()
+
+        if self._node_index is not None:
+            self._node_index.clear()
+
+        if self._provenance_index is not None:
+            self._provenance_index.clear()
+
+        if self._equivalence_index is not None:
+            self._equivalence_index.clear()
+
     def _help_add_edge(self, u, v, attr):
         """Help add a pre-built edge.
 
@@ -776,7 +1229,7 @@ class BELGraph(nx.MultiDiGraph):
         self._set_node_attr(node, DESCRIPTION, description)
 
     def __add__(self, other):
-        """Creates a deep copy of this graph and full joins another graph with it using
+        """Creates a copy of this graph with :meth:`fast_copy` and full joins another graph with it using
         :func:`pybel.struct.left_full_join`.
 
         :param BELGraph other: Another BEL graph
@@ -792,7 +1245,7 @@ class BELGraph(nx.MultiDiGraph):
         if not isinstance(other, BELGraph):
             raise TypeError('{} is not a {}'.format(other, self.__class__.__name__))
 
-        result = deepcopy(self)
+        result = self.fast_copy()
         left_full_join(result, other)
         return result
 
@@ -816,7 +1269,7 @@ class BELGraph(nx.MultiDiGraph):
         return self
 
     def __and__(self, other):
-        """Creates a deep copy of this graph and outer joins another graph with it using
+        """Creates a copy of this graph with :meth:`fast_copy` and outer joins another graph with it using
         :func:`pybel.struct.left_outer_join`.
 
         :param BELGraph other: Another BEL graph
@@ -832,7 +1285,7 @@ class BELGraph(nx.MultiDiGraph):
         if not isinstance(other, BELGraph):
             raise TypeError('{} is not a {}'.format(other, self.__class__.__name__))
 
-        result = deepcopy(self)
+        result = self.fast_copy()
         left_outer_join(result, other)
         return result
 
@@ -893,31 +1346,6 @@ class BELGraph(nx.MultiDiGraph):
         """
         return edge_to_bel(u, v, data=data, sep=sep)
 
-    def _has_no_equivalent_edge(self, u, v):
-        return not any(
-            EQUIVALENT_TO == data[RELATION]
-            for data in self[u][v].values()
-        )
-
-    def _equivalent_node_iterator_helper(self, node, visited):
-        """Iterate over nodes and their data that are equal to the given node, starting with the original.
-
-        :param BaseEntity node: A PyBEL node
-        :rtype: iter[BaseEntity]
-        """
-        for v in self[node]:
-            if v in visited:
-                continue
-
-            if self._has_no_equivalent_edge(node, v):
-                continue
-
-            yield v
-            visited.add(v)
-
-            for w in self._equivalent_node_iterator_helper(v, visited):
-                yield w
-
     def iter_equivalent_nodes(self, node):
         """Iterate over nodes that are equivalent to the given node, including the original,
 
@@ -926,20 +1354,28 @@ class BELGraph(nx.MultiDiGraph):
         """
         yield node
 
-        for n in self._equivalent_node_iterator_helper(node, {node}):
-            yield n
+        for n in self.equivalence_index.get_equivalent_nodes(node):
+            if n != node:
+                yield n
 
     def get_equivalent_nodes(self, node):
-        """Get a set of equivalent nodes to this node, excluding the given node.
+        """Get a set of equivalent nodes to this node, including the given node.
+
+        Nodes are equivalent if they're connected by a chain of equivalence edges, in either direction. This is looked
+        up in :attr:`equivalence_index`.
 
         :param node: A PyBEL node
         :type node: BaseEntity
         :rtype: set[BaseEntity]
         """
-        if isinstance(node, BaseEntity):
-            return set(self.iter_equivalent_nodes(node))
+        return self.equivalence_index.get_equivalent_nodes(node)
+
+    def get_equivalence_classes(self):
+        """Get the classes of nodes that are equivalent to each other, for all nodes that have equivalence edges.
 
-        return set(self.iter_equivalent_nodes(node))
+        :rtype: list[set[BaseEntity]]
+        """
+        return list(self.equivalence_index.iter_equivalence_classes())
 
     def _node_has_namespace_helper(self, node, namespace):
         """Check that the node has namespace information.
@@ -970,19 +1406,27 @@ class BELGraph(nx.MultiDiGraph):
 
         :rtype: list[tuple[str,float]]
         """
-        number_nodes = self.number_of_nodes()
+        summary = self.get_summary()
+
         result = [
-            ('Number of Nodes', number_nodes),
-            ('Number of Edges', self.number_of_edges()),
-            ('Network Density', '{:.2E}'.format(nx.density(self))),
-            ('Number of Components', nx.number_weakly_connected_components(self)),
+            ('Number of Nodes', summary.number_of_nodes),
+            ('Number of Edges', summary.number_of_edges),
+            ('Network Density', '{:.2E}'.format(summary.density)),
+            ('Number of Components', summary.number_of_components),
         ]
 
-        if self.warnings:
-            result.append(('Number of Warnings', len(self.warnings)))
+        if summary.number_of_warnings:
+            result.append(('Number of Warnings', summary.number_of_warnings))
 
         return result
 
+    def get_summary(self):
+        """Calculate the statistics about this graph in a single pass. The result is memoized while it's frozen.
+
+        :rtype: pybel.struct.statistics.GraphSummary
+        """
+        return self._memoize('summary', lambda: GraphSummary(self))
+
     def summary_dict(self):
         """Return a dictionary that summarizes the graph.
 
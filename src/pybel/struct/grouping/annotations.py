@@ -33,6 +33,19 @@ def _get_subgraphs_by_annotation_disregard_undefined(graph, annotation):
     return dict(result)
 
 
+def _get_subgraphs_by_annotation_indexed(graph, annotation):
+    result = {}
+
+    for value, edges in graph.provenance_index.annotations.get(annotation, {}).items():
+        result[value] = subgraph = graph.fresh_copy()
+        subgraph.add_edges_from(
+            (source, target, key, graph[source][target][key])
+            for source, target, key in edges
+        )
+
+    return result
+
+
 def _get_subgraphs_by_annotation_keep_undefined(graph, annotation, sentinel):
     result = defaultdict(graph.fresh_copy)
 
@@ -55,9 +68,14 @@ def get_subgraphs_by_annotation(graph, annotation, sentinel=None):
     :param str annotation: The annotation to group by
     :param Optional[str] sentinel: The value to stick unannotated edges into. If none, does not keep undefined.
     :rtype: dict[str,pybel.BELGraph]
+
+    If no sentinel is given and the graph has a provenance index (see :meth:`pybel.BELGraph.build_provenance_index`),
+    it's used instead of checking each edge.
     """
     if sentinel is not None:
         subgraphs = _get_subgraphs_by_annotation_keep_undefined(graph, annotation, sentinel)
+    elif graph.provenance_index is not None:
+        subgraphs = _get_subgraphs_by_annotation_indexed(graph, annotation)
     else:
         subgraphs = _get_subgraphs_by_annotation_disregard_undefined(graph, annotation)
 
@@ -0,0 +1,586 @@
+# -*- coding: utf-8 -*-
+
+"""Indexes that are kept up to date as a :class:`pybel.BELGraph` is modified.
+
+The :class:`EdgeProvenanceIndex` is opt-in, since keeping it up to date makes adding and removing edges slower. It
+only reflects edge data dictionaries as they were when the edge was added, so edges whose data are changed in place
+have to be re-indexed with :meth:`pybel.BELGraph.reindex_edge`.
+
+The :class:`NodeAttributeIndex` is built the first time it's needed. Since nodes are immutable, it's cheap to keep
+up to date as nodes are added and removed.
+
+The :class:`NodeEquivalenceIndex` is also built the first time it's needed and is kept up to date as equivalence edges
+are added and removed.
+"""
+
+from collections import Counter
+
+from six import string_types
+
+from ..constants import (
+    ANNOTATIONS, CITATION, CITATION_AUTHORS, CITATION_REFERENCE, CITATION_TYPE, CITATION_TYPE_PUBMED, FUSION,
+    EQUIVALENT_TO, IDENTIFIER, MEMBERS, NAME, NAMESPACE, PARTNER_3P, PARTNER_5P, RELATION, VARIANTS,
+)
+from ..dsl import BaseEntity
+
+__all__ = [
+    'EdgeProvenanceIndex',
+    'NodeAttributeIndex',
+    'NodeEquivalenceIndex',
+    'iter_node_names',
+]
+
+_ANNOTATION = 'annotation'
+_CITATION = 'citation'
+_AUTHOR = 'author'
+
+
+class EdgeProvenanceIndex(object):
+    """An index from the annotations, citations, and citation authors of a BEL graph's edges to their edges.
+
+    Edges are represented by (source, target, key) triples.
+    """
+
+    def __init__(self):
+        #: Maps annotation keyword to annotation value to edges
+        self.annotations = {}
+        #: Maps (citation type, citation reference) pairs to edges
+        self.citations = {}
+        #: Maps author names to edges
+        self.authors = {}
+        #: Maps each indexed edge to its entries, so it can be removed without its data dictionary
+        self._entries = {}
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build an index over all of the edges in a BEL graph.
+
+        :param pybel.BELGraph graph: A BEL graph
+        :rtype: EdgeProvenanceIndex
+        """
+        rv = cls()
+
+        for u, v, key, data in graph.edges(keys=True, data=True):
+            rv.add(u, v, key, data)
+
+        return rv
+
+    def __len__(self):
+        """Count the number of edges that have an annotation or a citation."""
+        return len(self._entries)
+
+    def __contains__(self, edge):
+        """Check if the (source, target, key) triple is in the index."""
+        return edge in self._entries
+
+    def _get_set(self, entry):
+        """Get the set of edges for an entry, creating it if it doesn't exist yet."""
+        if entry[0] == _ANNOTATION:
+            return self.annotations.setdefault(entry[1], {}).setdefault(entry[2], set())
+
+        if entry[0] == _CITATION:
+            return self.citations.setdefault(entry[1:], set())
+
+        return self.authors.setdefault(entry[1], set())
+
+    @staticmethod
+    def _iter_entries(data):
+        """Iterate over the entries for an edge data dictionary."""
+        for annotation, values in data.get(ANNOTATIONS, {}).items():
+            for value in values:
+                yield _ANNOTATION, annotation, value
+
+        citation = data.get(CITATION)
+        if citation is None:
+            return
+
+        yield _CITATION, citation.get(CITATION_TYPE), citation.get(CITATION_REFERENCE)
+
+        for author in citation.get(CITATION_AUTHORS) or ():
+            yield _AUTHOR, author
+
+    def add(self, u, v, key, data):
+        """Index an edge, replacing its old entries if it was already indexed.
+
+        :param BaseEntity u: The source node
+        :param BaseEntity v: The target node
+        :param str key: The edge's key
+        :param dict data: The edge's data dictionary
+        """
+        edge = u, v, key
+        self.discard(u, v, key)
+
+        entries = list(self._iter_entries(data))
+        if not entries:
+            return
+
+        for entry in entries:
+            self._get_set(entry).add(edge)
+
+        self._entries[edge] = entries
+
+    def discard(self, u, v, key):
+        """Remove an edge from the index, if it's there.
+
+        :param BaseEntity u: The source node
+        :param BaseEntity v: The target node
+        :param str key: The edge's key
+        """
+        edge = u, v, key
+        entries = self._entries.pop(edge, None)
+
+        if entries is None:
+            return
+
+        for entry in entries:
+            edges = self._get_set(entry)
+            edges.discard(edge)
+
+            if edges:
+                continue
+
+            if entry[0] == _ANNOTATION:
+                values = self.annotations[entry[1]]
+                del values[entry[2]]
+                if not values:
+                    del self.annotations[entry[1]]
+            elif entry[0] == _CITATION:
+                del self.citations[entry[1:]]
+            else:
+                del self.authors[entry[1]]
+
+    def clear(self):
+        """Remove all edges from the index."""
+        self.annotations.clear()
+        self.citations.clear()
+        self.authors.clear()
+        self._entries.clear()
+
+    def get_edges_by_annotation(self, annotation, value):
+        """Get the edges with the given annotation and value.
+
+        :param str annotation: An annotation keyword
+        :param str value: An annotation value
+        :rtype: set[tuple[BaseEntity,BaseEntity,str]]
+        """
+        return set(self.annotations.get(annotation, {}).get(value, ()))
+
+    def get_edges_by_annotations(self, annotations, or_=None):
+        """Get the edges matching an annotation query dictionary.
+
+        For non-empty queries, this gives the same edges as filtering with
+        :func:`pybel.struct.filters.build_annotation_dict_any_filter` or
+        :func:`pybel.struct.filters.build_annotation_dict_all_filter`. An empty query matches no edges.
+
+        :param dict[str,iter[str]] annotations: Annotation query dictionary
+        :param Optional[bool] or_: If true or none, get the edges that match any of the (annotation, value) pairs.
+         If false, get the edges that match all of them.
+        :rtype: set[tuple[BaseEntity,BaseEntity,str]]
+        """
+        pairs = [
+            (annotation, value)
+            for annotation, values in annotations.items()
+            for value in values
+        ]
+
+        if or_ is None or or_:
+            rv = set()
+            for annotation, value in pairs:
+                rv.update(self.annotations.get(annotation, {}).get(value, ()))
+            return rv
+
+        if not pairs:
+            return set()
+
+        edge_sets = sorted(
+            (self.annotations.get(annotation, {}).get(value, set()) for annotation, value in pairs),
+            key=len,
+        )
+
+        return set(edge_sets[0]).intersection(*edge_sets[1:])
+
+    def get_edges_by_citations(self, references, type=None):
+        """Get the edges with any of the given citations.
+
+        :param iter[str] references: Citation references
+        :param Optional[str] type: The citation type. Defaults to :data:`pybel.constants.CITATION_TYPE_PUBMED`.
+        :rtype: set[tuple[BaseEntity,BaseEntity,str]]
+        """
+        if type is None:
+            type = CITATION_TYPE_PUBMED
+
+        rv = set()
+        for reference in references:
+            rv.update(self.citations.get((type, reference), ()))
+        return rv
+
+    def get_edges_by_authors(self, authors):
+        """Get the edges whose citations were written by any of the given authors.
+
+        :param iter[str] authors: Author names
+        :rtype: set[tuple[BaseEntity,BaseEntity,str]]
+        """
+        rv = set()
+        for author in authors:
+            rv.update(self.authors.get(author, ()))
+        return rv
+
+    def iter_annotation_values(self, annotation):
+        """Iterate over the values for the given annotation, with a duplicate for each edge that has them.
+
+        :param str annotation: An annotation keyword
+        :rtype: iter[str]
+        """
+        for value, edges in self.annotations.get(annotation, {}).items():
+            for _ in range(len(edges)):
+                yield value
+
+    def iter_annotation_value_pairs(self):
+        """Iterate over the (annotation, value) pairs, with a duplicate for each edge that has them.
+
+        :rtype: iter[tuple[str,str]]
+        """
+        for annotation, values in self.annotations.items():
+            for value, edges in values.items():
+                for _ in range(len(edges)):
+                    yield annotation, value
+
+
+def _iter_node_data_names(data):
+    """Iterate over the (namespace, name) pairs in a node data dictionary, not including its members."""
+    if NAMESPACE in data:
+        yield data[NAMESPACE], data[NAME]
+
+    elif FUSION in data:
+        yield data[FUSION][PARTNER_3P][NAMESPACE], data[FUSION][PARTNER_3P][NAME]
+        yield data[FUSION][PARTNER_5P][NAMESPACE], data[FUSION][PARTNER_5P][NAME]
+
+    if VARIANTS in data:
+        for variant in data[VARIANTS]:
+            identifier = variant.get(IDENTIFIER)
+            if identifier is not None and NAMESPACE in identifier and NAME in identifier:
+                yield identifier[NAMESPACE], identifier[NAME]
+
+
+def iter_node_names(node):
+    """Iterate over the (namespace, name) pairs referenced by a node, its fusion partners, variants, and members.
+
+    :param BaseEntity node: A BEL node
+    :rtype: iter[tuple[str,str]]
+    """
+    for pair in _iter_node_data_names(node):
+        yield pair
+
+    for member in node.get(MEMBERS, []):
+        for pair in _iter_node_data_names(member):
+            yield pair
+
+
+class NodeAttributeIndex(object):
+    """An index from the functions, namespaces, and names of a BEL graph's nodes to the nodes."""
+
+    def __init__(self):
+        #: Maps functions to nodes
+        self.functions = {}
+        #: Maps namespaces to the nodes in them
+        self.namespaces = {}
+        #: Maps namespace to name to the nodes that reference it, including through fusions, variants, and members
+        self.names = {}
+        #: The indexed nodes
+        self._nodes = set()
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build an index over all of the nodes in a BEL graph.
+
+        :param pybel.BELGraph graph: A BEL graph
+        :rtype: NodeAttributeIndex
+        """
+        rv = cls()
+
+        for node in graph:
+            rv.add(node)
+
+        return rv
+
+    def __len__(self):
+        """Count the number of indexed nodes."""
+        return len(self._nodes)
+
+    def __contains__(self, node):
+        """Check if the node is in the index."""
+        return node in self._nodes
+
+    @staticmethod
+    def _iter_entries(node):
+        """Iterate over the dictionaries and keys under which a node is indexed."""
+        if not isinstance(node, BaseEntity):
+            return
+
+        yield 'functions', node.function
+
+        namespace = node.get(NAMESPACE)
+        if namespace is not None:
+            yield 'namespaces', namespace
+
+        for namespace, name in iter_node_names(node):
+            yield 'names', (namespace, name)
+
+    def _get_set(self, attr, key, create=False):
+        """Get the set of nodes for the given entry."""
+        d = getattr(self, attr)
+
+        if attr == 'names':
+            namespace, key = key
+            d = d.setdefault(namespace, {}) if create else d.get(namespace, {})
+
+        return d.setdefault(key, set()) if create else d.get(key, set())
+
+    def add(self, node):
+        """Index a node, if it's not already indexed.
+
+        :param BaseEntity node: A BEL node
+        """
+        if node in self._nodes:
+            return
+
+        self._nodes.add(node)
+
+        for attr, key in self._iter_entries(node):
+            self._get_set(attr, key, create=True).add(node)
+
+    def discard(self, node):
+        """Remove a node from the index, if it's there.
+
+        :param BaseEntity node: A BEL node
+        """
+        if node not in self._nodes:
+            return
+
+        self._nodes.remove(node)
+
+        for attr, key in self._iter_entries(node):
+            nodes = self._get_set(attr, key)
+            nodes.discard(node)
+
+            if nodes:
+                continue
+
+            if attr == 'names':
+                names = self.names.get(key[0])
+                if names is not None:
+                    names.pop(key[1], None)
+                    if not names:
+                        del self.names[key[0]]
+            else:
+                getattr(self, attr).pop(key, None)
+
+    def clear(self):
+        """Remove all nodes from the index."""
+        self.functions.clear()
+        self.namespaces.clear()
+        self.names.clear()
+        self._nodes.clear()
+
+    def get_nodes_by_function(self, func):
+        """Get the nodes with the given function(s).
+
+        :param func: A BEL function or iterable of BEL functions
+        :type func: str or iter[str]
+        :rtype: set[BaseEntity]
+        """
+        if isinstance(func, string_types):
+            return set(self.functions.get(func, ()))
+
+        rv = set()
+        for f in func:
+            rv.update(self.functions.get(f, ()))
+        return rv
+
+    def get_nodes_by_namespace(self, namespace):
+        """Get the nodes in the given namespace(s).
+
+        :param namespace: A namespace or iterable of namespaces
+        :type namespace: str or iter[str]
+        :rtype: set[BaseEntity]
+        """
+        if isinstance(namespace, string_types):
+            return set(self.namespaces.get(namespace, ()))
+
+        rv = set()
+        for ns in namespace:
+            rv.update(self.namespaces.get(ns, ()))
+        return rv
+
+    def get_nodes_by_name(self, namespace, name):
+        """Get the nodes that reference the given name(s) in a namespace.
+
+        :param str namespace: A namespace
+        :param name: A name or iterable of names
+        :type name: str or iter[str]
+        :rtype: set[BaseEntity]
+        """
+        names = self.names.get(namespace, {})
+
+        if isinstance(name, string_types):
+            return set(names.get(name, ()))
+
+        rv = set()
+        for n in name:
+            rv.update(names.get(n, ()))
+        return rv
+
+    def get_names_by_namespace(self, namespace):
+        """Get the names in the given namespace that are referenced by nodes.
+
+        :param str namespace: A namespace
+        :rtype: set[str]
+        """
+        return set(self.names.get(namespace, ()))
+
+    def count_functions(self):
+        """Count the number of nodes with each function.
+
+        :rtype: collections.Counter
+        """
+        return Counter({
+            func: len(nodes)
+            for func, nodes in self.functions.items()
+        })
+
+
+class NodeEquivalenceIndex(object):
+    """A union-find (disjoint set) index of the classes of nodes that are connected by equivalence edges.
+
+    Equivalence is treated as symmetric and transitive, so nodes connected by chains of equivalence edges in either
+    direction are in the same class. Nodes without equivalence edges aren't stored.
+    """
+
+    def __init__(self):
+        #: Maps nodes to their parents in the disjoint set forest. Roots map to themselves.
+        self.parents = {}
+        #: Maps the root of each class to the set of nodes in it
+        self.members = {}
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build an index over all of the equivalence edges in a BEL graph.
+
+        :param pybel.BELGraph graph: A BEL graph
+        :rtype: NodeEquivalenceIndex
+        """
+        rv = cls()
+
+        for u, v, data in graph.edges(data=True):
+            if data.get(RELATION) == EQUIVALENT_TO:
+                rv.union(u, v)
+
+        return rv
+
+    def __len__(self):
+        """Count the number of nodes that are equivalent to at least one other node."""
+        return len(self.parents)
+
+    def __contains__(self, node):
+        """Check if the node is equivalent to at least one other node."""
+        return node in self.parents
+
+    def find(self, node):
+        """Get the representative node of the class of the given node.
+
+        :param BaseEntity node: A BEL node
+        :rtype: BaseEntity
+        """
+        if node not in self.parents:
+            return node
+
+        root = node
+        while self.parents[root] != root:
+            root = self.parents[root]
+
+        # compress the path so later look-ups are constant time
+        while self.parents[node] != root:
+            self.parents[node], node = root, self.parents[node]
+
+        return root
+
+    def union(self, u, v):
+        """Record that two nodes are equivalent, merging their classes.
+
+        :param BaseEntity u: A BEL node
+        :param BaseEntity v: A BEL node
+        """
+        u_root, v_root = self.find(u), self.find(v)
+
+        for root in (u_root, v_root):
+            if root not in self.parents:
+                self.parents[root] = root
+                self.members[root] = {root}
+
+        if u_root == v_root:
+            return
+
+        # the smaller class is merged into the bigger one
+        if len(self.members[u_root]) < len(self.members[v_root]):
+            u_root, v_root = v_root, u_root
+
+        self.parents[v_root] = u_root
+        self.members[u_root].update(self.members.pop(v_root))
+
+    def is_equivalent(self, u, v):
+        """Check if two nodes are in the same class.
+
+        :param BaseEntity u: A BEL node
+        :param BaseEntity v: A BEL node
+        :rtype: bool
+        """
+        return u == v or (u in self.parents and self.find(u) == self.find(v))
+
+    def get_equivalent_nodes(self, node):
+        """Get the nodes in the same class as the given node, including itself.
+
+        :param BaseEntity node: A BEL node
+        :rtype: set[BaseEntity]
+        """
+        if node not in self.parents:
+            return {node}
+
+        return set(self.members[self.find(node)])
+
+    def iter_equivalence_classes(self):
+        """Iterate over the classes of nodes that are equivalent to at least one other node.
+
+        :rtype: iter[set[BaseEntity]]
+        """
+        for members in self.members.values():
+            yield set(members)
+
+    def rebuild_class(self, node, graph):
+        """Split the class of the given node again after equivalence edges or nodes were removed from the graph.
+
+        Disjoint sets can't be split, so each node in the class is removed and the remaining equivalence edges between
+        them are added again.
+
+        :param BaseEntity node: A BEL node
+        :param pybel.BELGraph graph: The graph the index is for
+        """
+        if node not in self.parents:
+            return
+
+        members = self.members.pop(self.find(node))
+
+        for member in members:
+            del self.parents[member]
+
+        for member in members:
+            if member not in graph:
+                continue
+
+            for v, edges in graph._succ[member].items():
+                if any(data.get(RELATION) == EQUIVALENT_TO for data in edges.values()):
+                    self.union(member, v)
+
+    def clear(self):
+        """Remove all nodes from the index."""
+        self.parents.clear()
+        self.members.clear()
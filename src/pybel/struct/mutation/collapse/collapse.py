@@ -4,7 +4,7 @@
 
 from ...filters import filter_edges
 from ...filters.edge_predicate_builders import build_relation_predicate
-from ...pipeline import in_place_transformation
+from ...pipeline import in_place_transformation, register_pure
 from ....constants import HAS_VARIANT
 
 __all__ = [
@@ -24,6 +24,7 @@ def _remove_self_edges(graph):
     graph.remove_edges_from(self_edges)
 
 
+@register_pure
 @in_place_transformation
 def collapse_pair(graph, survivor, victim):
     """Rewire all edges from the synonymous node to the survivor node, then deletes the synonymous node.
@@ -51,6 +52,7 @@ def collapse_pair(graph, survivor, victim):
 
 # TODO what happens when collapsing is not consistent? Need to build intermediate mappings and test their consistency.
 
+@register_pure
 @in_place_transformation
 def collapse_nodes(graph, survivor_mapping):
     """Collapse all nodes in values to the key nodes, in place.
@@ -67,6 +69,7 @@ def collapse_nodes(graph, survivor_mapping):
     _remove_self_edges(graph)
 
 
+@register_pure
 @in_place_transformation
 def collapse_all_variants(graph):
     """Collapse all genes', RNAs', miRNAs', and proteins' variants to their parents.
@@ -4,7 +4,7 @@ from collections import defaultdict
 
 from .collapse import collapse_nodes
 from ..inference import enrich_protein_and_rna_origins
-from ...pipeline.decorators import in_place_transformation, register_deprecated
+from ...pipeline.decorators import in_place_transformation, register_deprecated, register_pure
 from ....constants import RELATION, TRANSCRIBED_TO, TRANSLATED_TO
 
 __all__ = [
@@ -41,6 +41,7 @@ def _build_collapse_to_gene_dict(graph):
 
 
 @register_deprecated('collapse_by_central_dogma')
+@register_pure
 @in_place_transformation
 def collapse_to_genes(graph):
     """Collapse all protein, RNA, and miRNA nodes to their corresponding gene nodes.
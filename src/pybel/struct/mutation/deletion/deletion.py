@@ -2,11 +2,11 @@
 
 """Functions for deleting nodes and edges in networks."""
 
-from ...filters.edge_filters import filter_edges
+from ...filters.edge_filters import and_edge_predicates, filter_edges
 from ...filters.edge_predicates import is_associative_relation
-from ...filters.node_filters import filter_nodes
+from ...filters.node_filters import concatenate_node_predicates, filter_nodes
 from ...filters.node_predicate_builders import function_inclusion_filter_builder
-from ...pipeline import in_place_transformation
+from ...pipeline import in_place_transformation, register_edge_filter, register_node_filter, register_pure
 from ....constants import BIOPROCESS, PATHOLOGY
 
 __all__ = [
@@ -15,9 +15,12 @@ __all__ = [
     'remove_associations',
     'remove_pathologies',
     'remove_biological_processes',
+    'remove_filtered_nodes_and_edges',
 ]
 
 
+@register_edge_filter()
+@register_pure
 @in_place_transformation
 def remove_filtered_edges(graph, edge_predicates=None):
     """Remove edges passing the given edge predicates.
@@ -31,6 +34,8 @@ def remove_filtered_edges(graph, edge_predicates=None):
     graph.remove_edges_from(edges)
 
 
+@register_node_filter()
+@register_pure
 @in_place_transformation
 def remove_filtered_nodes(graph, node_predicates=None):
     """Remove nodes passing the given node predicates.
@@ -42,6 +47,8 @@ def remove_filtered_nodes(graph, node_predicates=None):
     graph.remove_nodes_from(nodes)
 
 
+@register_edge_filter(is_associative_relation)
+@register_pure
 @in_place_transformation
 def remove_associations(graph):
     """Remove all associative relationships from the graph.
@@ -51,6 +58,8 @@ def remove_associations(graph):
     remove_filtered_edges(graph, is_associative_relation)
 
 
+@register_node_filter(function_inclusion_filter_builder(PATHOLOGY))
+@register_pure
 @in_place_transformation
 def remove_pathologies(graph):
     """Remove pathology nodes from the graph.
@@ -60,6 +69,8 @@ def remove_pathologies(graph):
     remove_filtered_nodes(graph, node_predicates=function_inclusion_filter_builder(PATHOLOGY))
 
 
+@register_node_filter(function_inclusion_filter_builder(BIOPROCESS))
+@register_pure
 @in_place_transformation
 def remove_biological_processes(graph):
     """Remove biological process nodes from the graph.
@@ -67,3 +78,53 @@ def remove_biological_processes(graph):
     :param pybel.BELGraph graph: A BEL graph
     """
     remove_filtered_nodes(graph, node_predicates=function_inclusion_filter_builder(BIOPROCESS))
+
+
+@register_pure
+@in_place_transformation
+def remove_filtered_nodes_and_edges(graph, node_filters=None, edge_filters=None):
+    """Remove the nodes passing any of the node filters, then the edges passing any of the edge filters.
+
+    This is equivalent to calling :func:`remove_filtered_nodes` and :func:`remove_filtered_edges` with each filter, as
+    long as the predicates only depend on the node or edge they're given, but only iterates over the nodes and edges
+    once. Pipelines use it to fuse consecutive filters (see :meth:`pybel.struct.pipeline.Pipeline.optimize`).
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param node_filters: A list of node predicates or lists of node predicates. Nodes passing all of the predicates in
+     any of them are removed.
+    :param edge_filters: A list of edge predicates or lists of edge predicates. Edges passing all of the predicates in
+     any of them are removed.
+    """
+    nodes = set()
+    node_predicates = []
+
+    for node_filter in node_filters or []:
+        node_predicate = concatenate_node_predicates(node_filter)
+
+        # predicates that can use the node index don't need to check every node
+        if hasattr(node_predicate, 'node_index_lookup'):
+            nodes.update(filter_nodes(graph, node_predicate))
+        else:
+            node_predicates.append(node_predicate)
+
+    if node_predicates:
+        nodes.update(
+            node
+            for node in graph
+            if any(node_predicate(graph, node) for node_predicate in node_predicates)
+        )
+
+    graph.remove_nodes_from(nodes)
+
+    edge_predicates = [
+        and_edge_predicates(edge_filter)
+        for edge_filter in edge_filters or []
+    ]
+
+    if edge_predicates:
+        edges = [
+            (u, v, k)
+            for u, v, k in graph.edges(keys=True)
+            if any(edge_predicate(graph, u, v, k) for edge_predicate in edge_predicates)
+        ]
+        graph.remove_edges_from(edges)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ...filters.node_selection import get_nodes_by_function
-from ...pipeline.decorators import in_place_transformation, register_deprecated
+from ...pipeline.decorators import in_place_transformation, register_deprecated, register_pure
 from ....constants import GENE, RELATION, RNA, TRANSCRIBED_TO, TRANSLATED_TO
 
 __all__ = [
@@ -47,6 +47,7 @@ def get_rna_leaves(graph):
             yield node
 
 
+@register_pure
 @in_place_transformation
 def prune_rna_origins(graph):
     """Delete gene nodes that are only connected to one node, their correspond RNA, by a transcription edge.
@@ -57,6 +58,7 @@ def prune_rna_origins(graph):
     graph.remove_nodes_from(gene_leaves)
 
 
+@register_pure
 @in_place_transformation
 def prune_protein_origins(graph):
     """Delete RNA nodes that are only connected to one node - their correspond protein - by a translation edge.
@@ -68,6 +70,7 @@ def prune_protein_origins(graph):
 
 
 @register_deprecated('prune_central_dogma')
+@register_pure
 @in_place_transformation
 def prune_protein_rna_origins(graph):
     """Delete genes that are only connected to one node, their correspond RNA, by a translation edge.
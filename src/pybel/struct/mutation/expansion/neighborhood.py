@@ -3,7 +3,7 @@
 """Functions for expanding the neighborhoods of nodes."""
 
 from ...filters.node_predicates import is_pathology
-from ...pipeline import uni_in_place_transformation
+from ...pipeline import register_pure, uni_in_place_transformation
 from ...utils import update_metadata, update_node_helper
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
 ]
 
 
+@register_pure
 @uni_in_place_transformation
 def expand_node_predecessors(universe, graph, node):
     """Expands around the predecessors of the given node in the result graph by looking at the universe graph,
@@ -42,6 +43,7 @@ def expand_node_predecessors(universe, graph, node):
     update_metadata(universe, graph)
 
 
+@register_pure
 @uni_in_place_transformation
 def expand_node_successors(universe, graph, node):
     """Expands around the successors of the given node in the result graph by looking at the universe graph,
@@ -69,6 +71,7 @@ def expand_node_successors(universe, graph, node):
     update_metadata(universe, graph)
 
 
+@register_pure
 @uni_in_place_transformation
 def expand_node_neighborhood(universe, graph, node):
     """Expands around the neighborhoods of the given node in the result graph by looking at the universe graph,
@@ -78,10 +81,10 @@ def expand_node_neighborhood(universe, graph, node):
     :param pybel.BELGraph graph: The graph to add stuff to
     :param tuple node: A BEL node
     """
-    expand_node_predecessors(universe, graph, node)
-    expand_node_successors(universe, graph, node)
+    _expand_nodes_neighborhoods(universe, graph, [node])
 
 
+@register_pure
 @uni_in_place_transformation
 def expand_nodes_neighborhoods(universe, graph, nodes):
     """Expands around the neighborhoods of the given node in the result graph by looking at the universe graph,
@@ -91,10 +94,10 @@ def expand_nodes_neighborhoods(universe, graph, nodes):
     :param pybel.BELGraph graph: The graph to add stuff to
     :param list[tuple] nodes: A node tuples from the query graph
     """
-    for node in nodes:
-        expand_node_neighborhood(universe, graph, node)
+    _expand_nodes_neighborhoods(universe, graph, nodes)
 
 
+@register_pure
 @uni_in_place_transformation
 def expand_all_node_neighborhoods(universe, graph, filter_pathologies=False):
     """Expands the neighborhoods of all nodes in the given graph based on the universe graph.
@@ -103,8 +106,47 @@ def expand_all_node_neighborhoods(universe, graph, filter_pathologies=False):
     :param pybel.BELGraph  graph: The graph to add stuff to
     :param bool filter_pathologies: Should expansion take place around pathologies?
     """
-    for node in list(graph):
-        if filter_pathologies and is_pathology(node):
-            continue
+    nodes = [
+        node
+        for node in graph
+        if not (filter_pathologies and is_pathology(node))
+    ]
+
+    _expand_nodes_neighborhoods(universe, graph, nodes)
+
+
+def _iter_neighborhood_edges(universe, graph, nodes):
+    """Iterate over the edges in the universe between the given nodes and their neighbors that aren't in the graph.
+
+    :param pybel.BELGraph universe: The graph containing the stuff to add
+    :param pybel.BELGraph graph: The graph to add stuff to
+    :param iter[tuple] nodes: BEL nodes
+    :rtype: iter[tuple[tuple,tuple,str,dict]]
+    """
+    for node in nodes:
+        for _, successor, key, data in universe.out_edges(node, data=True, keys=True):
+            if successor not in graph:
+                yield node, successor, key, data
+
+        for predecessor, _, key, data in universe.in_edges(node, data=True, keys=True):
+            if predecessor not in graph:
+                yield predecessor, node, key, data
 
-        expand_node_neighborhood(universe, graph, node)
+
+def _expand_nodes_neighborhoods(universe, graph, nodes):
+    """Expand around the neighborhoods of the given nodes in one pass, in place.
+
+    All of the edges are collected before any are added, so which neighbors are skipped only depends on the graph
+    before the expansion and not on the order of the nodes. The nodes' data and the metadata are then updated once
+    instead of after each node.
+
+    :param pybel.BELGraph universe: The graph containing the stuff to add
+    :param pybel.BELGraph graph: The graph to add stuff to
+    :param iter[tuple] nodes: BEL nodes
+    """
+    edges = list(_iter_neighborhood_edges(universe, graph, nodes))
+
+    graph.add_edges_from(edges)
+
+    update_node_helper(universe, graph)
+    update_metadata(universe, graph)
@@ -2,7 +2,7 @@
 
 from ..utils import expand_by_edge_filter
 from ...filters import build_downstream_edge_predicate, build_upstream_edge_predicate
-from ...pipeline import uni_in_place_transformation
+from ...pipeline import register_pure, uni_in_place_transformation
 
 __all__ = [
     'expand_upstream_causal',
@@ -10,6 +10,7 @@ __all__ = [
 ]
 
 
+@register_pure
 @uni_in_place_transformation
 def expand_upstream_causal(universe, graph):
     """Add the upstream causal relations to the given sub-graph.
@@ -20,6 +21,7 @@ def expand_upstream_causal(universe, graph):
     expand_by_edge_filter(universe, graph, build_upstream_edge_predicate(graph))
 
 
+@register_pure
 @uni_in_place_transformation
 def expand_downstream_causal(universe, graph):
     """Add the downstream causal relations to the given sub-graph.
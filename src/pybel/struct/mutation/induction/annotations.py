@@ -6,9 +6,9 @@ import logging
 
 from six import string_types
 
-from .utils import get_subgraph_by_edge_filter
+from .utils import get_subgraph_by_edge_filter, get_subgraph_by_edges
 from ...filters import build_annotation_dict_all_filter, build_annotation_dict_any_filter
-from ...pipeline import transformation
+from ...pipeline import register_pure, transformation
 
 log = logging.getLogger(__name__)
 
@@ -18,6 +18,7 @@ __all__ = [
 ]
 
 
+@register_pure
 @transformation
 def get_subgraph_by_annotations(graph, annotations, or_=None):
     """Induce a sub-graph given an annotations filter.
@@ -28,7 +29,13 @@ def get_subgraph_by_annotations(graph, annotations, or_=None):
                         edge. Defaults to True.
     :return: A subgraph of the original BEL graph
     :rtype: pybel.BELGraph
+
+    If the graph has a provenance index (see :meth:`pybel.BELGraph.build_provenance_index`), it's used instead of
+    checking each edge.
     """
+    if annotations and graph.provenance_index is not None:
+        return get_subgraph_by_edges(graph, graph.provenance_index.get_edges_by_annotations(annotations, or_=or_))
+
     edge_filter_builder = (
         build_annotation_dict_any_filter
         if (or_ is None or or_) else
@@ -38,6 +45,7 @@ def get_subgraph_by_annotations(graph, annotations, or_=None):
     return get_subgraph_by_edge_filter(graph, edge_filter_builder(annotations))
 
 
+@register_pure
 @transformation
 def get_subgraph_by_annotation_value(graph, annotation, values):
     """Induce a sub-graph over all edges whose annotations match the given key and value.
@@ -4,9 +4,11 @@
 
 import logging
 
-from .utils import get_subgraph_by_edge_filter
+from six import string_types
+
+from .utils import get_subgraph_by_edge_filter, get_subgraph_by_edges
 from ...filters.edge_predicate_builders import build_author_inclusion_filter, build_pmid_inclusion_filter
-from ...pipeline import transformation
+from ...pipeline import register_pure, transformation
 
 __all__ = [
     'get_subgraph_by_pubmed',
@@ -16,6 +18,7 @@ __all__ = [
 log = logging.getLogger(__name__)
 
 
+@register_pure
 @transformation
 def get_subgraph_by_pubmed(graph, pubmed_identifiers):
     """Induce a sub-graph over the edges retrieved from the given PubMed identifier(s).
@@ -23,10 +26,20 @@ def get_subgraph_by_pubmed(graph, pubmed_identifiers):
     :param pybel.BELGraph graph: A BEL graph
     :param str or list[str] pubmed_identifiers: A PubMed identifier or list of PubMed identifiers
     :rtype: pybel.BELGraph
+
+    If the graph has a provenance index (see :meth:`pybel.BELGraph.build_provenance_index`), it's used instead of
+    checking each edge.
     """
+    if graph.provenance_index is not None:
+        if isinstance(pubmed_identifiers, string_types):
+            pubmed_identifiers = [pubmed_identifiers]
+
+        return get_subgraph_by_edges(graph, graph.provenance_index.get_edges_by_citations(pubmed_identifiers))
+
     return get_subgraph_by_edge_filter(graph, build_pmid_inclusion_filter(pubmed_identifiers))
 
 
+@register_pure
 @transformation
 def get_subgraph_by_authors(graph, authors):
     """Induce a sub-graph over the edges retrieved publications by the given author(s).
@@ -34,5 +47,14 @@ def get_subgraph_by_authors(graph, authors):
     :param pybel.BELGraph graph: A BEL graph
     :param str or list[str] authors: An author or list of authors
     :rtype: pybel.BELGraph
+
+    If the graph has a provenance index (see :meth:`pybel.BELGraph.build_provenance_index`), it's used instead of
+    checking each edge.
     """
+    if graph.provenance_index is not None:
+        if isinstance(authors, string_types):
+            authors = [authors]
+
+        return get_subgraph_by_edges(graph, graph.provenance_index.get_edges_by_authors(authors))
+
     return get_subgraph_by_edge_filter(graph, build_author_inclusion_filter(authors))
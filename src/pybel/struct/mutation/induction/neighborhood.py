@@ -4,7 +4,7 @@
 
 import itertools as itt
 
-from ...pipeline import transformation
+from ...pipeline import register_pure, transformation
 from ...utils import update_metadata, update_node_helper
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
 ]
 
 
+@register_pure
 @transformation
 def get_subgraph_by_neighborhood(graph, nodes):
     """Get a BEL graph around the neighborhoods of the given nodes. Returns none if no nodes are in the graph.
@@ -2,14 +2,14 @@
 
 """Induction methods for graphs over shortest paths."""
 
-import itertools as itt
 import logging
 import random
+from multiprocessing import Pool
 
 import networkx as nx
 
 from .utils import get_subgraph_by_induction
-from ...pipeline import transformation
+from ...pipeline import register_pure, transformation
 from ....constants import FUNCTION, PATHOLOGY
 
 __all__ = [
@@ -20,6 +20,11 @@ __all__ = [
 
 log = logging.getLogger(__name__)
 
+# The graph, targets, and weight key in worker processes, which are only shipped once per process
+_worker_graph = None
+_worker_targets = None
+_worker_weight = None
+
 
 def _remove_pathologies_oop(graph):
     """Remove pathology nodes from the graph."""
@@ -30,52 +35,114 @@ def _remove_pathologies_oop(graph):
     return rv
 
 
-def _iterate_nodes_in_shortest_paths(graph, nodes, weight=None):
+def _get_nodes_in_shortest_paths_from(graph, source, targets, weight=None):
+    """Get the nodes in all shortest paths from the source to any of the targets with a single search.
+
+    A breadth-first search (or Dijkstra's algorithm, if a weight is given) from the source finds the predecessors of
+    each node on its shortest paths from the source. Walking the predecessors back from all of the targets at once
+    then finds the same nodes as :func:`networkx.all_shortest_paths` would for each target, without enumerating the
+    paths.
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param BaseEntity source: The source node
+    :param iter[BaseEntity] targets: The target nodes
+    :param Optional[str] weight: Edge data key corresponding to the edge weight. If none, uses unweighted search.
+    :rtype: set[BaseEntity]
+    """
+    if weight is None:
+        pred = nx.predecessor(graph, source)
+    else:
+        pred, _ = nx.dijkstra_predecessor_and_distance(graph, source, weight=weight)
+
+    rv = set()
+    stack = [target for target in targets if target in pred]
+
+    while stack:
+        node = stack.pop()
+
+        if node in rv:
+            continue
+
+        rv.add(node)
+        stack.extend(pred[node])
+
+    return rv
+
+
+def _init_worker(graph, targets, weight):
+    """Set the graph, targets, and weight key in a worker process."""
+    global _worker_graph, _worker_targets, _worker_weight
+    _worker_graph, _worker_targets, _worker_weight = graph, targets, weight
+
+
+def _run_worker(source):
+    """Get the nodes in all shortest paths from the source to any of the targets in a worker process.
+
+    :param BaseEntity source: The source node
+    :rtype: set[BaseEntity]
+    """
+    return _get_nodes_in_shortest_paths_from(_worker_graph, source, _worker_targets, weight=_worker_weight)
+
+
+def _iterate_nodes_in_shortest_paths(graph, nodes, weight=None, processes=None):
     """Iterate over nodes in the shortest paths between all pairs of nodes in the given list.
 
     :type graph: pybel.BELGraph
     :type nodes: list[tuple]
     :param weight: Optional[str]
+    :param Optional[int] processes: If given and more than one, searches from the sources in this many processes
     :rtype: iter[tuple]
     """
-    for source, target in itt.product(nodes, repeat=2):
-        try:
-            paths = nx.all_shortest_paths(graph, source, target, weight=weight)
-            for path in paths:
-                for node in path:
-                    yield node
-        except nx.exception.NetworkXNoPath:
-            continue
+    sources = [node for node in nodes if node in graph]
+    targets = set(sources)
+
+    if processes is None or processes < 2 or len(sources) < 2:
+        for source in sources:
+            for node in _get_nodes_in_shortest_paths_from(graph, source, targets, weight=weight):
+                yield node
+
+        return
+
+    pool = Pool(min(processes, len(sources)), initializer=_init_worker, initargs=(graph, targets, weight))
+    try:
+        for source_nodes in pool.imap_unordered(_run_worker, sources):
+            for node in source_nodes:
+                yield node
+    finally:
+        pool.close()
+        pool.join()
 
 
-def get_nodes_in_all_shortest_paths(graph, nodes, weight=None, remove_pathologies=False):
+def get_nodes_in_all_shortest_paths(graph, nodes, weight=None, remove_pathologies=False, processes=None):
     """Get a set of nodes in all shortest paths between the given nodes.
 
-    Thinly wraps :func:`networkx.all_shortest_paths`.
+    Gives the same nodes as :func:`networkx.all_shortest_paths` between each pair of the nodes, but only searches once
+    from each node instead of once for each pair.
 
     :param pybel.BELGraph graph: A BEL graph
     :param iter[tuple] nodes: The list of nodes to use to use to find all shortest paths
     :param Optional[str] weight: Edge data key corresponding to the edge weight. If none, uses unweighted search.
     :param bool remove_pathologies: Should pathology nodes be removed first?
+    :param Optional[int] processes: If given and more than one, searches from the nodes in this many processes
     :return: A set of nodes appearing in the shortest paths between nodes in the BEL graph
     :rtype: set[tuple]
-
-    .. note:: This can be trivially parallelized using :func:`networkx.single_source_shortest_path`
     """
     if remove_pathologies:
         graph = _remove_pathologies_oop(graph)
 
-    return set(_iterate_nodes_in_shortest_paths(graph, nodes, weight=weight))
+    return set(_iterate_nodes_in_shortest_paths(graph, nodes, weight=weight, processes=processes))
 
 
+@register_pure
 @transformation
-def get_subgraph_by_all_shortest_paths(graph, nodes, weight=None, remove_pathologies=False):
+def get_subgraph_by_all_shortest_paths(graph, nodes, weight=None, remove_pathologies=False, processes=None):
     """Induce a subgraph over the nodes in the pairwise shortest paths between all of the nodes in the given list.
 
     :param pybel.BELGraph graph: A BEL graph
     :param iter[tuple] nodes: A set of nodes over which to calculate shortest paths
     :param str weight: Edge data key corresponding to the edge weight. If None, performs unweighted search
     :param bool remove_pathologies: Should the pathology nodes be deleted before getting shortest paths?
+    :param Optional[int] processes: If given and more than one, searches from the nodes in this many processes
     :return: A BEL graph induced over the nodes appearing in the shortest paths between the given nodes
     :rtype: Optional[pybel.BELGraph]
     """
@@ -91,7 +158,7 @@ def get_subgraph_by_all_shortest_paths(graph, nodes, weight=None, remove_patholo
         return
 
     induced_nodes = get_nodes_in_all_shortest_paths(graph, query_nodes, weight=weight,
-                                                    remove_pathologies=remove_pathologies)
+                                                    remove_pathologies=remove_pathologies, processes=processes)
 
     if not induced_nodes:
         return
@@ -105,7 +172,7 @@ def get_random_path(graph):
     :param pybel.BELGraph graph: A BEL graph
     :rtype: list[BaseEntity]
     """
-    wg = graph.to_undirected()
+    wg = graph.get_undirected_graph()
 
     nodes = wg.nodes()
 
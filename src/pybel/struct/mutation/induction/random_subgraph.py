@@ -5,7 +5,6 @@
 import bisect
 import logging
 import random
-from operator import itemgetter
 
 from ..utils import remove_isolated_nodes
 from ...pipeline import transformation
@@ -21,18 +20,26 @@ log = logging.getLogger(__name__)
 
 
 def _random_edge_iterator(graph, n_edges):
-    """Get a random set of edges from the graph and randomly samples a key from each.
+    """Get a random set of edges from the graph.
+
+    Uses reservoir sampling, so only the sampled edges are kept in memory instead of a shuffled list of all of them.
 
     :type graph: pybel.BELGraph
     :param int n_edges: Number of edges to randomly select from the given graph
     :rtype: iter[tuple[tuple,tuple,int,dict]]
     """
-    universe_edges = list(graph.edges())
-    random.shuffle(universe_edges)
+    reservoir = []
+
+    for i, edge in enumerate(graph.edges(keys=True)):
+        if i < n_edges:
+            reservoir.append(edge)
+            continue
+
+        j = random.randint(0, i)
+        if j < n_edges:
+            reservoir[j] = edge
 
-    for u, v in universe_edges[:n_edges]:
-        keys = list(graph[u][v])
-        k = random.choice(keys)
+    for u, v, k in reservoir:
         yield u, v, k, graph[u][v][k]
 
 
@@ -98,6 +105,139 @@ class WeightedRandomGenerator(object):
         return self.values[self.next_index()]
 
 
+class FenwickRandomGenerator(object):
+    """A weighted random generator whose weights can be changed and added to.
+
+    The weights are kept in a Fenwick (binary indexed) tree, so changing a weight, adding a value, and getting a random
+    value all take logarithmic time, rather than rebuilding a :class:`WeightedRandomGenerator` after each change.
+    """
+
+    def __init__(self):
+        """Build an empty weighted random generator."""
+        self.values = []
+        self.weights = []
+        self.total = 0.0
+        self._tree = [0.0]  # the tree is 1-indexed
+        self._index = {}
+        self._positive = 0
+
+    def __len__(self):
+        """Count the values with positive weights."""
+        return self._positive
+
+    def __contains__(self, value):
+        return value in self._index
+
+    def _get_prefix_sum(self, i):
+        """Get the sum of the first ``i`` weights."""
+        rv = 0.0
+        while 0 < i:
+            rv += self._tree[i]
+            i -= i & -i
+        return rv
+
+    def _append(self, value, weight):
+        """Add a value to the end of the tree."""
+        self._index[value] = len(self.values)
+        self.values.append(value)
+        self.weights.append(weight)
+
+        # the new node holds the sum of the weights in (i - lowbit(i), i]
+        i = len(self._tree)
+        self._tree.append(weight + self._get_prefix_sum(i - 1) - self._get_prefix_sum(i - (i & -i)))
+
+    def _rebuild(self):
+        """Rebuild the tree from the weights, which gets rid of floating point errors from many updates."""
+        self._tree = [0.0] + list(self.weights)
+
+        for i in range(1, len(self._tree)):
+            parent = i + (i & -i)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[i]
+
+        self.total = sum(self.weights)
+
+    def set_weight(self, value, weight):
+        """Set the weight of a value, adding it if it's new.
+
+        :param Any value: A hashable value
+        :param float weight: A non-negative weight. Values with a weight of zero are never chosen.
+        """
+        index = self._index.get(value)
+
+        if index is None:
+            self._append(value, weight)
+            delta = weight
+        else:
+            delta = weight - self.weights[index]
+            if 0 < self.weights[index]:
+                self._positive -= 1
+            self.weights[index] = weight
+
+            i = index + 1
+            while i < len(self._tree):
+                self._tree[i] += delta
+                i += i & -i
+
+        if 0 < weight:
+            self._positive += 1
+        self.total += delta
+
+    def _search(self, target):
+        """Get the index of the first value whose cumulative weight is more than the target."""
+        position, step = 0, 1
+        while step * 2 < len(self._tree):
+            step *= 2
+
+        while step:
+            if position + step < len(self._tree) and self._tree[position + step] <= target:
+                position += step
+                target -= self._tree[position]
+            step //= 2
+
+        return min(position, len(self.values) - 1)
+
+    def next_index(self):
+        """Get a random index, or None if no values have a positive weight.
+
+        :rtype: Optional[int]
+        """
+        if not self._positive:
+            return
+
+        while True:
+            index = self._search(random.random() * self.total)
+
+            if 0 < self.weights[index]:
+                return index
+
+            self._rebuild()
+
+    def next(self):
+        """Get a random value, or None if no values have a positive weight.
+
+        :rtype: Any
+        """
+        index = self.next_index()
+
+        if index is not None:
+            return self.values[index]
+
+
+def _get_degree_weight(degree, invert_degrees=None):
+    """Get the weight for choosing a node to grow from based on its degree.
+
+    :param int degree: The degree of the node
+    :param Optional[bool] invert_degrees: Should the degrees be inverted? Defaults to true.
+    :rtype: float
+    """
+    if invert_degrees is None or invert_degrees:
+        # More likely to choose low degree nodes to explore, so don't make hubs
+        return 1.0 / degree if degree else 0.0
+
+    return float(degree)
+
+
 def get_random_node(graph, node_blacklist, invert_degrees=None):
     """Choose a node from the graph with probabilities based on their degrees.
 
@@ -109,17 +249,15 @@ def get_random_node(graph, node_blacklist, invert_degrees=None):
     try:
         nodes, degrees = zip(*(
             (node, degree)
-            for node, degree in sorted(graph.degree(), key=itemgetter(1))
+            for node, degree in graph.degree()
             if node not in node_blacklist
         ))
     except ValueError:  # something wrong with graph, probably no elements in graph.degree_iter
         return
 
-    if invert_degrees is None or invert_degrees:
-        # More likely to choose low degree nodes to explore, so don't make hubs
-        degrees = [1 / degree for degree in degrees]
+    weights = [_get_degree_weight(degree, invert_degrees=invert_degrees) for degree in degrees]
 
-    wrg = WeightedRandomGenerator(nodes, degrees)
+    wrg = WeightedRandomGenerator(nodes, weights)
     return wrg.next()
 
 
@@ -132,30 +270,31 @@ def _helper(result, graph, number_edges_remaining, no_grow, invert_degrees=None)
     :type no_grow: set
     :type invert_degrees: Optional[bool]
     """
-    original_node_count = graph.number_of_nodes()
+    degrees = dict(result.degree())
+
+    # the weights are updated as edges are added instead of being rebuilt from all of the degrees for each edge
+    generator = FenwickRandomGenerator()
+    for node, degree in degrees.items():
+        generator.set_weight(node, 0.0 if node in no_grow else _get_degree_weight(degree, invert_degrees))
 
     log.debug('adding remaining %d edges', number_edges_remaining)
     for _ in range(number_edges_remaining):
 
-        source, possible_step_nodes, c = None, set(), 0
-        while not source or not possible_step_nodes:
-            source = get_random_node(result, no_grow, invert_degrees=invert_degrees)
+        possible_step_nodes = None
+        while not possible_step_nodes:
+            source = generator.next()
 
-            c += 1
-            if c >= original_node_count:
-                log.warning('infinite loop happening')
-                log.warning('source: %s', source)
+            if source is None:
+                log.warning('no nodes left to grow from')
                 log.warning('no grow: %s', no_grow)
                 return  # Happens when after exhausting the connected components. Try increasing the number seed edges
 
-            if source is None:
-                continue  # maybe do something else?
-
             # Only keep targets in the original graph that aren't in the result graph
             possible_step_nodes = set(graph[source]) - set(result[source])
 
             if not possible_step_nodes:
                 no_grow.add(source)  # there aren't any possible nodes to step to, so try growing from somewhere else
+                generator.set_weight(source, 0.0)
 
         step_node = random.choice(list(possible_step_nodes))
 
@@ -164,6 +303,12 @@ def _helper(result, graph, number_edges_remaining, no_grow, invert_degrees=None)
 
         result.add_edge(source, step_node, key=key, **attr_dict)
 
+        for node in (source, step_node):
+            degrees[node] = degrees.get(node, 0) + 1
+
+            if node not in no_grow:
+                generator.set_weight(node, _get_degree_weight(degrees[node], invert_degrees))
+
 
 @transformation
 def get_random_subgraph(graph, number_edges=None, number_seed_edges=None, seed=None, invert_degrees=None):
@@ -6,7 +6,7 @@ import logging
 
 from .utils import get_subgraph_by_edge_filter
 from ...filters import build_downstream_edge_predicate, build_upstream_edge_predicate
-from ...pipeline import transformation
+from ...pipeline import register_pure, transformation
 
 __all__ = [
     'get_upstream_causal_subgraph',
@@ -16,6 +16,7 @@ __all__ = [
 log = logging.getLogger(__name__)
 
 
+@register_pure
 @transformation
 def get_upstream_causal_subgraph(graph, nbunch):
     """Induce a sub-graph from all of the upstream causal entities of the nodes in the nbunch.
@@ -27,6 +28,7 @@ def get_upstream_causal_subgraph(graph, nbunch):
     return get_subgraph_by_edge_filter(graph, build_upstream_edge_predicate(nbunch))
 
 
+@register_pure
 @transformation
 def get_downstream_causal_subgraph(graph, nbunch):
     """Induce a sub-graph from all of the downstream causal entities of the nodes in the nbunch.
@@ -2,14 +2,17 @@
 
 from ..utils import expand_by_edge_filter
 from ...operations import subgraph
-from ...pipeline import transformation
+from ...pipeline import register_pure, transformation
+from ...utils import update_metadata, update_node_helper
 
 __all__ = [
     'get_subgraph_by_edge_filter',
+    'get_subgraph_by_edges',
     'get_subgraph_by_induction',
 ]
 
 
+@register_pure
 @transformation
 def get_subgraph_by_edge_filter(graph, edge_predicates=None):
     """Induce a sub-graph on all edges that pass the given filters.
@@ -25,6 +28,25 @@ def get_subgraph_by_edge_filter(graph, edge_predicates=None):
     return rv
 
 
+def get_subgraph_by_edges(graph, edges):
+    """Induce a sub-graph on the given edges.
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param iter[tuple[BaseEntity,BaseEntity,str]] edges: An iterable of (source, target, key) triples from the graph
+    :return: A BEL sub-graph containing the given edges
+    :rtype: pybel.BELGraph
+    """
+    rv = graph.fresh_copy()
+    rv.add_edges_from(
+        (u, v, key, graph[u][v][key])
+        for u, v, key in edges
+    )
+    update_node_helper(graph, rv)
+    update_metadata(graph, rv)
+    return rv
+
+
+@register_pure
 @transformation
 def get_subgraph_by_induction(graph, nodes):
     """Induce a sub-graph over the given nodes or return None if none of the nodes are in the given graph.
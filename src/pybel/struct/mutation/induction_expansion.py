@@ -8,7 +8,7 @@ from .expansion import expand_all_node_neighborhoods
 from .expansion.upstream import expand_downstream_causal, expand_upstream_causal
 from .induction.neighborhood import get_subgraph_by_neighborhood
 from .induction.upstream import get_downstream_causal_subgraph, get_upstream_causal_subgraph
-from ..pipeline import transformation
+from ..pipeline import register_pure, transformation
 
 __all__ = [
     'get_multi_causal_upstream',
@@ -19,6 +19,7 @@ __all__ = [
 log = logging.getLogger(__name__)
 
 
+@register_pure
 @transformation
 def get_multi_causal_upstream(graph, nbunch):
     """Get the union of all the 2-level deep causal upstream subgraphs from the nbunch.
@@ -34,6 +35,7 @@ def get_multi_causal_upstream(graph, nbunch):
     return result
 
 
+@register_pure
 @transformation
 def get_multi_causal_downstream(graph, nbunch):
     """Get the union of all of the 2-level deep causal downstream subgraphs from the nbunch.
@@ -49,6 +51,7 @@ def get_multi_causal_downstream(graph, nbunch):
     return result
 
 
+@register_pure
 @transformation
 def get_subgraph_by_second_neighbors(graph, nodes, filter_pathologies=False):
     """Get a graph around the neighborhoods of the given nodes and expand to the neighborhood of those nodes.
@@ -2,7 +2,7 @@
 
 """Functions for enriching the origins of Proteins, RNAs, and miRNAs."""
 from pybel.dsl import Protein
-from ...pipeline import in_place_transformation
+from ...pipeline import in_place_transformation, register_pure
 from ...pipeline.decorators import register_deprecated
 from ....constants import FUNCTION, FUSION, MIRNA, RNA, VARIANTS
 
@@ -14,6 +14,7 @@ __all__ = [
 
 
 @register_deprecated('infer_central_dogmatic_translations')
+@register_pure
 @in_place_transformation
 def enrich_proteins_with_rnas(graph):
     """Add the corresponding RNA node for each protein node and connect them with a translation edge.
@@ -32,6 +33,7 @@ def enrich_proteins_with_rnas(graph):
 
 
 @register_deprecated('infer_central_dogmatic_transcriptions')
+@register_pure
 @in_place_transformation
 def enrich_rnas_with_genes(graph):
     """Add the corresponding gene node for each RNA/miRNA node and connect them with a transcription edge.
@@ -47,6 +49,7 @@ def enrich_rnas_with_genes(graph):
 
 
 @register_deprecated('infer_central_dogma')
+@register_pure
 @in_place_transformation
 def enrich_protein_and_rna_origins(graph):
     """Add the corresponding RNA for each protein then the corresponding gene for each RNA/miRNA.
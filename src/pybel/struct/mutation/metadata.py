@@ -4,7 +4,7 @@
 
 import logging
 
-from ..pipeline import in_place_transformation
+from ..pipeline import in_place_transformation, register_pure
 from ...constants import ANNOTATIONS
 
 __all__ = [
@@ -16,6 +16,7 @@ __all__ = [
 log = logging.getLogger(__name__)
 
 
+@register_pure
 @in_place_transformation
 def strip_annotations(graph):
     """Strip all the annotations from a BEL graph.
@@ -25,8 +26,10 @@ def strip_annotations(graph):
     for u, v, k in graph.edges(keys=True):
         if ANNOTATIONS in graph[u][v][k]:
             del graph[u][v][k][ANNOTATIONS]
+            graph.reindex_edge(u, v, k)
 
 
+@register_pure
 @in_place_transformation
 def add_annotation_value(graph, annotation, value):
     """Add the given annotation/value pair to all qualified edges.
@@ -38,16 +41,23 @@ def add_annotation_value(graph, annotation, value):
     if annotation not in graph.defined_annotation_keywords:
         raise ValueError('annotation not defined: {}'.format(annotation))
 
-    for u, v, k in graph.edges(keys=True):
-        if ANNOTATIONS not in graph[u][v][k]:
+    for u, v, k, data in graph.edges(keys=True, data=True):
+        if ANNOTATIONS not in data:
             continue
 
-        if annotation not in graph[u][v][k][ANNOTATIONS]:
-            graph[u][v][k][ANNOTATIONS] = {annotation: {}}
+        # the annotations might be shared with a copy of this graph, so they're replaced instead of modified
+        if annotation not in data[ANNOTATIONS]:
+            annotations = {annotation: {}}
+        else:
+            annotations = data[ANNOTATIONS].copy()
+            annotations[annotation] = annotations[annotation].copy()
 
-        graph[u][v][k][ANNOTATIONS][annotation][value] = True
+        annotations[annotation][value] = True
+        data[ANNOTATIONS] = annotations
+        graph.reindex_edge(u, v, k)
 
 
+@register_pure
 @in_place_transformation
 def remove_annotation_value(graph, annotation, value):
     """Remove the given annotation/value pair to all qualified edges.
@@ -60,14 +70,22 @@ def remove_annotation_value(graph, annotation, value):
         log.warning('annotation was not defined: %s', annotation)
         return
 
-    for u, v, k in graph.edges(keys=True):
-        if ANNOTATIONS not in graph[u][v][k]:
+    for u, v, k, data in graph.edges(keys=True, data=True):
+        if ANNOTATIONS not in data:
             continue
 
-        if annotation not in graph[u][v][k][ANNOTATIONS]:
+        if annotation not in data[ANNOTATIONS]:
             continue
 
-        if value not in graph[u][v][k][ANNOTATIONS][annotation]:
+        if value not in data[ANNOTATIONS][annotation]:
             continue
 
-        del graph[u][v][k][ANNOTATIONS][annotation][value]
+        # the annotations might be shared with a copy of this graph, so they're replaced instead of modified
+        annotations = data[ANNOTATIONS].copy()
+        annotations[annotation] = {
+            key: annotation_value
+            for key, annotation_value in annotations[annotation].items()
+            if key != value
+        }
+        data[ANNOTATIONS] = annotations
+        graph.reindex_edge(u, v, k)
@@ -3,7 +3,7 @@
 import networkx as nx
 
 from ..filters import filter_edges
-from ..pipeline import in_place_transformation, transformation, uni_in_place_transformation
+from ..pipeline import in_place_transformation, register_pure, transformation, uni_in_place_transformation
 from ..utils import update_metadata, update_node_helper
 
 __all__ = [
@@ -13,6 +13,7 @@ __all__ = [
 ]
 
 
+@register_pure
 @in_place_transformation
 def remove_isolated_nodes(graph):
     """Remove isolated nodes from the network, in place.
@@ -23,6 +24,7 @@ def remove_isolated_nodes(graph):
     graph.remove_nodes_from(nodes)
 
 
+@register_pure
 @transformation
 def remove_isolated_nodes_op(graph):
     """Build a new graph excluding the isolated nodes.
@@ -36,6 +38,7 @@ def remove_isolated_nodes_op(graph):
     return rv
 
 
+@register_pure
 @uni_in_place_transformation
 def expand_by_edge_filter(source, target, edge_predicates=None):
     """Expand a target graph by edges in the source matching the given predicates.
@@ -1,10 +1,21 @@
 # -*- coding: utf-8 -*-
 
+from multiprocessing import Pool
+
 import networkx as nx
+from networkx.classes.filters import no_filter, show_multidiedges, show_nodes
 
 from .utils import update_metadata, update_node_helper
 
+try:
+    from networkx.classes.graphviews import subgraph_view as _subgraph_view
+except ImportError:  # networkx 2.1
+    from networkx.classes.graphviews import SubMultiDiGraph as _subgraph_view
+
 __all__ = [
+    'subgraph_view',
+    'is_graph_view',
+    'materialize',
     'subgraph',
     'left_full_join',
     'left_outer_join',
@@ -14,6 +25,87 @@ __all__ = [
 ]
 
 
+def subgraph_view(graph, nodes=None, edges=None):
+    """Build a read-only view of a graph, optionally restricted to the given nodes and edges.
+
+    The view is a :class:`pybel.BELGraph` that reads through to the original graph without copying any nodes, edges,
+    or data dictionaries. Trying to add or remove nodes or edges raises a :class:`networkx.NetworkXError`, so use
+    :func:`materialize` to get a graph that can be modified.
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param Optional[iter[BaseEntity]] nodes: The nodes to keep. If none, keeps all nodes.
+    :param Optional[iter[tuple[BaseEntity,BaseEntity,str]]] edges: The (source, target, key) triples of the edges to
+     keep. If none, keeps all edges between the kept nodes.
+    :rtype: pybel.BELGraph
+    """
+    if nodes is None and edges is None:
+        if is_graph_view(graph):
+            return graph
+
+        view = nx.freeze(graph.__class__())
+        view._NODE_OK = view._EDGE_OK = no_filter
+        view._graph = graph
+        view.graph = graph.graph
+        view._node = graph._node
+        view._succ = view._adj = graph._succ
+        view._pred = graph._pred
+
+        # the indexes are also valid for the view since it has all of the same nodes and edges
+        view._provenance_index = graph._provenance_index
+        view._node_index = graph._node_index
+        view._equivalence_index = graph._equivalence_index
+
+    else:
+        filter_node = no_filter if nodes is None else show_nodes(nodes)
+        filter_edge = no_filter if edges is None else show_multidiedges(edges)
+
+        if is_graph_view(graph):  # don't chain views
+            filter_node = _combine_filters(graph._NODE_OK, filter_node)
+            filter_edge = _combine_filters(graph._EDGE_OK, filter_edge)
+            graph = graph._graph
+
+        view = _subgraph_view(graph, filter_node, filter_edge)
+
+    view._warnings = graph._warnings
+    return view
+
+
+def _combine_filters(first, second):
+    """Combine two node or edge filters."""
+    if first is no_filter:
+        return second
+
+    if second is no_filter:
+        return first
+
+    def combined_filter(*args):
+        return first(*args) and second(*args)
+
+    return combined_filter
+
+
+def is_graph_view(graph):
+    """Check if the graph is a read-only view made by :func:`subgraph_view`.
+
+    :param pybel.BELGraph graph: A BEL graph
+    :rtype: bool
+    """
+    return nx.is_frozen(graph) and hasattr(graph, '_graph')
+
+
+def materialize(graph):
+    """Get a graph that can be modified, copying the graph if it's a view.
+
+    :param pybel.BELGraph graph: A BEL graph or a view from :func:`subgraph_view`
+    :return: The same graph if it's not a view, or else a new graph with its nodes and edges
+    :rtype: pybel.BELGraph
+    """
+    if not is_graph_view(graph):
+        return graph
+
+    return graph.fast_copy()
+
+
 def subgraph(graph, nodes):
     """Induce a sub-graph over the given nodes.
 
@@ -80,7 +172,7 @@ def left_outer_join(g, h):
     >>> left_outer_join(g, h)
     """
     g_nodes = set(g)
-    for comp in nx.weakly_connected_components(h):
+    for comp in h.get_weakly_connected_components():
         if g_nodes.intersection(comp):
             h_subgraph = subgraph(h, comp)
             left_full_join(g, h_subgraph)
@@ -100,11 +192,17 @@ def _left_outer_join_networks(target, networks):
     return target
 
 
-def union(networks):
+def union(networks, processes=None):
     """Take the union over a collection of networks into a new network. Assumes iterator is longer than 2, but not
     infinite.
 
+    The result is the same as joining each network into a copy of the first with :func:`left_full_join`, but the
+    nodes, edges, and metadata of all of the networks are merged in a single pass, so it scales to many networks.
+
     :param iter[BELGraph] networks: An iterator over BEL networks. Can't be infinite.
+    :param Optional[int] processes: If given and more than one, splits the networks into this many chunks, takes the
+     union of each in a separate process, then takes the union of the results. This only pays off for many large
+     networks since each has to be pickled to and from the worker processes.
     :return: A merged network
     :rtype: BELGraph
 
@@ -126,14 +224,90 @@ def union(networks):
     if n_networks == 1:
         return networks[0]
 
-    target = networks[0].copy()
+    if processes is not None and processes > 1 and n_networks > 2:
+        return _union_parallel(networks, processes)
 
-    for network in networks[1:]:
-        left_full_join(target, network)
+    return _union(networks)
+
+
+def _union(networks):
+    """Take the union over at least two networks in a single pass.
+
+    :param tuple[BELGraph] networks: A tuple of BEL networks
+    :rtype: BELGraph
+    """
+    target = networks[0].fast_copy()
+    rest = networks[1:]
+
+    # the first network with a given edge wins, like with left_full_join
+    edges = {}
+    for network in rest:
+        for u, v, key, data in network.edges(keys=True, data=True):
+            if (u, v, key) in edges or (u in target and v in target[u] and key in target[u][v]):
+                continue
+            edges[u, v, key] = data
+
+    target.add_edges_from(
+        (u, v, key, data)
+        for (u, v, key), data in edges.items()
+    )
+
+    _update_metadata_many(target, rest)
+
+    for network in rest:
+        for node, data in network.nodes(data=True):
+            if node in target:
+                target.nodes[node].update(data)
 
     return target
 
 
+def _update_metadata_many(target, networks):
+    """Update the namespace and annotation metadata in the target graph from all of the networks at once.
+
+    :param BELGraph target: A BEL network
+    :param iter[BELGraph] networks: BEL networks
+    """
+    annotation_list = {}
+
+    for network in networks:
+        target.namespace_url.update(network.namespace_url)
+        target.namespace_pattern.update(network.namespace_pattern)
+        target.annotation_url.update(network.annotation_url)
+        target.annotation_pattern.update(network.annotation_pattern)
+
+        for keyword, values in network.annotation_list.items():
+            annotation_list.setdefault(keyword, set()).update(values)
+
+    # replaced instead of modified since they might be shared with a copy of the target
+    for keyword, values in annotation_list.items():
+        target.annotation_list[keyword] = values.union(target.annotation_list.get(keyword, ()))
+
+
+def _union_parallel(networks, processes):
+    """Take the union over the networks with a merge tree, taking the union of each chunk in a separate process.
+
+    :param tuple[BELGraph] networks: A tuple of BEL networks
+    :param int processes: The number of processes
+    :rtype: BELGraph
+    """
+    # contiguous chunks keep the order of the networks, so the same edges win as with a serial union
+    chunk_size = max(2, -(-len(networks) // processes))
+    chunks = [
+        networks[i:i + chunk_size]
+        for i in range(0, len(networks), chunk_size)
+    ]
+
+    pool = Pool(min(processes, len(chunks)))
+    try:
+        results = pool.map(union, chunks)
+    finally:
+        pool.close()
+        pool.join()
+
+    return union(results)
+
+
 def left_node_intersection_join(g, h):
     """Take the intersection over two networks. This intersection of two graphs is defined by the
      union of the subgraphs induced over the intersection of their nodes
@@ -152,7 +326,7 @@ def left_node_intersection_join(g, h):
     intersecting = set(g).intersection(set(h))
 
     g_inter = subgraph(g, intersecting)
-    h_inter = subgraph(h, intersecting)
+    h_inter = subgraph_view(h, intersecting)
 
     left_full_join(g_inter, h_inter)
 
@@ -190,7 +364,7 @@ def node_intersection(networks):
     for network in networks[1:]:
         nodes.intersection_update(network)
 
-    return union(
-        subgraph(network, nodes)
+    return materialize(union(
+        subgraph_view(network, nodes)
         for network in networks
-    )
+    ))
@@ -2,13 +2,19 @@
 
 """This module assists in running complex workflows on BEL graphs."""
 
-from . import decorators, exc, pipeline
+from . import cache, decorators, exc, pipeline, planner, profiling
+from .cache import *
 from .decorators import *
 from .exc import *
 from .pipeline import *
+from .planner import *
+from .profiling import *
 
 __all__ = (
+        cache.__all__ +
         decorators.__all__ +
         exc.__all__ +
-        pipeline.__all__
+        pipeline.__all__ +
+        planner.__all__ +
+        profiling.__all__
 )
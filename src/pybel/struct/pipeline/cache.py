@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""A cache for the intermediate results of pipelines.
+
+Results are keyed by the fingerprint of the seed graph (see :meth:`pybel.BELGraph.get_fingerprint`), the fingerprint
+of the universe, and the JSON of the prefix of the protocol that produced them, so pipelines that share a prefix can
+start from where another one left off. Only prefixes made of functions registered with
+:func:`pybel.struct.pipeline.register_pure` are cached.
+
+The cache has two tiers. The most recently used results are kept in memory, and if a directory is given, the results
+evicted from memory are pickled there until it also holds too many, at which point the least recently used ones are
+deleted.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+
+from six.moves import cPickle as pickle
+
+from ..operations import materialize
+
+__all__ = [
+    'PipelineCache',
+]
+
+log = logging.getLogger(__name__)
+
+
+class PipelineCache(object):
+    """A least recently used (LRU) cache for the results of pipelines, in memory and optionally on disk.
+
+    Example usage:
+
+    >>> from pybel.struct.pipeline import Pipeline, PipelineCache
+    >>> cache = PipelineCache(max_size=32, directory='~/.pybel/pipeline_cache')
+    >>> pipeline = Pipeline.from_functions(['enrich_protein_and_rna_origins', 'prune_protein_rna_origins'])
+    >>> result = pipeline.run(graph, cache=cache)
+    """
+
+    def __init__(self, max_size=128, directory=None, max_disk_size=1024):
+        """Build a cache.
+
+        :param int max_size: The maximum number of results to keep in memory
+        :param Optional[str] directory: A directory in which to keep the results evicted from memory. If none, they're
+         discarded.
+        :param int max_disk_size: The maximum number of results to keep in the directory
+        """
+        self.max_size = max_size
+        self.max_disk_size = max_disk_size
+        self.directory = directory
+
+        if self.directory is not None:
+            self.directory = os.path.expanduser(self.directory)
+            if not os.path.exists(self.directory):
+                os.makedirs(self.directory)
+
+        self._memory = OrderedDict()
+
+        #: The number of look-ups that found a result
+        self.hits = 0
+        #: The number of look-ups that didn't find a result
+        self.misses = 0
+
+    def __len__(self):
+        """Count the number of results in memory."""
+        return len(self._memory)
+
+    @staticmethod
+    def get_key(fingerprint, universe_fingerprint, protocol):
+        """Build the key for the result of running a protocol.
+
+        :param str fingerprint: The fingerprint of the seed graph
+        :param Optional[str] universe_fingerprint: The fingerprint of the universe, if the protocol uses it
+        :param list[dict] protocol: The protocol, as JSON
+        :return: A hash of the arguments, or None if the protocol can't be serialized to JSON
+        :rtype: Optional[str]
+        """
+        try:
+            protocol_json = json.dumps(protocol, sort_keys=True)
+        except (TypeError, ValueError):  # functions given as arguments, for example
+            return
+
+        key = '{}\n{}\n{}'.format(fingerprint, universe_fingerprint, protocol_json)
+        return hashlib.sha256(key.encode('utf8')).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, '{}.gpickle'.format(key))
+
+    def get(self, key):
+        """Get the result with the given key, if it's cached.
+
+        The result must not be modified, since it's shared with the cache.
+
+        :param str key: A key from :meth:`get_key`
+        :rtype: Optional[pybel.BELGraph]
+        """
+        graph = self._memory.pop(key, None)
+
+        if graph is not None:
+            self._memory[key] = graph  # mark it as the most recently used
+            self.hits += 1
+            return graph
+
+        if self.directory is not None:
+            path = self._get_path(key)
+
+            if os.path.exists(path):
+                with open(path, 'rb') as file:
+                    graph = pickle.load(file)
+
+                os.remove(path)
+                self.hits += 1
+                self.set(key, graph)
+                return graph
+
+        self.misses += 1
+
+    def set(self, key, graph):
+        """Cache a result.
+
+        The result must not be modified afterwards, since it's shared with the cache.
+
+        :param str key: A key from :meth:`get_key`
+        :param pybel.BELGraph graph: The result of running a pipeline
+        """
+        self._memory.pop(key, None)
+        self._memory[key] = graph
+
+        while len(self._memory) > self.max_size:
+            evicted_key, evicted_graph = self._memory.popitem(last=False)
+
+            if self.directory is not None:
+                self._dump(evicted_key, evicted_graph)
+
+    def _dump(self, key, graph):
+        """Pickle a result evicted from memory to the directory, evicting the least recently used ones there."""
+        with open(self._get_path(key), 'wb') as file:
+            pickle.dump(materialize(graph), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        paths = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith('.gpickle')
+        ]
+
+        if len(paths) <= self.max_disk_size:
+            return
+
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_disk_size]:
+            log.debug('evicting %s from the pipeline cache', path)
+            os.remove(path)
+
+    def clear(self):
+        """Remove all results from memory and from the directory."""
+        self._memory.clear()
+
+        if self.directory is None:
+            return
+
+        for name in os.listdir(self.directory):
+            if name.endswith('.gpickle'):
+                os.remove(os.path.join(self.directory, name))
@@ -21,6 +21,10 @@ __all__ = [
     'uni_transformation',
     'transformation',
     'register_deprecated',
+    'register_pure',
+    'is_pure',
+    'register_node_filter',
+    'register_edge_filter',
     'get_transformation',
     'mapped',
     'has_arguments_map',
@@ -35,6 +39,9 @@ in_place_map = {}
 has_arguments_map = {}
 no_arguments_map = {}
 deprecated = {}
+pure_map = {}
+node_filter_map = {}
+edge_filter_map = {}
 
 
 def _has_arguments(func, universe):
@@ -143,6 +150,85 @@ def register_deprecated(deprecated_name):
     return register_deprecated_f
 
 
+def register_pure(func):
+    """Register a transformation function as pure, so its results can be cached by pipelines.
+
+    A function is pure if its result only depends on the graph, the universe, and the arguments it's given. Functions
+    that use randomness or external resources shouldn't be registered.
+
+    :param func: A transformation function
+    :return: The same function
+    :raises MissingPipelineFunctionError: If the function isn't registered as a transformation
+
+    Usage:
+
+    This function must be applied after the transformation decorator
+
+    >>> @register_pure
+    >>> @transformation
+    >>> def my_function()
+    >>> ... pass
+    """
+    name = func.__name__
+
+    if name not in mapped:
+        raise MissingPipelineFunctionError('function not mapped with transformation, uni_transformation, etc.')
+
+    pure_map[name] = func
+
+    return func
+
+
+def is_pure(name):
+    """Check if the transformation function registered under the given name (or deprecated name) is pure.
+
+    :param str name: The name of a function
+    :rtype: bool
+    """
+    func = mapped.get(name)
+    return func is not None and pure_map.get(func.__name__) is func
+
+
+def _build_register_filter(filter_map):
+    """Build a decorator function to tag in-place transformation functions that remove the nodes or edges passing
+    some predicates.
+
+    :param dict filter_map: The dictionary in which to register the predicates
+    """
+
+    def register_filter(*predicates):
+        """Build a decorator to tag an in-place transformation function as a filter.
+
+        :param predicates: The predicates that nodes or edges must all pass to be removed. If none are given, they're
+         the argument after the graph, like in :func:`pybel.struct.mutation.remove_filtered_nodes`.
+        :return: A decorator
+        """
+
+        def register_filter_f(func):
+            name = func.__name__
+
+            if name not in in_place_map:
+                raise MissingPipelineFunctionError('function not mapped with in_place_transformation')
+
+            filter_map[name] = predicates
+
+            return func
+
+        return register_filter_f
+
+    return register_filter
+
+
+#: A decorator for in-place transformation functions that only remove the nodes passing the given node predicates, so
+#: pipelines can fuse them with other filters. Like :func:`register_pure`, it must be applied after the transformation
+#: decorator.
+register_node_filter = _build_register_filter(node_filter_map)
+#: A decorator for in-place transformation functions that only remove the edges passing the given edge predicates, so
+#: pipelines can fuse them with other filters. Like :func:`register_pure`, it must be applied after the transformation
+#: decorator.
+register_edge_filter = _build_register_filter(edge_filter_map)
+
+
 def get_transformation(name):
     """Get a transformation function and error if its name is not registered.
 
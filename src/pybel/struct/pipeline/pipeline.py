@@ -2,14 +2,22 @@
 
 """This module holds the Pipeline class."""
 
+from __future__ import print_function
+
 import json
 import logging
 import types
 from functools import wraps
+from multiprocessing import Pool
+
+import networkx as nx
+from six.moves import cPickle as pickle
 
-from .decorators import get_transformation, in_place_map, mapped, universe_map
+from .decorators import get_transformation, in_place_map, is_pure, mapped, universe_map
 from .exc import MetaValueError, MissingPipelineFunctionError, MissingUniverseError
-from ..operations import node_intersection, union
+from .planner import FUSED_FILTER_NAME, explain_protocol, optimize_protocol
+from .profiling import PipelineProfile
+from ..operations import materialize, node_intersection, subgraph_view, union
 
 
 __all__ = [
@@ -21,6 +29,14 @@ log = logging.getLogger(__name__)
 META_UNION = 'union'
 META_INTERSECTION = 'intersection'
 
+#: The number of edges a graph needs before the pipelines of meta-commands are run in parallel, since it isn't worth
+#: starting processes and pickling the results for smaller graphs
+PARALLEL_MIN_EDGES = 5000
+
+# The seed graph and universe in worker processes, which are only shipped once per process
+_worker_graph = None
+_worker_universe = None
+
 
 def _get_protocol_tuple(data):
     """Convert a dictionary to a tuple.
@@ -31,6 +47,88 @@ def _get_protocol_tuple(data):
     return data['function'], data.get('args', []), data.get('kwargs', {})
 
 
+def _get_entry_name(entry):
+    """Get the name of the function or meta-command of an entry in a protocol.
+
+    :param dict entry: An entry in a protocol, as JSON
+    :rtype: str
+    """
+    return entry.get('meta') or entry['function']
+
+
+def _is_pure_entry(entry):
+    """Check if an entry in a protocol only uses pure functions.
+
+    :param dict entry: An entry in a protocol, as JSON
+    :rtype: bool
+    """
+    if 'meta' in entry:
+        return all(
+            _is_pure_entry(subentry)
+            for subprotocol in entry['pipelines']
+            for subentry in subprotocol
+        )
+
+    if entry['function'] == FUSED_FILTER_NAME:  # fused filters are only pure if all of the filters are
+        kwargs = entry.get('kwargs', {})
+        return all(
+            _is_pure_entry(filter_entry)
+            for filter_entry in kwargs.get('node_filters', []) + kwargs.get('edge_filters', [])
+        )
+
+    return is_pure(entry['function'])
+
+
+def _uses_universe(protocol):
+    """Check if a protocol uses any functions that need the universe.
+
+    :param list[dict] protocol: A protocol, as JSON
+    :rtype: bool
+    """
+    for entry in protocol:
+        if 'meta' in entry:
+            if any(_uses_universe(subprotocol) for subprotocol in entry['pipelines']):
+                return True
+
+        elif entry['function'] in universe_map:
+            return True
+
+    return False
+
+
+def _init_worker(graph, universe):
+    """Set the seed graph and universe in a worker process.
+
+    :param pybel.BELGraph graph: The seed graph
+    :param pybel.BELGraph universe: The universe
+    """
+    global _worker_graph, _worker_universe
+    _worker_graph, _worker_universe = graph, universe
+
+
+def _run_worker(protocol):
+    """Run a protocol on the seed graph and universe of a worker process.
+
+    :param list[dict] protocol: A protocol, as JSON
+    :rtype: pybel.BELGraph
+    """
+    return Pipeline(protocol).run(_worker_graph, universe=_worker_universe)
+
+
+def _is_picklable(protocols):
+    """Check if protocols can be sent to worker processes, which they can't if they have lambdas as arguments.
+
+    :param list[list[dict]] protocols: Protocols, as JSON
+    :rtype: bool
+    """
+    try:
+        pickle.dumps(protocols, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+    return True
+
+
 class Pipeline:
     """Builds and runs analytical pipelines on BEL graphs.
 
@@ -53,6 +151,20 @@ class Pipeline:
         self.universe = None
         self.protocol = protocol or []
 
+        #: The number of times the last run copied a graph
+        self.copies = 0
+        #: The number of times the last run avoided copying a graph
+        self.copies_avoided = 0
+        #: The measurements of each step of the last run, if it was profiled
+        self.profile = None
+
+        # The number of processes in which to run the pipelines of meta-commands during the current run
+        self._processes = None
+
+        # The intermediate graph that was built during the current run and isn't shared with anything else, so in-place
+        # transformations can modify it without copying it first
+        self._owned_graph = None
+
     def __len__(self):
         return len(self.protocol)
 
@@ -167,59 +279,260 @@ class Pipeline:
 
         return self
 
-    def _run_helper(self, graph, protocol):
+    def _run_helper(self, graph, protocol, profile=None):
         """Help run the protocol.
 
         :param pybel.BELGraph graph: A BEL graph
         :param list[dict] protocol: The protocol to run, as JSON
+        :param Optional[PipelineProfile] profile: A profile in which to record the measurements of each entry
         :rtype: pybel.BELGraph
         """
         result = graph
+        self._owned_graph = None
 
         for entry in protocol:
-            meta_entry = entry.get('meta')
+            result = self._run_step(graph, result, entry, profile)
+
+        return result
+
+    def _run_step(self, graph, result, entry, profile=None):
+        """Run one entry of a protocol, measuring it if a profile is given.
+
+        :param pybel.BELGraph graph: The graph the protocol started with, which meta-commands are run on
+        :param pybel.BELGraph result: The result of the previous entries
+        :param dict entry: The entry to run, as JSON
+        :param Optional[PipelineProfile] profile: A profile in which to record the measurements of the entry
+        :rtype: pybel.BELGraph
+        """
+        if profile is None:
+            return self._run_entry(graph, result, entry)
+
+        return profile.measure(
+            _get_entry_name(entry),
+            lambda previous: self._run_entry(graph, previous, entry),
+            result,
+        )
 
-            if meta_entry is None:
-                name, args, kwargs = _get_protocol_tuple(entry)
-                func = self._get_function(name)
-                result = func(result, *args, **kwargs)
-            else:
-                networks = (
-                    self._run_helper(graph, subprotocol)
-                    for subprotocol in entry['pipelines']
-                )
+    def _own(self, graph):
+        """Get a graph that in-place transformations can modify, copying the given graph if it isn't owned.
 
-                if meta_entry == META_UNION:
-                    result = union(networks)
+        :param pybel.BELGraph graph: The result of the previous entries
+        :rtype: pybel.BELGraph
+        """
+        if graph is self._owned_graph:
+            self.copies_avoided += 1
+            return graph
 
-                elif meta_entry == META_INTERSECTION:
-                    result = node_intersection(networks)
+        self.copies += 1
+        self._owned_graph = graph.fast_copy()
+        return self._owned_graph
 
-                else:
-                    raise MetaValueError('invalid meta-command: {}'.format(meta_entry))
+    def _set_result(self, previous, result):
+        """Keep track of whether the result of an entry is owned.
+
+        Graphs returned by transformations are owned unless they are the previous result and it wasn't owned, or
+        they're read-only, like the views of the seed graph and universe.
+
+        :param Optional[pybel.BELGraph] previous: The result of the previous entries, or None for meta-commands
+        :param pybel.BELGraph result: The result of the current entry
+        :rtype: pybel.BELGraph
+        """
+        if result is not previous:
+            self._owned_graph = None if nx.is_frozen(result) else result
+
+        return result
+
+    def _run_entry(self, graph, result, entry):
+        """Run one entry of a protocol.
+
+        :param pybel.BELGraph graph: The graph the protocol started with, which meta-commands are run on
+        :param pybel.BELGraph result: The result of the previous entries
+        :param dict entry: The entry to run, as JSON
+        :rtype: pybel.BELGraph
+        """
+        meta_entry = entry.get('meta')
+
+        if meta_entry is None:
+            name, args, kwargs = _get_protocol_tuple(entry)
+            func = self._get_function(name)
+
+            if name in in_place_map:
+                result = self._own(result)
+
+            return self._set_result(result, func(result, *args, **kwargs))
+
+        subprotocols = entry['pipelines']
+
+        if self._can_run_parallel(graph, subprotocols):
+            networks = self._run_parallel(graph, subprotocols)
+        else:
+            networks = (
+                self._run_helper(graph, subprotocol)
+                for subprotocol in subprotocols
+            )
+
+        if meta_entry == META_UNION:
+            return self._set_result(None, union(networks))
+
+        if meta_entry == META_INTERSECTION:
+            return self._set_result(None, node_intersection(networks))
+
+        raise MetaValueError('invalid meta-command: {}'.format(meta_entry))
+
+    def _can_run_parallel(self, graph, protocols):
+        """Check if the pipelines of a meta-command should be run in worker processes.
+
+        :param pybel.BELGraph graph: The graph the pipelines are run on
+        :param list[list[dict]] protocols: The pipelines of a meta-command, as JSON
+        :rtype: bool
+        """
+        return (
+            self._processes is not None and
+            1 < self._processes and
+            1 < len(protocols) and
+            PARALLEL_MIN_EDGES <= graph.number_of_edges() and
+            _is_picklable(protocols)
+        )
+
+    def _run_parallel(self, graph, protocols):
+        """Run each pipeline of a meta-command on the graph in a separate worker process.
+
+        The graph and universe are sent to each worker process once, when it starts. On platforms that fork new
+        processes, this doesn't even need to pickle them.
+
+        :param pybel.BELGraph graph: The graph the pipelines are run on
+        :param list[list[dict]] protocols: The pipelines of a meta-command, as JSON
+        :return: The results of the pipelines, in the same order
+        :rtype: list[pybel.BELGraph]
+        """
+        pool = Pool(min(self._processes, len(protocols)), initializer=_init_worker, initargs=(graph, self.universe))
+        try:
+            return pool.map(_run_worker, protocols, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _run_cached(self, graph, universe, cache, profile=None):
+        """Run the protocol, getting and storing the results of its longest pure prefix in the cache.
+
+        :param pybel.BELGraph graph: The seed graph, whose fingerprint is memoized until it's modified
+        :param Optional[pybel.BELGraph] universe: The universe, if one was given
+        :param pybel.struct.pipeline.PipelineCache cache: A cache
+        :param Optional[PipelineProfile] profile: A profile in which to record the measurements of each entry that
+         isn't in the cache
+        :rtype: pybel.BELGraph
+        """
+        n_pure = 0
+        for entry in self.protocol:
+            if not _is_pure_entry(entry):
+                break
+            n_pure += 1
+
+        fingerprint = graph.get_fingerprint()
+        universe_fingerprint = universe.get_fingerprint() if universe is not None else None
+        graph = subgraph_view(graph)
+
+        keys = [
+            cache.get_key(
+                fingerprint,
+                universe_fingerprint if _uses_universe(self.protocol[:i]) else None,
+                self.protocol[:i],
+            )
+            for i in range(1, n_pure + 1)
+        ]
+
+        result, start = graph, 0
+
+        # start from the result of the longest prefix in the cache
+        for i in range(n_pure, 0, -1):
+            key = keys[i - 1]
+            if key is None:
+                continue
+
+            cached = cache.get(key)
+            if cached is not None:
+                result, start = subgraph_view(cached), i
+                break
+
+        for i in range(start, len(self.protocol)):
+            result = self._run_step(graph, result, self.protocol[i], profile)
+
+            if i < n_pure and keys[i] is not None:
+                if result is not self._owned_graph:
+                    self.copies += 1
+                    result = result.fast_copy()
+
+                cache.set(keys[i], result)
+                # later in-place transformations copy the view instead of changing the cached graph
+                result = subgraph_view(result)
+                self._owned_graph = None
 
         return result
 
-    def run(self, graph, universe=None):
+    def run(self, graph, universe=None, cache=None, processes=None, profile=False):
         """Run the contained protocol on a seed graph.
 
+        Neither the seed graph nor the universe are copied up front. Instead, the protocol starts with read-only views
+        of them (see :func:`pybel.struct.operations.subgraph_view`), and the run keeps track of which intermediate
+        graph it owns. In-place transformations modify the owned graph directly, and only copy the graph if it's
+        shared, like the seed graph before the first in-place transformation, so pipelines made of transformations
+        that build new graphs don't copy anything. Afterwards, :attr:`copies` and :attr:`copies_avoided` tell how many
+        graphs were copied and how many copies were avoided.
+
+        If a cache is given, the results of the longest prefix of the protocol made of pure functions (see
+        :func:`pybel.struct.pipeline.register_pure`) are stored in it after each step, and the protocol starts from the
+        result of the longest prefix that's already in it.
+
         :param pybel.BELGraph graph: The seed BEL graph
         :param pybel.BELGraph universe: Allows just-in-time setting of the universe in case it wasn't set before.
                                         Defaults to the given network.
-        :param bool in_place: Should the graph be copied before applying the algorithm?
-        :return: The new graph is returned if not applied in-place
+        :param Optional[pybel.struct.pipeline.PipelineCache] cache: A cache for the results of pure prefixes
+        :param Optional[int] processes: If given and more than one, the pipelines of unions and intersections are run
+         in up to this many processes, as long as the graph has at least :data:`PARALLEL_MIN_EDGES` edges and their
+         arguments can be pickled.
+        :param profile: If true, measures each entry in the protocol and keeps the measurements in :attr:`profile`.
+         Can also be a :class:`pybel.struct.pipeline.PipelineProfile` to add them to.
+        :type profile: bool or pybel.struct.pipeline.PipelineProfile
+        :return: A new graph. The seed graph and universe are not modified.
         :rtype: pybel.BELGraph
         """
-        self.universe = universe or graph.copy()
-        return self._run_helper(graph.copy(), self.protocol)
+        self.universe = subgraph_view(universe or graph)
+        self._processes = processes
+        self.copies = 0
+        # the universe used to be copied when it wasn't given
+        self.copies_avoided = 1 if universe is None else 0
+
+        if isinstance(profile, PipelineProfile):
+            self.profile = profile
+        else:
+            self.profile = PipelineProfile() if profile else None
+
+        if cache is None:
+            result = self._run_helper(subgraph_view(graph), self.protocol, profile=self.profile)
+        else:
+            result = self._run_cached(graph, universe, cache, profile=self.profile)
+
+        if result is self._owned_graph:
+            self.copies_avoided += 1
+        else:
+            self.copies += 1
+            result = result.fast_copy()
 
-    def __call__(self, graph, universe=None):
+        self._owned_graph = None
+
+        log.debug('ran pipeline with %d copies (%d avoided)', self.copies, self.copies_avoided)
+
+        return result
+
+    def __call__(self, graph, universe=None, cache=None, processes=None, profile=False):
         """Call :meth:`Pipeline.run`.
 
         :param pybel.BELGraph graph: The seed BEL graph
         :param pybel.BELGraph universe: Allows just-in-time setting of the universe in case it wasn't set before.
                                         Defaults to the given network.
-        :param bool in_place: Should the graph be copied before applying the algorithm?
+        :param Optional[pybel.struct.pipeline.PipelineCache] cache: A cache for the results of pure prefixes
+        :param Optional[int] processes: The number of processes in which to run the pipelines of meta-commands
+        :param bool profile: If true, measures each entry in the protocol and keeps the measurements in :attr:`profile`
         :return: The new graph is returned if not applied in-place
         :rtype: pybel.BELGraph
 
@@ -232,7 +545,7 @@ class Pipeline:
         >>> graph = BELGraph() ...
         >>> new_graph = pipe(graph)
         """
-        return self.run(graph=graph, universe=universe)
+        return self.run(graph=graph, universe=universe, cache=cache, processes=processes, profile=profile)
 
     def _wrap_universe(self, func):
         """Take a function that needs a universe graph as the first argument and returns a wrapped one."""
@@ -254,12 +567,42 @@ class Pipeline:
 
         @wraps(func)
         def wrapper(graph, *args, **kwargs):
-            """Applies the enclosed function and returns the graph"""
+            """Applies the enclosed function and returns the graph, copying it first if it's a read-only view"""
+            graph = materialize(graph)
             func(graph, *args, **kwargs)
             return graph
 
         return wrapper
 
+    def optimize(self):
+        """Build a pipeline that gives the same result with fewer iterations over the graph.
+
+        Consecutive transformations that only remove nodes or edges, like
+        :func:`pybel.struct.mutation.remove_pathologies` and :func:`pybel.struct.mutation.remove_associations`, are
+        fused into one step that checks all of their predicates in a single pass. See
+        :mod:`pybel.struct.pipeline.planner` for the predicates this is valid for.
+
+        :rtype: Pipeline
+
+        >>> from pybel.struct.pipeline import Pipeline
+        >>> pipeline = Pipeline.from_functions(['remove_pathologies', 'remove_associations']).optimize()
+        """
+        return Pipeline(optimize_protocol(self.protocol))
+
+    def explain(self):
+        """Describe how this pipeline will be run after :meth:`optimize`.
+
+        :rtype: str
+        """
+        return '\n'.join(explain_protocol(self.protocol))
+
+    def print_explain(self, file=None):
+        """Print how this pipeline will be run after :meth:`optimize`.
+
+        :param file: A writeable file or file-like object. If None, defaults to :data:`sys.stdout`
+        """
+        print(self.explain(), file=file)
+
     def to_json(self):
         """Return this pipeline as a JSON list.
 
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+"""Functions for planning how to run protocols.
+
+Transformations that only remove the nodes or edges passing some predicates are registered with
+:func:`pybel.struct.pipeline.register_node_filter` and :func:`pybel.struct.pipeline.register_edge_filter`. Each of them
+iterates over all of the nodes or edges in the graph, so the planner replaces runs of consecutive filters with a single
+call to :func:`remove_fused_filters`, which iterates over them once. The fused entry keeps the names and arguments of
+the filters, so the optimized protocol can still be serialized to JSON.
+
+This assumes the predicates only depend on the node or edge they're given, and not on the rest of the graph, since the
+removals from one filter are no longer visible to the next one. Predicates like
+:func:`pybel.struct.filters.node_predicates.has_causal_in_edges` that look at the neighborhood of a node shouldn't be
+used in pipelines that get optimized.
+"""
+
+try:
+    from inspect import signature
+except ImportError:
+    from funcsigs import signature
+
+from .decorators import edge_filter_map, in_place_transformation, mapped, node_filter_map, register_pure
+
+__all__ = [
+    'optimize_protocol',
+    'explain_protocol',
+    'remove_fused_filters',
+]
+
+FUSED_FILTER_NAME = 'remove_fused_filters'
+
+
+def _get_filter_predicates(filter_map, entry):
+    """Get the predicates of an entry in a protocol that's a registered filter.
+
+    :param dict filter_map: Either the node or edge filter map
+    :param dict entry: An entry in a protocol, as JSON
+    :return: The predicates nodes or edges must all pass to be removed
+    """
+    func = mapped[entry['function']]
+    predicates = filter_map[func.__name__]
+
+    if predicates:
+        return list(predicates)
+
+    # the predicates are the argument after the graph
+    parameter = list(signature(func).parameters)[1]
+    arguments = signature(func).bind(None, *entry.get('args', []), **entry.get('kwargs', {})).arguments
+    return arguments.get(parameter)
+
+
+def _is_filter(entry):
+    """Check if an entry in a protocol is a registered node or edge filter.
+
+    :param dict entry: An entry in a protocol, as JSON
+    :rtype: bool
+    """
+    if 'meta' in entry:
+        return False
+
+    func = mapped.get(entry['function'])
+    return func is not None and (func.__name__ in node_filter_map or func.__name__ in edge_filter_map)
+
+
+def _is_node_filter(entry):
+    """Check if an entry in a protocol is a registered node filter.
+
+    :param dict entry: An entry in a protocol, as JSON
+    :rtype: bool
+    """
+    return mapped[entry['function']].__name__ in node_filter_map
+
+
+def _iter_groups(protocol):
+    """Group the runs of consecutive filters in a protocol.
+
+    :param list[dict] protocol: A protocol, as JSON
+    :return: An iterable of lists of entries. Lists with more than one entry are runs of filters.
+    :rtype: iter[list[dict]]
+    """
+    run = []
+
+    for entry in protocol:
+        if _is_filter(entry):
+            run.append(entry)
+            continue
+
+        if run:
+            yield run
+            run = []
+
+        yield [entry]
+
+    if run:
+        yield run
+
+
+@register_pure
+@in_place_transformation
+def remove_fused_filters(graph, node_filters=None, edge_filters=None):
+    """Remove the nodes and edges that the given filters would remove, iterating over them once.
+
+    The filters are looked up by their names in the functions registered with
+    :func:`pybel.struct.pipeline.register_node_filter` and :func:`pybel.struct.pipeline.register_edge_filter`, then
+    run together with :func:`pybel.struct.mutation.remove_filtered_nodes_and_edges`.
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param Optional[list[dict]] node_filters: Entries in a protocol, as JSON, that are registered node filters
+    :param Optional[list[dict]] edge_filters: Entries in a protocol, as JSON, that are registered edge filters
+    """
+    from ..mutation import remove_filtered_nodes_and_edges
+
+    remove_filtered_nodes_and_edges(
+        graph,
+        node_filters=[_get_filter_predicates(node_filter_map, entry) for entry in node_filters or []],
+        edge_filters=[_get_filter_predicates(edge_filter_map, entry) for entry in edge_filters or []],
+    )
+
+
+def _fuse_filters(entries):
+    """Build an entry that calls :func:`remove_fused_filters` once for many filters.
+
+    :param list[dict] entries: Entries in a protocol that are registered filters
+    :rtype: dict
+    """
+    node_filters, edge_filters = [], []
+
+    for entry in entries:
+        if _is_node_filter(entry):
+            node_filters.append(entry)
+        else:
+            edge_filters.append(entry)
+
+    return {
+        'function': FUSED_FILTER_NAME,
+        'kwargs': {
+            'node_filters': node_filters,
+            'edge_filters': edge_filters,
+        },
+    }
+
+
+def optimize_protocol(protocol):
+    """Build a protocol that gives the same result with fewer iterations over the graph by fusing consecutive filters.
+
+    :param list[dict] protocol: A protocol, as JSON
+    :rtype: list[dict]
+    """
+    rv = []
+
+    for group in _iter_groups(protocol):
+        if 1 < len(group):
+            rv.append(_fuse_filters(group))
+            continue
+
+        entry = group[0]
+
+        if 'meta' in entry:
+            entry = dict(entry)
+            entry['pipelines'] = [
+                optimize_protocol(subprotocol)
+                for subprotocol in entry['pipelines']
+            ]
+
+        rv.append(entry)
+
+    return rv
+
+
+def explain_protocol(protocol, indent=0):
+    """Describe how a protocol will be run after optimization, one line per step.
+
+    :param list[dict] protocol: A protocol, as JSON
+    :param int indent: The number of spaces before each line
+    :rtype: list[str]
+    """
+    lines = []
+    prefix = ' ' * indent
+
+    for i, group in enumerate(_iter_groups(protocol), start=1):
+        entry = group[0]
+
+        if 1 < len(group):
+            lines.append('{}{}. fused filter in one pass ({} steps):'.format(prefix, i, len(group)))
+            lines.extend(
+                '{}   - {}'.format(prefix, filter_entry['function'])
+                for filter_entry in group
+            )
+
+        elif 'meta' in entry:
+            lines.append('{}{}. {} of {} pipelines:'.format(prefix, i, entry['meta'], len(entry['pipelines'])))
+            for subprotocol in entry['pipelines']:
+                lines.extend(explain_protocol(subprotocol, indent=indent + 3))
+
+        else:
+            lines.append('{}{}. {}'.format(prefix, i, entry['function']))
+
+    return lines
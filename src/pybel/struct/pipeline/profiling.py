@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+"""Per-step measurements of running pipelines and queries.
+
+Running a pipeline with ``profile=True`` records the wall time, CPU time, memory, and size of the graph for each entry
+in its protocol:
+
+>>> from pybel.examples import egf_graph
+>>> from pybel.struct.pipeline import Pipeline
+>>> pipeline = Pipeline.from_functions(['enrich_protein_and_rna_origins', 'prune_protein_rna_origins'])
+>>> result = pipeline.run(egf_graph, profile=True)
+>>> print(pipeline.profile.to_table())
+"""
+
+import time
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+__all__ = [
+    'StepProfile',
+    'PipelineProfile',
+]
+
+try:
+    _get_cpu_time = time.process_time
+except AttributeError:  # Python 2
+    _get_cpu_time = time.clock
+
+_TABLE_HEADER = ('#', 'step', 'wall (s)', 'cpu (s)', 'memory (KiB)', 'nodes', 'edges')
+
+
+class StepProfile(object):
+    """The measurements from running one step of a pipeline or query."""
+
+    def __init__(self, name, wall_time, cpu_time, memory, nodes_before, edges_before, nodes_after, edges_after):
+        """Build a step profile.
+
+        :param str name: The name of the step, like the function of a protocol entry
+        :param float wall_time: The elapsed time in seconds
+        :param float cpu_time: The CPU time of this process in seconds
+        :param Optional[int] memory: The peak memory allocated while running the step in bytes, more than was
+         allocated before, or None if it couldn't be measured
+        :param Optional[int] nodes_before: The number of nodes in the graph before the step, if it had one
+        :param Optional[int] edges_before: The number of edges in the graph before the step, if it had one
+        :param int nodes_after: The number of nodes in the graph after the step
+        :param int edges_after: The number of edges in the graph after the step
+        """
+        self.name = name
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.memory = memory
+        self.nodes_before = nodes_before
+        self.edges_before = edges_before
+        self.nodes_after = nodes_after
+        self.edges_after = edges_after
+
+    def to_json(self):
+        """Return this step profile as a JSON object.
+
+        :rtype: dict
+        """
+        return {
+            'name': self.name,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'memory': self.memory,
+            'nodes_before': self.nodes_before,
+            'edges_before': self.edges_before,
+            'nodes_after': self.nodes_after,
+            'edges_after': self.edges_after,
+        }
+
+    @staticmethod
+    def from_json(data):
+        """Load a step profile from a JSON object.
+
+        :param dict data: A JSON object from :meth:`to_json`
+        :rtype: StepProfile
+        """
+        return StepProfile(**data)
+
+
+class PipelineProfile(object):
+    """The measurements from running each step of a pipeline or query."""
+
+    def __init__(self, steps=None, measure_memory=True):
+        """Build a profile.
+
+        :param Optional[list[StepProfile]] steps: Steps that were already measured
+        :param bool measure_memory: Should the memory allocated by each step be measured with :mod:`tracemalloc`? This
+         makes the steps slower, and is skipped on Python 2 or if something else is already tracing memory.
+        """
+        self.steps = steps or []
+        self.measure_memory = measure_memory
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def measure(self, name, func, graph=None):
+        """Run a step and record its measurements.
+
+        :param str name: The name of the step
+        :param func: A function that takes the graph and returns the resulting graph
+        :type func: (Optional[pybel.BELGraph]) -> pybel.BELGraph
+        :param Optional[pybel.BELGraph] graph: The graph before the step, if it has one
+        :return: The result of the function
+        :rtype: pybel.BELGraph
+        """
+        trace_memory = self.measure_memory and tracemalloc is not None and not tracemalloc.is_tracing()
+
+        if trace_memory:
+            tracemalloc.start()
+
+        nodes_before = graph.number_of_nodes() if graph is not None else None
+        edges_before = graph.number_of_edges() if graph is not None else None
+
+        wall_start, cpu_start = time.time(), _get_cpu_time()
+
+        try:
+            result = func(graph)
+        finally:
+            wall_time, cpu_time = time.time() - wall_start, _get_cpu_time() - cpu_start
+
+            memory = None
+            if trace_memory:
+                memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+        self.steps.append(StepProfile(
+            name=name,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            memory=memory,
+            nodes_before=nodes_before,
+            edges_before=edges_before,
+            nodes_after=result.number_of_nodes() if result is not None else None,
+            edges_after=result.number_of_edges() if result is not None else None,
+        ))
+
+        return result
+
+    @property
+    def wall_time(self):
+        """The total elapsed time of the steps in seconds.
+
+        :rtype: float
+        """
+        return sum(step.wall_time for step in self.steps)
+
+    @property
+    def cpu_time(self):
+        """The total CPU time of the steps in seconds.
+
+        :rtype: float
+        """
+        return sum(step.cpu_time for step in self.steps)
+
+    def get_slowest_step(self):
+        """Get the step that took the longest.
+
+        :rtype: Optional[StepProfile]
+        """
+        if not self.steps:
+            return
+
+        return max(self.steps, key=lambda step: step.wall_time)
+
+    def to_json(self):
+        """Return this profile as a JSON object.
+
+        :rtype: dict
+        """
+        return {
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'steps': [
+                step.to_json()
+                for step in self.steps
+            ],
+        }
+
+    @staticmethod
+    def from_json(data):
+        """Load a profile from a JSON object.
+
+        :param dict data: A JSON object from :meth:`to_json`
+        :rtype: PipelineProfile
+        """
+        return PipelineProfile(steps=[
+            StepProfile.from_json(step)
+            for step in data['steps']
+        ])
+
+    def to_table(self):
+        """Render this profile as a plain text table, with one row per step and one for the totals.
+
+        :rtype: str
+        """
+        rows = [
+            (
+                str(i),
+                step.name,
+                '{:.4f}'.format(step.wall_time),
+                '{:.4f}'.format(step.cpu_time),
+                '' if step.memory is None else '{:.1f}'.format(step.memory / 1024.0),
+                _format_change(step.nodes_before, step.nodes_after),
+                _format_change(step.edges_before, step.edges_after),
+            )
+            for i, step in enumerate(self.steps, start=1)
+        ]
+        rows.append(('', 'total', '{:.4f}'.format(self.wall_time), '{:.4f}'.format(self.cpu_time), '', '', ''))
+
+        widths = [
+            max(len(row[i]) for row in [_TABLE_HEADER] + rows)
+            for i in range(len(_TABLE_HEADER))
+        ]
+
+        lines = [
+            '  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in [_TABLE_HEADER] + rows
+        ]
+        lines.insert(1, '  '.join('-' * width for width in widths))
+
+        return '\n'.join(lines)
+
+
+def _format_change(before, after):
+    """Format how a count changed during a step.
+
+    :param Optional[int] before: The count before the step
+    :param Optional[int] after: The count after the step
+    :rtype: str
+    """
+    if after is None:
+        return ''
+
+    if before is None:
+        return str(after)
+
+    return '{} -> {}'.format(before, after)
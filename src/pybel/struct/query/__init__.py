@@ -2,6 +2,7 @@
 
 """Query builder for PyBEL."""
 
+from .batch import run_queries
 from .exc import *
 from .query import Query
 from .seeding import SEED_DATA, SEED_METHOD, Seeding
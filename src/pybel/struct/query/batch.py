@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""Run many queries at once, sharing the universes of the ones over the same networks.
+
+Each :meth:`pybel.struct.query.Query.run` loads its networks from the database and takes their union, which is
+usually the slowest part of running a query. :func:`run_queries` groups the queries by their networks, builds each
+universe once, then runs the seeding and pipeline of each query in the group on it.
+"""
+
+import logging
+from collections import OrderedDict
+from multiprocessing import Pool
+
+from ..operations import subgraph_view
+from ..pipeline import Pipeline
+from ..pipeline import pipeline as pipeline_module
+
+__all__ = [
+    'run_queries',
+]
+
+log = logging.getLogger(__name__)
+
+# The universe in worker processes, which is only shipped once per process
+_worker_universe = None
+
+
+def _init_worker(universe):
+    """Set the universe in a worker process.
+
+    :param pybel.BELGraph universe: The universe
+    """
+    global _worker_universe
+    _worker_universe = universe
+
+
+def _run_worker(task):
+    """Run the seeding and protocol of a query on the universe of a worker process.
+
+    :param tuple[pybel.struct.query.Seeding,list[dict]] task: The seeding and protocol of a query
+    :rtype: Optional[pybel.BELGraph]
+    """
+    seeding, protocol = task
+    return _run_on_universe(_worker_universe, seeding, protocol)
+
+
+def _run_on_universe(universe, seeding, protocol):
+    """Run the seeding and protocol of a query on an already built universe.
+
+    :param pybel.BELGraph universe: The universe
+    :param pybel.struct.query.Seeding seeding: The seeding of a query
+    :param list[dict] protocol: The protocol of the pipeline of a query, as JSON
+    :rtype: Optional[pybel.BELGraph]
+    """
+    graph = seeding.run(universe)
+
+    if graph is None:
+        return
+
+    return Pipeline(protocol).run(graph, universe=universe)
+
+
+def _group_queries(queries):
+    """Group the positions of queries by their networks, in the order the networks first appear.
+
+    The order of the networks in each query doesn't matter, since their union is the same.
+
+    :param list[pybel.struct.query.Query] queries: Queries
+    :rtype: OrderedDict[tuple[int],list[int]]
+    """
+    rv = OrderedDict()
+
+    for i, query in enumerate(queries):
+        rv.setdefault(tuple(sorted(set(query.network_ids))), []).append(i)
+
+    return rv
+
+
+def run_queries(queries, manager, processes=None):
+    """Run many queries, building the universe for each combination of networks only once.
+
+    :param iter[pybel.struct.query.Query] queries: Queries
+    :param pybel.manager.Manager manager: A cache manager
+    :param Optional[int] processes: If given and more than one, the queries over each universe are run in up to this
+     many processes, as long as the universe has at least :data:`pybel.struct.pipeline.pipeline.PARALLEL_MIN_EDGES`
+     edges and the queries' arguments can be pickled.
+    :return: The result of each query, in the same order
+    :rtype: list[Optional[pybel.BELGraph]]
+    :raises QueryMissingNetworksError: If any query doesn't have networks
+
+    Example usage:
+
+    >>> from pybel.manager import Manager
+    >>> from pybel.struct.query import Query, run_queries
+    >>> manager = Manager()
+    >>> queries = [Query(network_ids=[1, 2]), Query(network_ids=[1, 2]), Query(network_ids=[3])]
+    >>> results = run_queries(queries, manager)
+    """
+    queries = list(queries)
+    results = [None] * len(queries)
+
+    for network_ids, positions in _group_queries(queries).items():
+        # the universe is shared by the queries, so make sure none of them modify it
+        universe = subgraph_view(queries[positions[0]]._get_universe(manager))
+
+        tasks = [
+            (queries[i].seeding, queries[i].pipeline.protocol)
+            for i in positions
+        ]
+
+        log.debug('running %d queries over networks %s', len(tasks), network_ids)
+
+        if _can_run_parallel(universe, tasks, processes):
+            pool = Pool(min(processes, len(tasks)), initializer=_init_worker, initargs=(universe,))
+            try:
+                group_results = pool.map(_run_worker, tasks, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            group_results = [
+                _run_on_universe(universe, seeding, protocol)
+                for seeding, protocol in tasks
+            ]
+
+        for i, result in zip(positions, group_results):
+            results[i] = result
+
+    return results
+
+
+def _can_run_parallel(universe, tasks, processes):
+    """Check if the queries over a universe should be run in worker processes.
+
+    :param pybel.BELGraph universe: The universe
+    :param list[tuple[pybel.struct.query.Seeding,list[dict]]] tasks: The seeding and protocol of each query
+    :param Optional[int] processes: The number of processes
+    :rtype: bool
+    """
+    return (
+        processes is not None and
+        1 < processes and
+        1 < len(tasks) and
+        pipeline_module.PARALLEL_MIN_EDGES <= universe.number_of_edges() and
+        pipeline_module._is_picklable(tasks)
+    )
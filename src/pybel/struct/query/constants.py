@@ -44,3 +44,10 @@ NONNODE_SEED_TYPES = {
     SEED_TYPE_PUBMED,
     SEED_TYPE_SAMPLE,
 }
+
+#: Seed types that can be pushed down to the database with :meth:`pybel.struct.query.Seeding.run_pushdown`
+PUSHDOWN_SEED_TYPES = {
+    SEED_TYPE_INDUCTION,
+    SEED_TYPE_NEIGHBORS,
+    SEED_TYPE_ANNOTATION,
+}
@@ -9,7 +9,8 @@ from collections import Iterable
 from .exc import QueryMissingNetworksError
 from .seeding import Seeding
 from ...manager.models import Node
-from ...struct.pipeline import Pipeline
+from ...struct.pipeline import Pipeline, PipelineProfile
+from ...struct.pipeline.pipeline import _uses_universe
 
 __all__ = [
     'Query',
@@ -52,6 +53,9 @@ class Query:
             raise TypeError('Not a pipeline: {}'.format(pipeline))
         self.pipeline = pipeline or Pipeline()
 
+        #: The measurements of each step of the last run, if it was profiled
+        self.profile = None
+
     def append_network(self, network_id):
         """Add a network to this query.
 
@@ -112,15 +116,71 @@ class Query:
         """
         return self.run(manager)
 
-    def run(self, manager):
+    def run(self, manager, pushdown=False, profile=False):
         """Run this query and returns the resulting BEL graph.
 
+        :param manager: A cache manager
+        :param bool pushdown: If true and all seeding methods support it, run the seeding in the database with
+                              :meth:`Seeding.run_pushdown` so only the seed graph is loaded. The full universe is
+                              then only built if the pipeline contains functions that need it.
+        :param bool profile: If true, measures building the universe, the seeding, and each entry in the pipeline and
+                             keeps the measurements in :attr:`profile`
+        :rtype: Optional[pybel.BELGraph]
+        """
+        self.profile = PipelineProfile() if profile else None
+
+        if pushdown and self.seeding and self.seeding.is_pushdown_compatible():
+            return self._run_pushdown(manager)
+
+        universe = self._measure('universe', lambda _: self._get_universe(manager))
+        graph = self._measure('seeding', self.seeding.run, universe)
+        return self._run_pipeline(graph, universe)
+
+    def _measure(self, name, func, graph=None):
+        """Run a step of this query, measuring it if the query is being profiled.
+
+        :param str name: The name of the step
+        :param func: A function that takes the graph and returns the resulting graph
+        :param Optional[pybel.BELGraph] graph: The graph before the step, if it has one
+        :rtype: Optional[pybel.BELGraph]
+        """
+        if self.profile is None:
+            return func(graph)
+
+        return self.profile.measure(name, func, graph)
+
+    def _run_pipeline(self, graph, universe):
+        """Run the pipeline of this query on the seed graph.
+
+        :param pybel.BELGraph graph: The seed graph
+        :param Optional[pybel.BELGraph] universe: The universe
+        :rtype: pybel.BELGraph
+        """
+        return self.pipeline.run(graph, universe=universe, profile=self.profile if self.profile is not None else False)
+
+    def _run_pushdown(self, manager):
+        """Run this query with the seeding done in the database.
+
         :param manager: A cache manager
         :rtype: Optional[pybel.BELGraph]
         """
-        universe = self._get_universe(manager)
-        graph = self.seeding.run(universe)
-        return self.pipeline.run(graph, universe=universe)
+        if not self.network_ids:
+            raise QueryMissingNetworksError('can not run query without network identifiers')
+
+        graph = self._measure('seeding', lambda _: self.seeding.run_pushdown(manager, self.network_ids))
+
+        if graph is None:
+            return
+
+        log.debug('pushdown seeding has %d nodes/%d edges', graph.number_of_nodes(), graph.number_of_edges())
+
+        universe = (
+            self._measure('universe', lambda _: self._get_universe(manager))
+            if _uses_universe(self.pipeline.protocol) else
+            None
+        )
+
+        return self._run_pipeline(graph, universe)
 
     def _get_universe(self, manager):
         if not self.network_ids:
@@ -212,3 +272,4 @@ class Query:
         :raises: QueryMissingNetworksError
         """
         return Query.from_json(json.loads(s))
+
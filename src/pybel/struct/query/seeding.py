@@ -9,11 +9,12 @@ import random
 from six.moves import UserList
 
 from .constants import (
-    SEED_TYPE_ANNOTATION, SEED_TYPE_INDUCTION, SEED_TYPE_NEIGHBORS, SEED_TYPE_SAMPLE,
+    PUSHDOWN_SEED_TYPES, SEED_TYPE_ANNOTATION, SEED_TYPE_INDUCTION, SEED_TYPE_NEIGHBORS, SEED_TYPE_SAMPLE,
 )
 from .selection import get_subgraph
 from ...dsl import BaseEntity
 from ...manager.models import Node
+from ...manager.query_manager import graph_from_edges
 from ...struct import union
 from ...tokens import parse_result_to_dsl
 
@@ -117,6 +118,49 @@ class Seeding(UserList):
 
         return union(subgraphs)
 
+    def is_pushdown_compatible(self):
+        """Check if all seeding methods in this container can be run directly in the database.
+
+        :rtype: bool
+        """
+        return all(
+            seed[SEED_METHOD] in PUSHDOWN_SEED_TYPES
+            for seed in self
+        )
+
+    def run_pushdown(self, manager, network_ids):
+        """Seed a graph by querying the database directly instead of building the full universe first.
+
+        Only the edges matched by the seeding methods are loaded from the database, so the networks given by
+        ``network_ids`` never have to be unpickled and combined. Note that this relies on the networks having been
+        inserted with ``store_parts=True``. Like in :func:`pybel.manager.query_manager.graph_from_edges`, the
+        unqualified edges to the parents of variants and the members of complexes are added to the result as well.
+
+        :param pybel.manager.Manager manager: A cache manager
+        :param list[int] network_ids: Database network identifiers
+        :rtype: Optional[pybel.BELGraph]
+        :raises ValueError: If this container has seeding methods that can't be pushed down
+        """
+        subgraphs = []
+
+        for seed in self:
+            seed_method, seed_data = seed[SEED_METHOD], seed[SEED_DATA]
+
+            log.debug('seeding in database with %s: %s', seed_method, seed_data)
+            subgraph = _get_subgraph_pushdown(manager, network_ids, seed_method, seed_data)
+
+            if subgraph is None:
+                log.debug('seed returned empty graph: %s', seed)
+                continue
+
+            subgraphs.append(subgraph)
+
+        if not subgraphs:
+            log.debug('no subgraphs returned')
+            return
+
+        return union(subgraphs)
+
     def to_json(self):
         """Serialize this seeding container to a JSON object.
 
@@ -178,3 +222,44 @@ def _handle_nodes(nodes):
         )
         for node in nodes
     ]
+
+
+def _get_subgraph_pushdown(manager, network_ids, seed_method, seed_data):
+    """Run a single seeding method in the database.
+
+    :param pybel.manager.Manager manager: A cache manager
+    :param list[int] network_ids: Database network identifiers
+    :param str seed_method: The seeding method
+    :param seed_data: The argument for the seeding method
+    :rtype: Optional[pybel.BELGraph]
+    """
+    if seed_method == SEED_TYPE_ANNOTATION:
+        edges = manager.query_edges_by_annotations(
+            seed_data['annotations'],
+            or_=seed_data.get('or'),
+            network_ids=network_ids,
+        )
+        return graph_from_edges(edges)
+
+    if seed_method not in PUSHDOWN_SEED_TYPES:
+        raise ValueError('Seed method can not be run in the database: {}'.format(seed_method))
+
+    node_hashes = [node.as_sha512() for node in _handle_nodes(seed_data)]
+    nodes = manager.query_nodes_by_hashes(node_hashes, network_ids=network_ids)
+
+    if not nodes:
+        return
+
+    if seed_method == SEED_TYPE_NEIGHBORS:
+        return graph_from_edges(manager.query_neighbors(nodes, network_ids=network_ids))
+
+    # induction keeps the given nodes even if they have no edges between them
+    rv = graph_from_edges(
+        manager.query_induction(nodes, network_ids=network_ids)
+        if 1 < len(nodes) else
+        []
+    )
+    for node in nodes:
+        rv.add_node_from_data(node.to_json())
+
+    return rv
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""Statistics about BEL graphs that are calculated in a single pass.
+
+The :class:`GraphSummary` calculates the statistics that are otherwise calculated by functions like
+:func:`pybel.struct.summary.count_functions`, :func:`pybel.struct.summary.count_relations`, and
+:func:`pybel.struct.summary.count_citations` in one pass over the nodes and edges of a graph, which is much faster than
+calling each of them. It's used by :meth:`pybel.BELGraph.summary_dict` and :func:`pybel.struct.summary.print_summary`.
+"""
+
+from collections import Counter
+
+import networkx as nx
+
+from ..constants import ANNOTATIONS, CITATION, CITATION_REFERENCE, CITATION_TYPE, KIND, NAMESPACE, RELATION, VARIANTS
+
+__all__ = [
+    'GraphSummary',
+]
+
+
+class GraphSummary(object):
+    """Statistics about a BEL graph, calculated in one pass over its nodes and one pass over its edges."""
+
+    def __init__(self, graph):
+        """Summarize a graph.
+
+        :param pybel.BELGraph graph: A BEL graph
+        """
+        self.number_of_nodes = graph.number_of_nodes()
+        self.number_of_edges = graph.number_of_edges()
+        self.number_of_warnings = len(graph.warnings)
+        self.density = nx.density(graph)
+        self.number_of_components = len(graph.get_weakly_connected_components())
+
+        #: A Counter from {function: frequency}, like :func:`pybel.struct.summary.count_functions`
+        self.functions = Counter()
+        #: A Counter from {namespace: frequency}, like :func:`pybel.struct.summary.count_namespaces`
+        self.namespaces = Counter()
+        #: A Counter from {variant kind: frequency}, like :func:`pybel.struct.summary.count_variants`
+        self.variants = Counter()
+        #: A Counter from {node: degree}
+        self.degrees = Counter()
+
+        #: A Counter from {relation: frequency}, like :func:`pybel.struct.summary.count_relations`
+        self.relations = Counter()
+        #: A Counter from {annotation: frequency}, like :func:`pybel.struct.summary.count_annotations`
+        self.annotations = Counter()
+        #: The set of (type, reference) pairs of the citations
+        self.citations = set()
+
+        for node in graph:
+            self.functions[node.function] += 1
+
+            if NAMESPACE in node:
+                self.namespaces[node[NAMESPACE]] += 1
+
+            for variant_data in node.get(VARIANTS) or ():
+                self.variants[variant_data[KIND]] += 1
+
+            self.degrees[node] = 0
+
+        for u, v, data in graph.edges(data=True):
+            self.degrees[u] += 1
+            self.degrees[v] += 1
+
+            self.relations[data[RELATION]] += 1
+
+            for annotation in data.get(ANNOTATIONS, ()):
+                self.annotations[annotation] += 1
+
+            citation = data.get(CITATION)
+            if citation is not None:
+                self.citations.add((citation[CITATION_TYPE], citation[CITATION_REFERENCE].strip()))
+
+    @property
+    def number_of_citations(self):
+        """The number of unique citations, like :func:`pybel.struct.summary.count_citations`.
+
+        :rtype: int
+        """
+        return len(self.citations)
+
+    @property
+    def average_degree(self):
+        """The average number of edges to each node, which is the same as the average number of edges from each node.
+
+        :rtype: float
+        """
+        if not self.number_of_nodes:
+            return 0.0
+
+        return self.number_of_edges / float(self.number_of_nodes)
+
+    def get_top_hubs(self, count=15):
+        """Get the nodes with the highest degrees, like :func:`pybel.struct.summary.get_top_hubs`.
+
+        :param Optional[int] count: The number of top hubs to return. If None, returns all nodes
+        :rtype: list[tuple[BaseEntity,int]]
+        """
+        return self.degrees.most_common(count)
@@ -2,14 +2,16 @@
 
 """Summary functions for BEL graphs."""
 
-from . import edge_summary, errors, node_summary, provenance
+from . import edge_summary, errors, graph_summary, node_summary, provenance
 from .edge_summary import *
 from .errors import *
+from .graph_summary import *
 from .node_summary import *
 from .provenance import *
 
 __all__ = (
         errors.__all__ +
+        graph_summary.__all__ +
         node_summary.__all__ +
         provenance.__all__ +
         edge_summary.__all__
@@ -25,6 +25,9 @@ def iter_annotation_value_pairs(graph):
     :param pybel.BELGraph graph: A BEL graph
     :rtype: iter[tuple[str,str]]
     """
+    if graph.provenance_index is not None:
+        return graph.provenance_index.iter_annotation_value_pairs()
+
     return (
         (key, value)
         for _, _, data in graph.edges(data=True)
@@ -41,6 +44,9 @@ def iter_annotation_values(graph, annotation):
     :param str annotation: The annotation to grab
     :rtype: iter[str]
     """
+    if graph.provenance_index is not None:
+        return graph.provenance_index.iter_annotation_values(annotation)
+
     return (
         value
         for _, _, data in graph.edges(data=True)
@@ -2,9 +2,19 @@
 
 """Graph summary functions."""
 
+from __future__ import print_function
+
 import logging
 
-import networkx as nx
+from ..statistics import GraphSummary
+
+__all__ = [
+    'GraphSummary',
+    'summary_list',
+    'summary_dict',
+    'summary_str',
+    'print_summary',
+]
 
 log = logging.getLogger(__name__)
 
@@ -15,21 +25,23 @@ def summary_list(graph):
     :param pybel.BELGraph graph: A BEL graph
     :rtype: list
     """
-    number_nodes = graph.number_of_nodes()
+    summary = graph.get_summary()
+
     result = [
-        ('nodes', number_nodes),
-        ('edges', graph.number_of_edges()),
-        ('network density', nx.density(graph)),
-        ('components', nx.number_weakly_connected_components(graph)),
+        ('nodes', summary.number_of_nodes),
+        ('edges', summary.number_of_edges),
+        ('citations', summary.number_of_citations),
+        ('network density', summary.density),
+        ('components', summary.number_of_components),
     ]
 
-    try:
-        result.append(('average degree', sum(graph.in_degree().values()) / float(number_nodes)))
-    except ZeroDivisionError:
+    if summary.number_of_nodes:
+        result.append(('average degree', summary.average_degree))
+    else:
         log.info('%s has no nodes.', graph)
 
-    if graph.warnings:
-        result.append(('compilation warnings', len(graph.warnings)))
+    if summary.number_of_warnings:
+        result.append(('compilation warnings', summary.number_of_warnings))
 
     return result
 
@@ -7,9 +7,10 @@ from collections import Counter, defaultdict
 import itertools as itt
 
 from ..filters.node_predicates import has_variant
+from ..indexes import iter_node_names
 from ...constants import (
-    ACTIVITY, EFFECT, FROM_LOC, FUSION, IDENTIFIER, KIND, LOCATION, MEMBERS, MODIFIER, NAME, NAMESPACE,
-    OBJECT, PARTNER_3P, PARTNER_5P, SUBJECT, TO_LOC, TRANSLOCATION, VARIANTS,
+    ACTIVITY, EFFECT, FROM_LOC, KIND, LOCATION, MODIFIER, NAME, NAMESPACE, OBJECT, SUBJECT, TO_LOC, TRANSLOCATION,
+    VARIANTS,
 )
 from ...dsl import Pathology
 
@@ -29,17 +30,6 @@ __all__ = [
 ]
 
 
-def _function_iterator(graph):
-    """Iterate over the functions in a graph.
-
-    :rtype: iter[str]
-    """
-    return (
-        node.function
-        for node in graph
-    )
-
-
 def get_functions(graph):
     """Get the set of all functions used in this graph.
 
@@ -47,7 +37,7 @@ def get_functions(graph):
     :return: A set of functions
     :rtype: set[str]
     """
-    return set(_function_iterator(graph))
+    return set(graph.node_index.functions)
 
 
 def count_functions(graph):
@@ -57,7 +47,7 @@ def count_functions(graph):
     :return: A Counter from {function: frequency}
     :rtype: collections.Counter
     """
-    return Counter(_function_iterator(graph))
+    return graph.node_index.count_functions()
 
 
 def _iterate_namespaces(graph):
@@ -113,13 +103,15 @@ def get_names(graph):
 def _identifier_filtered_iterator(graph):
     """Iterate over names in the given namespace."""
     for data in graph:
-        for pair in _get_node_names(data):
+        for pair in iter_node_names(data):
             yield pair
 
-        for member in data.get(MEMBERS, []):
-            for pair in _get_node_names(member):
-                yield pair
+    for pair in _iter_edge_identifiers(graph):
+        yield pair
 
+
+def _iter_edge_identifiers(graph):
+    """Iterate over the (namespace, name) pairs in the modifiers of the edges in the graph."""
     for ((_, _, data), side) in itt.product(graph.edges(data=True), (SUBJECT, OBJECT)):
         side_data = data.get(side)
         if side_data is None:
@@ -145,21 +137,6 @@ def _identifier_filtered_iterator(graph):
             yield location[NAMESPACE], location[NAME]
 
 
-def _get_node_names(data):
-    if NAMESPACE in data:
-        yield data[NAMESPACE], data[NAME]
-
-    elif FUSION in data:
-        yield data[FUSION][PARTNER_3P][NAMESPACE], data[FUSION][PARTNER_3P][NAME]
-        yield data[FUSION][PARTNER_5P][NAMESPACE], data[FUSION][PARTNER_5P][NAME]
-
-    if VARIANTS in data:
-        for variant in data[VARIANTS]:
-            identifier = variant.get(IDENTIFIER)
-            if identifier is not None and NAMESPACE in identifier and NAME in identifier:
-                yield identifier[NAMESPACE], identifier[NAME]
-
-
 def _namespace_filtered_iterator(graph, namespace):
     """Iterate over names in the given namespace."""
     for it_namespace, name in _identifier_filtered_iterator(graph):
@@ -196,7 +173,13 @@ def get_names_by_namespace(graph, namespace):
     if namespace not in graph.defined_namespace_keywords:
         raise IndexError('{} is not defined in {}'.format(namespace, graph))
 
-    return set(_namespace_filtered_iterator(graph, namespace))
+    rv = graph.node_index.get_names_by_namespace(namespace)
+    rv.update(
+        name
+        for it_namespace, name in _iter_edge_identifiers(graph)
+        if it_namespace == namespace
+    )
+    return rv
 
 
 def count_variants(graph):
@@ -220,7 +203,7 @@ def get_top_hubs(graph, count=15):
     :param Optional[int] count: The number of top hubs to return. If None, returns all nodes
     :rtype: dict[tuple,int]
     """
-    return Counter(dict(graph.degree())).most_common(count)
+    return Counter(graph.get_degrees()).most_common(count)
 
 
 def _pathology_iterator(graph):
@@ -26,8 +26,8 @@ def update_metadata(source, target):
         if keyword not in target.annotation_list:
             target.annotation_list[keyword] = values
         else:
-            for value in values:
-                target.annotation_list[keyword].add(value)
+            # replaced instead of modified since it might be shared with a copy of the target
+            target.annotation_list[keyword] = set(target.annotation_list[keyword]).union(values)
 
 
 def update_node_helper(source, target):
@@ -11,10 +11,12 @@ import unittest
 from click.testing import CliRunner
 
 from pybel import Manager, cli
-from pybel.constants import METADATA_NAME, PYBEL_CONTEXT_TAG
-from pybel.io import from_json, from_path, from_pickle
+from pybel.constants import METADATA_NAME, PYBEL_CONTEXT_TAG, RELATION
+from pybel.examples import egf_graph, sialic_acid_graph
+from pybel.io import from_json, from_path, from_pickle, to_pickle
 from pybel.manager.database_io import from_database
-from pybel.testing.cases import FleetingTemporaryCacheMixin
+from pybel.struct.pipeline import Pipeline
+from pybel.testing.cases import FleetingTemporaryCacheMixin, TemporaryCacheClsMixin
 from pybel.testing.constants import test_bel_simple, test_bel_thorough
 from pybel.testing.mocks import mock_bel_resources
 from tests.constants import BelReconstitutionMixin, expected_test_thorough_metadata
@@ -22,6 +24,77 @@ from tests.constants import BelReconstitutionMixin, expected_test_thorough_metad
 log = logging.getLogger(__name__)
 
 
+class TestEdgesCli(TemporaryCacheClsMixin):
+    """Test listing and exporting the edge store with the CLI."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Insert the sialic acid graph for all tests."""
+        super(TestEdgesCli, cls).setUpClass()
+
+        @mock_bel_resources
+        def insert(mock):
+            """Insert the graph using the mock resources."""
+            cls.manager.insert_graph(sialic_acid_graph, store_parts=True)
+
+        insert()
+
+    def setUp(self):
+        self.runner = CliRunner()
+
+    def invoke(self, *args):
+        result = self.runner.invoke(cli.main, ['--connection', self.connection, 'manage', 'edges'] + list(args))
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        return result.output.splitlines()
+
+    def test_ls(self):
+        self.assertEqual(10, len(self.invoke('ls')))
+        self.assertEqual(3, len(self.invoke('ls', '--offset', '8', '--limit', '5')))
+
+    def test_ls_after(self):
+        """Test getting the next page of edges from the identifier of the last one."""
+        first_page = self.invoke('ls', '--limit', '4', '--show-id')
+        last_id = first_page[-1].split('\t')[0]
+
+        self.assertEqual(
+            self.invoke('ls', '--offset', '4', '--limit', '4', '--show-id'),
+            self.invoke('ls', '--after', last_id, '--limit', '4', '--show-id'),
+        )
+
+        # without the flag, only the BEL is listed
+        self.assertEqual(
+            [line.split('\t')[1] for line in first_page],
+            self.invoke('ls', '--limit', '4'),
+        )
+
+    def test_networks_ls(self):
+        result = self.runner.invoke(cli.main, ['--connection', self.connection, 'manage', 'networks', 'ls'])
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        self.assertIn(sialic_acid_graph.name, result.output)
+
+    def test_export_jsonl(self):
+        lines = self.invoke('export', '--batch-size', '4')
+        self.assertEqual(self.manager.count_edges(), len(lines))
+
+        for line in lines:
+            edge = json.loads(line)
+            self.assertIn('source', edge)
+            self.assertIn('target', edge)
+            self.assertIn(RELATION, edge['data'])
+
+        self.assertEqual(
+            {edge.sha512 for edge in self.manager.query_edges()},
+            {json.loads(line)['key'] for line in lines},
+        )
+
+    def test_export_tsv(self):
+        lines = self.invoke('export', '--fmt', 'tsv')
+        self.assertEqual(self.manager.count_edges(), len(lines))
+
+        for line in lines:
+            self.assertEqual(4, len(line.split('\t')))
+
+
 @unittest.skip
 class TestCli(FleetingTemporaryCacheMixin, BelReconstitutionMixin):
     def setUp(self):
@@ -114,3 +187,32 @@ class TestCli(FleetingTemporaryCacheMixin, BelReconstitutionMixin):
                 q = 'match (n)-[r]->() where r.{}="{}" return count(n) as count'.format(PYBEL_CONTEXT_TAG, test_context)
                 count = neo.data(q)[0]['count']
                 self.assertEqual(14, count)
+
+
+class TestProfileCli(unittest.TestCase):
+    """Test measuring pipelines with the CLI."""
+
+    def test_profile(self):
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            to_pickle(egf_graph, 'egf.gpickle')
+
+            with open('pipeline.json', 'w') as file:
+                Pipeline.from_functions(['enrich_protein_and_rna_origins', 'remove_isolated_nodes']).dump(file)
+
+            result = runner.invoke(cli.main, ['profile', 'egf.gpickle', 'pipeline.json', '--output', 'profile.json'])
+            self.assertEqual(0, result.exit_code, msg=result.output)
+
+            lines = result.output.splitlines()
+            self.assertEqual(5, len(lines))
+            self.assertIn('enrich_protein_and_rna_origins', lines[2])
+            self.assertIn('remove_isolated_nodes', lines[3])
+
+            with open('profile.json') as file:
+                data = json.load(file)
+
+            self.assertEqual(
+                ['enrich_protein_and_rna_origins', 'remove_isolated_nodes'],
+                [step['name'] for step in data['steps']],
+            )
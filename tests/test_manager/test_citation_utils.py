@@ -4,15 +4,22 @@
 
 from __future__ import unicode_literals
 
+import json
 import os
-import unittest
+import threading
 import time
+import unittest
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+from six.moves.urllib.parse import parse_qs, urlparse
+
 from pybel import BELGraph
 from pybel.constants import (
     CITATION, CITATION_AUTHORS, CITATION_DATE, CITATION_NAME, CITATION_TYPE_PUBMED,
 )
 from pybel.dsl import protein
-from pybel.manager.citation_utils import enrich_pubmed_citations, get_citations_by_pmids, sanitize_date
+from pybel.manager.citation_utils import TokenBucket, enrich_pubmed_citations, get_citations_by_pmids, sanitize_date
 from pybel.manager.models import Citation
 from pybel.testing.cases import TemporaryCacheMixin
 from pybel.testing.utils import n
@@ -54,6 +61,171 @@ class TestSanitizeDate(unittest.TestCase):
         self.assertEqual(None, sanitize_date('2012 Early Spring'))
 
 
+class TestTokenBucket(unittest.TestCase):
+    """Test the token bucket rate limiter."""
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+    def test_rate(self):
+        """Test that acquiring more tokens than the capacity waits for them to refill."""
+        bucket = TokenBucket(rate=50)
+
+        t = time.time()
+        for _ in range(6):
+            bucket.acquire()
+
+        self.assertLessEqual(0.09, time.time() - t)
+
+
+def _make_pubmed_summary(pmid):
+    """Make a fake summary for a PubMed identifier like eUtils would return."""
+    if pmid.startswith('0'):
+        return {'uid': pmid, 'error': 'cannot get document summary'}
+
+    return {
+        'uid': pmid,
+        'fulljournalname': 'Journal of {}'.format(pmid),
+        'title': 'Title of {}'.format(pmid),
+        'volume': '1',
+        'issue': '2',
+        'pages': '3-4',
+        'pubdate': '2012 Dec 19',
+        'sortfirstauthor': 'First {}'.format(pmid),
+        'lastauthor': 'Shared Author',
+        'authors': [
+            {'name': 'First {}'.format(pmid)},
+            {'name': 'Shared Author'},
+        ],
+    }
+
+
+class MockEUtilsHandler(BaseHTTPRequestHandler):
+    """Answers like the eUtils summary service, after failing a given number of requests."""
+
+    lock = threading.Lock()
+    failures = 0
+    requested = []
+
+    def do_GET(self):
+        """Respond to a GET request."""
+        with self.lock:
+            self.requested.append(self.path)
+            fail = 0 < MockEUtilsHandler.failures
+            if fail:
+                MockEUtilsHandler.failures -= 1
+
+        if fail:
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        pmids = parse_qs(urlparse(self.path).query)['id'][0].split(',')
+        result = {
+            pmid: _make_pubmed_summary(pmid)
+            for pmid in pmids
+        }
+        result['uids'] = pmids
+
+        body = json.dumps({'result': result}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Keep quiet."""
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """An HTTP server that handles each request in a new thread."""
+
+    daemon_threads = True
+
+
+class TestLocalCitations(TemporaryCacheMixin):
+    """Test enriching citations against a local stand-in for the eUtils service."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the stand-in server."""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockEUtilsHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+        cls.url_fmt = 'http://127.0.0.1:{}/esummary.fcgi?db=pubmed&retmode=json&id={{}}'.format(
+            cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the stand-in server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        super(TestLocalCitations, self).setUp()
+        MockEUtilsHandler.failures = 0
+        del MockEUtilsHandler.requested[:]
+
+    def get_citations(self, pmids, **kwargs):
+        kwargs.setdefault('rate', 1000)
+        kwargs.setdefault('backoff', 0)
+        return get_citations_by_pmids(self.manager, pmids, url_fmt=self.url_fmt, **kwargs)
+
+    def test_enrich(self):
+        pmids = ['1', '2', '3', '4', '5']
+        result, errors = self.get_citations(pmids, group_size=2, max_workers=2)
+
+        self.assertEqual(set(pmids), set(result))
+        self.assertEqual(set(), errors)
+        self.assertEqual(3, len(MockEUtilsHandler.requested))
+        self.assertEqual(5, self.manager.count_citations())
+
+        citation = self.manager.get_citation_by_pmid('3')
+        self.assertEqual('Journal of 3', citation.name)
+        self.assertEqual('First 3', citation.first.name)
+        self.assertEqual('Shared Author', citation.last.name)
+        self.assertEqual({'First 3', 'Shared Author'}, {author.name for author in citation.authors})
+        self.assertEqual('2012-12-19', result['3'][CITATION_DATE])
+
+        self.assertIsNotNone(self.manager.get_author_by_name('Shared Author'))
+
+    def test_enrich_cached(self):
+        """Test that citations that are already enriched are not requested again."""
+        self.get_citations(['1', '2'])
+        self.assertEqual(1, len(MockEUtilsHandler.requested))
+
+        result, errors = self.get_citations(['1', '2', '3'])
+        self.assertEqual({'1', '2', '3'}, set(result))
+        self.assertEqual(2, len(MockEUtilsHandler.requested))
+        self.assertIn('id=3', MockEUtilsHandler.requested[-1])
+
+    def test_error_document(self):
+        result, errors = self.get_citations(['1', '01'])
+        self.assertEqual({'1'}, set(result))
+        self.assertEqual({'01'}, errors)
+
+    def test_retry(self):
+        """Test that failed requests are retried."""
+        MockEUtilsHandler.failures = 2
+        result, errors = self.get_citations(['1', '2'], retries=2)
+
+        self.assertEqual({'1', '2'}, set(result))
+        self.assertEqual(set(), errors)
+        self.assertEqual(3, len(MockEUtilsHandler.requested))
+
+    def test_retry_exhausted(self):
+        """Test that the identifiers are reported as errors when all attempts fail."""
+        MockEUtilsHandler.failures = 10
+        result, errors = self.get_citations(['1', '2'], retries=1)
+
+        self.assertEqual({}, result)
+        self.assertEqual({'1', '2'}, errors)
+        self.assertEqual(2, len(MockEUtilsHandler.requested))
+
+
 class TestCitations(TemporaryCacheMixin):
     """Tests for citations."""
 
@@ -124,8 +296,11 @@ class TestCitations(TemporaryCacheMixin):
         )
 
     def test_enrich_graph(self):
+        self.graph.build_provenance_index()
         enrich_pubmed_citations(manager=self.manager, graph=self.graph)
 
+        self.assertIn('Lewell XQ', self.graph.provenance_index.authors)
+
         _, _, d = list(self.graph.edges(data=True))[0]
         citation_dict = d[CITATION]
 
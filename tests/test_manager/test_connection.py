@@ -6,8 +6,12 @@ import os
 import tempfile
 import unittest
 
+from sqlalchemy.exc import OperationalError
+
 from pybel import Manager
-from pybel.manager.base_manager import build_engine_session
+from pybel.constants import config
+from pybel.manager.base_manager import build_engine, build_engine_session, get_sqlite_pragmas
+from pybel.manager.models import Namespace
 
 try:
     from unittest import mock
@@ -80,3 +84,54 @@ class TestInstantiation(unittest.TestCase):
     def test_instantiate_manager_session_missing(self):
         with self.assertRaises(ValueError):
             Manager(engine='fake-engine', session=None)
+
+
+class TestEngineTuning(unittest.TestCase):
+    """Test the options for tuning the engine that are set through the configuration."""
+
+    def setUp(self):
+        self.fd, self.path = tempfile.mkstemp()
+        self.connection = 'sqlite:///' + self.path
+
+    def tearDown(self):
+        os.close(self.fd)
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def test_default_pragmas(self):
+        """Test that the journal mode isn't changed by default."""
+        with mock.patch.dict(config, clear=False):
+            config.pop('PYBEL_MANAGER_SQLITE_PERFORMANCE', None)
+            config.pop('PYBEL_MANAGER_SQLITE_PRAGMAS', None)
+            self.assertEqual({}, get_sqlite_pragmas())
+
+            engine = build_engine(self.connection)
+            self.assertNotEqual('wal', engine.execute('PRAGMA journal_mode').scalar())
+
+    def test_performance_pragmas(self):
+        """Test the SQLite performance profile and overriding its pragmas."""
+        with mock.patch.dict(config, {
+            'PYBEL_MANAGER_SQLITE_PERFORMANCE': True,
+            'PYBEL_MANAGER_SQLITE_PRAGMAS': {'cache_size': -1000},
+        }):
+            engine = build_engine(self.connection, pool_size=5, max_overflow=10)  # pool options are ignored for SQLite
+
+        self.assertEqual('wal', engine.execute('PRAGMA journal_mode').scalar())
+        self.assertEqual(1, engine.execute('PRAGMA synchronous').scalar())  # NORMAL
+        self.assertEqual(-1000, engine.execute('PRAGMA cache_size').scalar())
+        engine.dispose()
+
+    def test_read_only(self):
+        """Test that a read-only manager can query but not write."""
+        Manager(connection=self.connection).session.close()
+
+        manager = Manager(connection=self.connection, read_only=True)
+        self.assertEqual(0, manager.count_namespaces())
+
+        manager.session.add(Namespace(keyword='TEST', url='http://example.com/test.belns', version='1'))
+        with self.assertRaises(OperationalError):
+            manager.session.commit()
+
+        manager.session.rollback()
+        manager.session.close()
@@ -9,7 +9,7 @@ from collections import Counter
 
 import sqlalchemy.exc
 import time
-from sqlalchemy import not_
+from sqlalchemy import event, not_
 
 from pybel import BELGraph, from_database, from_path, to_database
 from pybel.constants import (
@@ -25,7 +25,8 @@ from pybel.dsl import (
 from pybel.dsl.namespaces import chebi, hgnc
 from pybel.examples import ras_tloc_graph, sialic_acid_graph
 from pybel.manager import models
-from pybel.manager.models import Author, Citation, Edge, Evidence, NamespaceEntry, Node, Property
+from pybel.manager.models import Author, Citation, Edge, Evidence, NamespaceEntry, NetworkSummary, Node, Property
+from pybel.struct.summary import count_functions, count_namespaces
 from pybel.testing.cases import FleetingTemporaryCacheMixin, TemporaryCacheClsMixin, TemporaryCacheMixin
 from pybel.testing.constants import test_bel_simple
 from pybel.testing.mocks import mock_bel_resources
@@ -189,6 +190,178 @@ class TestTemporaryInsertNetwork(TemporaryCacheMixin):
         # TODO check that the database doesn't have anything for TEST in it
 
 
+class TestNetworkSummary(TemporaryCacheMixin):
+    """Test the summaries stored with networks."""
+
+    @mock_bel_resources
+    def setUp(self, mock):
+        super(TestNetworkSummary, self).setUp()
+        self.network = self.manager.insert_graph(sialic_acid_graph, store_parts=False)
+
+    def test_summary(self):
+        summary = self.manager.get_network_summary_by_id(self.network.id)
+        self.assertIsNotNone(summary)
+
+        self.assertEqual(sialic_acid_graph.number_of_nodes(), summary['number_nodes'])
+        self.assertEqual(sialic_acid_graph.number_of_edges(), summary['number_edges'])
+        self.assertEqual(dict(count_functions(sialic_acid_graph)), summary['functions'])
+        self.assertEqual(dict(count_namespaces(sialic_acid_graph)), summary['namespaces'])
+        self.assertEqual(0, summary['number_warnings'])
+        self.assertLess(0, summary['number_citations'])
+
+    def test_summary_missing(self):
+        self.assertIsNone(self.manager.get_network_summary_by_id(self.network.id + 1))
+
+    def test_list_summaries(self):
+        summaries = self.manager.list_network_summaries()
+        self.assertEqual(1, len(summaries))
+        self.assertEqual(self.network.id, summaries[0]['id'])
+        self.assertEqual(sialic_acid_graph.name, summaries[0][METADATA_NAME])
+        self.assertEqual(sialic_acid_graph.number_of_edges(), summaries[0]['number_edges'])
+
+    def test_backfill(self):
+        """Test that summaries are calculated for networks that were stored without one."""
+        self.manager.session.query(NetworkSummary).delete()
+        self.manager.session.commit()
+
+        summaries = self.manager.list_network_summaries()
+        self.assertEqual(1, len(summaries))
+        self.assertEqual(sialic_acid_graph.number_of_nodes(), summaries[0]['number_nodes'])
+        self.assertEqual(1, self.manager.session.query(NetworkSummary).count())
+
+    def test_drop(self):
+        self.manager.drop_network_by_id(self.network.id)
+        self.assertEqual(0, self.manager.session.query(NetworkSummary).count())
+
+
+class TestFullTextSearch(TemporaryCacheMixin):
+    """Test searching evidences and BEL with and without the full-text indexes."""
+
+    @mock_bel_resources
+    def setUp(self, mock):
+        super(TestFullTextSearch, self).setUp()
+        self.network = self.manager.insert_graph(sialic_acid_graph)
+
+    def _insert_fos_graph(self):
+        graph = BELGraph(name='fos', version='0.0.0')
+        graph.add_increases(fos, jun, evidence='Kinases regulate transcription', citation=test_citation_dict)
+        make_dummy_namespaces(self.manager, graph)
+
+        with mock_bel_resources:
+            return self.manager.insert_graph(graph)
+
+    def _check_search(self):
+        evidences = self.manager.search_evidences('SHP-2 phosphatases')
+        self.assertEqual(2, len(evidences))
+
+        evidences = self.manager.search_evidences('Syk immune')
+        self.assertEqual(1, len(evidences))
+        self.assertIn('Syk', evidences[0].text)
+
+        edges = self.manager.search_edges_by_evidence('Syk immune')
+        self.assertLess(0, len(edges))
+        self.assertTrue(all(edge.evidence_id == evidences[0].id for edge in edges))
+
+        edges = self.manager.search_edges_by_bel('HGNC:CD33 increases')
+        self.assertLess(0, len(edges))
+        self.assertTrue(all('CD33' in edge.bel for edge in edges))
+
+        nodes = self.manager.search_nodes_by_bel('HGNC:SYK')
+        self.assertLess(0, len(nodes))
+        self.assertTrue(all('SYK' in node.bel for node in nodes))
+
+        self.assertEqual(1, len(self.manager.search_evidences('SHP-2 phosphatases', limit=1)))
+        self.assertEqual([], self.manager.search_evidences('!!!'))
+        self.assertEqual([], self.manager.search_evidences('nonexistentword'))
+
+        edges = self.manager.search_edges_with_evidence('%Syk, to inhibit%')
+        self.assertLess(0, len(edges))
+        self.assertTrue(all('Syk, to inhibit' in edge.evidence.text for edge in edges))
+        self.assertEqual([], self.manager.search_edges_with_evidence('%Syk, to excite%'))
+
+        edges = self.manager.search_edges_with_bel('%HGNC:CD33%')
+        self.assertLess(0, len(edges))
+        self.assertTrue(all('HGNC:CD33' in edge.bel for edge in edges))
+
+        nodes = self.manager.session.query(Node).filter(Node.bel_contains('HGNC:SYK', bind=self.manager.session))
+        self.assertEqual(['p(HGNC:SYK)'], [node.bel for node in nodes])
+
+    def test_search_without_index(self):
+        self.assertFalse(self.manager.has_full_text_index())
+        self._check_search()
+
+    def test_search_with_index(self):
+        self.manager.create_full_text_index()
+        self.assertTrue(self.manager.has_full_text_index())
+        self.assertTrue(self.manager.has_full_text_index('edge'))
+        self.assertTrue(self.manager.has_full_text_index('node'))
+        self._check_search()
+
+    def _get_like_search_results(self, evidence_patterns, bel_patterns, node_queries):
+        return (
+            [sorted(edge.id for edge in self.manager.search_edges_with_evidence(p)) for p in evidence_patterns],
+            [sorted(edge.id for edge in self.manager.search_edges_with_bel(p)) for p in bel_patterns],
+            [
+                sorted(node.id for node in self.manager.session.query(Node).filter(
+                    Node.bel_contains(q, bind=self.manager.session)))
+                for q in node_queries
+            ],
+        )
+
+    def test_like_search_same_with_index(self):
+        """Test that the searches with LIKE patterns find the same rows with and without the full-text index."""
+        evidence_patterns = ['%D33%', '%yk, to inhibit%', '%Syk, to inhibit%', '%to inhibi_%', '%to inhib_t%', '%CD33%']
+        bel_patterns = ['%D33%', '%GNC:CD33%', '%HGNC:CD33%', '%HGNC:C_33%', 'p(HGNC:%', '%(HGNC:SYK))']
+        node_queries = ['GNC:SYK', 'HGNC:SYK', 'SYK', 'YK)']
+
+        expected = self._get_like_search_results(evidence_patterns, bel_patterns, node_queries)
+        self.assertTrue(all(expected[0]), msg='all of the evidence patterns should match something')
+        self.assertTrue(all(expected[1]), msg='all of the BEL patterns should match something')
+        self.assertTrue(all(expected[2]), msg='all of the node queries should match something')
+
+        self.manager.create_full_text_index()
+        self.assertEqual(expected, self._get_like_search_results(evidence_patterns, bel_patterns, node_queries))
+
+    def test_like_search_uses_index(self):
+        """Test that the searches with LIKE patterns only check the rows found with the full-text index."""
+        self.manager.create_full_text_index()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args, **kwargs):
+            statements.append(statement)
+
+        event.listen(self.manager.engine, 'before_cursor_execute', record)
+        try:
+            self.manager.search_edges_with_evidence('%Syk, to inhibit%')
+            self.manager.search_edges_with_bel('%HGNC:CD33%')
+        finally:
+            event.remove(self.manager.engine, 'before_cursor_execute', record)
+
+        self.assertTrue(any('pybel_evidence_fts' in statement and 'LIKE' in statement for statement in statements))
+        self.assertTrue(any('pybel_edge_fts' in statement and 'LIKE' in statement for statement in statements))
+
+    def test_index_maintained(self):
+        """Test that the index is updated when networks are inserted and dropped."""
+        self.manager.create_full_text_index()
+
+        self._insert_fos_graph()
+        evidences = self.manager.search_evidences('kinases transcription')
+        self.assertEqual(1, len(evidences))
+        self.assertEqual(1, len(self.manager.search_edges_by_bel('HGNC:FOS')))
+
+        self.manager.drop_network_by_id(self.network.id)
+        self.assertEqual([], self.manager.search_edges_by_bel('HGNC:CD33'))
+        self.assertEqual([], self.manager.search_edges_by_evidence('Syk immune'))
+        self.assertEqual(1, len(self.manager.search_edges_by_bel('HGNC:FOS')))
+
+    def test_drop_index(self):
+        self.manager.create_full_text_index()
+        self.manager.drop_full_text_index()
+        self.assertFalse(self.manager.has_full_text_index())
+        self._check_search()
+
+
 class TestQuery(TemporaryCacheMixin):
     def setUp(self):
         super(TestQuery, self).setUp()
@@ -259,6 +432,10 @@ class TestQuery(TemporaryCacheMixin):
         evidence_list = self.manager.search_edges_with_evidence(evidence='%Twit%')
         self.assertEqual(len(evidence_list), 1)
 
+    def test_query_edge_by_evidence_wildcard_with_index(self):
+        self.manager.create_full_text_index()
+        self.test_query_edge_by_evidence_wildcard()
+
     def test_query_edge_by_mixed_no_result(self):
         # no result
         empty_list = self.manager.query_edges(source='p(HGNC:FADD)', relation=DECREASES)
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 
+from sqlalchemy import event
+
+from pybel import BELGraph
+from pybel.dsl import pmod, protein
 from pybel.examples import sialic_acid_graph
 from pybel.examples.sialic_acid_example import cd33, cd33_phosphorylated, shp2, syk, trem2
 from pybel.manager.models import Edge, Namespace, Network
@@ -116,3 +120,108 @@ class TestSeeding(TemporaryCacheClsMixin):
         self.assertIn(shp2, graph)
 
         self.assertEqual(3, graph.number_of_edges())
+
+    def test_graph_from_edges_eager(self):
+        """Test that loading the edges' data in batches gives the same graph with fewer queries."""
+        statements = []
+
+        def count(*args, **kwargs):
+            statements.append(1)
+
+        event.listen(self.manager.engine, 'before_cursor_execute', count)
+        try:
+            self.manager.session.expire_all()
+            lazy_graph = graph_from_edges(self.manager.session.query(Edge), eager=False)
+            lazy_count = len(statements)
+
+            del statements[:]
+            self.manager.session.expire_all()
+            eager_graph = graph_from_edges(self.manager.session.query(Edge))
+            eager_count = len(statements)
+        finally:
+            event.remove(self.manager.engine, 'before_cursor_execute', count)
+
+        self.assertLess(eager_count, lazy_count)
+        self.assertEqual(set(lazy_graph), set(eager_graph))
+        self.assertEqual(
+            sorted(lazy_graph.edges(keys=True, data=True), key=lambda t: t[2]),
+            sorted(eager_graph.edges(keys=True, data=True), key=lambda t: t[2]),
+        )
+
+    def test_iter_edges(self):
+        """Test iterating over edges in batches gives the same edges as querying them all."""
+        expected = {edge.id for edge in self.manager.query_edges()}
+        self.assertEqual(expected, {edge.id for edge in self.manager.iter_edges(batch_size=3)})
+
+        increases = self.manager.query_edges(relation='increases')
+        self.assertEqual(
+            {edge.id for edge in increases},
+            {edge.id for edge in self.manager.iter_edges(relation='increases', batch_size=2)},
+        )
+
+    def test_iter_edges_offset(self):
+        """Test skipping edges with an offset or resuming after a given edge."""
+        expected = sorted(edge.id for edge in self.manager.query_edges())
+
+        self.assertEqual(expected[3:], [edge.id for edge in self.manager.iter_edges(batch_size=2, offset=3)])
+        self.assertEqual(expected[3:], [edge.id for edge in self.manager.iter_edges(batch_size=2, after=expected[2])])
+
+    def test_iter_models(self):
+        """Test iterating over namespaces, networks, and citations in batches."""
+        self.assertEqual(
+            {namespace.id for namespace in self.manager.list_namespaces()},
+            {namespace.id for namespace in self.manager.iter_namespaces(batch_size=2)},
+        )
+        self.assertEqual(1, len(list(self.manager.iter_networks(batch_size=2))))
+        self.assertEqual(
+            {citation.id for citation in self.manager.list_citations()},
+            {citation.id for citation in self.manager.iter_citations(batch_size=1)},
+        )
+
+
+class TestGraphFromEdgesModifications(TemporaryCacheClsMixin):
+    """Test loading the modifications of nodes when building graphs from edges."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Add a graph with several modified proteins."""
+        super(TestGraphFromEdgesModifications, cls).setUpClass()
+
+        cls.graph = BELGraph(name='Modifications', version='1.0.0')
+        cls.graph.namespace_url['HGNC'] = sialic_acid_graph.namespace_url['HGNC']
+
+        cls.nodes = [
+            protein(namespace='HGNC', name=name, variants=[pmod('Ph')])
+            for name in ('CD33', 'PTPN6', 'PTPN11', 'SYK', 'TREM2')
+        ]
+        for u, v in zip(cls.nodes, cls.nodes[1:]):
+            cls.graph.add_increases(u, v, citation='1', evidence='1')
+
+        @mock_bel_resources
+        def insert(mock):
+            cls.manager.insert_graph(cls.graph, store_parts=True)
+
+        insert()
+
+    def test_graph_from_edges_modifications(self):
+        """Test that the modifications of the nodes are loaded in one query instead of one per node."""
+        statements = []
+
+        def record(conn, cursor, statement, *args, **kwargs):
+            statements.append(statement)
+
+        event.listen(self.manager.engine, 'before_cursor_execute', record)
+        try:
+            self.manager.session.expire_all()
+            graph = graph_from_edges(self.manager.session.query(Edge))
+        finally:
+            event.remove(self.manager.engine, 'before_cursor_execute', record)
+
+        self.assertEqual(set(self.graph), set(graph))
+
+        modification_statements = [
+            statement
+            for statement in statements
+            if 'pybel_node_modification' in statement
+        ]
+        self.assertGreaterEqual(2, len(modification_statements), msg='should be one for sources and one for targets')
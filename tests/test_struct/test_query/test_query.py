@@ -6,6 +6,7 @@ import logging
 import unittest
 
 from pybel import BELGraph, Pipeline
+from pybel.constants import CITATION
 from pybel.dsl import Protein
 from pybel.examples.egf_example import egf_graph, vcp
 from pybel.examples.homology_example import (
@@ -14,9 +15,12 @@ from pybel.examples.homology_example import (
 from pybel.examples.sialic_acid_example import (cd33_phosphorylated, dap12, shp1, shp2, sialic_acid_graph, syk, trem2)
 from pybel.struct import expand_node_neighborhood, expand_nodes_neighborhoods, get_subgraph_by_annotation_value
 from pybel.struct.mutation import collapse_to_genes, enrich_protein_and_rna_origins
-from pybel.struct.query import Query, QueryMissingNetworksError, Seeding
+from pybel.struct.pipeline import pipeline as pipeline_module
+from pybel.struct.query import Query, QueryMissingNetworksError, Seeding, batch as batch_module, run_queries
+from pybel.testing.cases import TemporaryCacheClsMixin
 from pybel.testing.generate import generate_random_graph
 from pybel.testing.mock_manager import MockQueryManager
+from pybel.testing.mocks import mock_bel_resources
 from pybel.testing.utils import n
 
 log = logging.getLogger(__name__)
@@ -307,3 +311,161 @@ class QueryTest(unittest.TestCase):
         self.assertIn(mouse_csf1_protein, result)
 
         self.assertEqual(2, result.number_of_edges())
+
+
+class TestQueryPushdown(TemporaryCacheClsMixin):
+    """Test running the seeding of queries in the database gives the same results as in memory."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Insert the sialic acid and EGF graphs for all tests."""
+        super(TestQueryPushdown, cls).setUpClass()
+
+        @mock_bel_resources
+        def insert(mock):
+            """Insert the graphs using the mock resources."""
+            cls.sialic_acid_id = cls.manager.insert_graph(sialic_acid_graph.copy()).id
+            cls.egf_id = cls.manager.insert_graph(egf_graph.copy()).id
+
+        insert()
+
+    def assert_same_result(self, query):
+        """Check a query gives the same graph with and without pushdown, up to the inferred structural edges."""
+        expected = query.run(self.manager)
+        result = query.run(self.manager, pushdown=True)
+
+        self.assertIsNotNone(result)
+        self.assertLessEqual(set(expected), set(result))
+
+        expected_edges = set(expected.edges(keys=True))
+        self.assertLessEqual(expected_edges, set(result.edges(keys=True)))
+
+        for u, v, key, data in result.edges(keys=True, data=True):
+            if (u, v, key) not in expected_edges:
+                self.assertNotIn(CITATION, data, msg='only unqualified edges should be added')
+
+        return result
+
+    def test_neighbors(self):
+        query = Query(network_ids=[self.sialic_acid_id])
+        query.append_seeding_neighbors([shp2])
+        result = self.assert_same_result(query)
+        self.assertIn(syk, result)
+
+    def test_profile(self):
+        """Test measuring the universe, seeding, and pipeline of a query."""
+        query = Query(network_ids=[self.sialic_acid_id])
+        query.append_seeding_neighbors([shp2])
+        query.append_pipeline(enrich_protein_and_rna_origins)
+
+        result = query.run(self.manager, profile=True)
+        self.assertEqual(
+            ['universe', 'seeding', 'enrich_protein_and_rna_origins'],
+            [step.name for step in query.profile],
+        )
+        self.assertIs(query.profile, query.pipeline.profile)
+
+        universe_step, seeding_step, pipeline_step = query.profile.steps
+        self.assertIsNone(universe_step.nodes_before)
+        self.assertEqual(sialic_acid_graph.number_of_nodes(), universe_step.nodes_after)
+        self.assertEqual(sialic_acid_graph.number_of_nodes(), seeding_step.nodes_before)
+        self.assertEqual(seeding_step.nodes_after, pipeline_step.nodes_before)
+        self.assertEqual(result.number_of_nodes(), pipeline_step.nodes_after)
+
+        query.run(self.manager, pushdown=True, profile=True)
+        self.assertEqual(['seeding', 'enrich_protein_and_rna_origins'], [step.name for step in query.profile])
+
+        query.run(self.manager)
+        self.assertIsNone(query.profile)
+
+    def test_run_queries(self):
+        """Test running a batch of queries builds each universe once and gives the same results in order."""
+        queries = [
+            Query(network_ids=[self.sialic_acid_id]),
+            Query(network_ids=[self.sialic_acid_id, self.egf_id]),
+            Query(network_ids=[self.sialic_acid_id]),
+            Query(network_ids=[self.egf_id]),
+            Query(network_ids=[self.egf_id, self.sialic_acid_id]),
+        ]
+        queries[0].append_seeding_neighbors([shp2])
+        queries[1].append_seeding_induction([shp2, syk, trem2])
+        queries[2].append_pipeline(enrich_protein_and_rna_origins)
+        queries[3].append_seeding_neighbors([shp2])  # not in the network, so the result is none
+        queries[4].append_seeding_neighbors([syk])
+
+        expected = [query.run(self.manager) if i != 3 else None for i, query in enumerate(queries)]
+
+        calls = []
+        get_graph_by_ids = self.manager.get_graph_by_ids
+
+        def get_graph_by_ids_counted(network_ids):
+            calls.append(network_ids)
+            return get_graph_by_ids(network_ids)
+
+        pools = []
+        pool = batch_module.Pool
+
+        def pool_counted(*args, **kwargs):
+            pools.append(args)
+            return pool(*args, **kwargs)
+
+        min_edges = pipeline_module.PARALLEL_MIN_EDGES
+        self.manager.get_graph_by_ids = get_graph_by_ids_counted
+        batch_module.Pool = pool_counted
+        pipeline_module.PARALLEL_MIN_EDGES = 0
+        try:
+            for processes in (None, 2):
+                del calls[:]
+                del pools[:]
+                results = run_queries(queries, self.manager, processes=processes)
+                self.assertEqual(3, len(calls), msg='each combination of networks should only be loaded once')
+                self.assertEqual(0 if processes is None else 2, len(pools), msg='groups should run in parallel')
+
+                self.assertEqual(len(queries), len(results))
+                self.assertIsNone(results[3])
+                for i, (expected_graph, result) in enumerate(zip(expected, results)):
+                    if i == 3:
+                        continue
+                    self.assertEqual(set(expected_graph), set(result))
+                    self.assertEqual(set(expected_graph.edges(keys=True)), set(result.edges(keys=True)))
+        finally:
+            del self.manager.get_graph_by_ids
+            batch_module.Pool = pool
+            pipeline_module.PARALLEL_MIN_EDGES = min_edges
+
+    def test_run_queries_missing_networks(self):
+        with self.assertRaises(QueryMissingNetworksError):
+            run_queries([Query()], self.manager)
+
+    def test_neighbors_restricted_to_networks(self):
+        """Test that the nodes from other networks are not used for seeding."""
+        query = Query(network_ids=[self.egf_id])
+        query.append_seeding_neighbors([shp2])
+        self.assertIsNone(query.run(self.manager, pushdown=True))
+
+    def test_induction(self):
+        query = Query(network_ids=[self.sialic_acid_id, self.egf_id])
+        query.append_seeding_induction([shp2, syk, trem2])
+        result = self.assert_same_result(query)
+        self.assertEqual(3, result.number_of_nodes())
+        self.assertEqual(2, result.number_of_edges())
+
+    def test_annotation(self):
+        query = Query(network_ids=[self.sialic_acid_id, self.egf_id])
+        query.append_seeding_annotation('Confidence', {'Low'})
+        result = self.assert_same_result(query)
+        self.assertEqual(2, result.number_of_edges())
+
+    def test_annotation_restricted_to_networks(self):
+        query = Query(network_ids=[self.egf_id])
+        query.append_seeding_annotation('Confidence', {'Low'})
+        result = self.assert_same_result(query)
+        self.assertEqual(0, result.number_of_edges())
+
+    def test_with_universe_pipeline(self):
+        """Test the universe is still available for pipeline functions that need it."""
+        query = Query(network_ids=[self.sialic_acid_id])
+        query.append_seeding_induction([shp2, syk])
+        query.append_pipeline(expand_nodes_neighborhoods, [shp2])
+        result = self.assert_same_result(query)
+        self.assertIn(cd33_phosphorylated, result)
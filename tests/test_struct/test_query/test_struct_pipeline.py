@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import json
 import logging
+import os
+import tempfile
 import unittest
 
 from six.moves import StringIO
@@ -8,10 +11,17 @@ from six.moves import StringIO
 from pybel import BELGraph
 from pybel.examples.egf_example import egf_graph
 from pybel.struct.mutation import enrich_protein_and_rna_origins
-from pybel.struct.pipeline import Pipeline, transformation
+from pybel.struct.operations import is_graph_view, subgraph_view
+from pybel.constants import ASSOCIATION, INCREASES
+from pybel.dsl import bioprocess, pathology, protein
+from pybel.struct.filters.node_predicates import is_protein
+from pybel.struct.pipeline import (
+    Pipeline, PipelineCache, PipelineProfile, in_place_transformation, transformation,
+)
+from pybel.struct.pipeline import pipeline as pipeline_module
 from pybel.struct.pipeline.decorators import (
-    deprecated, get_transformation, in_place_map, mapped, register_deprecated,
-    universe_map,
+    deprecated, get_transformation, in_place_map, is_pure, mapped, register_deprecated,
+    register_node_filter, register_pure, universe_map,
 )
 from pybel.struct.pipeline.exc import DeprecationMappingError, MetaValueError, MissingPipelineFunctionError
 
@@ -136,6 +146,122 @@ class TestPipeline(TestEgfExample):
 
         self.check_original_unchanged()
 
+    def test_pipeline_result_not_view(self):
+        """Test that the pipeline returns a graph that can be modified, even if no transformations ran."""
+        for pipeline in (Pipeline(), Pipeline.from_functions(['remove_isolated_nodes_op'])):
+            result = pipeline(self.graph)
+            self.assertFalse(is_graph_view(result))
+            self.assertIsNot(self.graph, result)
+            result.remove_nodes_from(list(result))
+            self.check_original_unchanged()
+
+    def test_copies_avoided(self):
+        """Test that in-place transformations after the first one don't copy the graph."""
+        pipeline = Pipeline.from_functions([
+            'enrich_protein_and_rna_origins',
+            'remove_isolated_nodes',
+            'prune_protein_rna_origins',
+        ])
+        self.assertIn('remove_isolated_nodes', in_place_map)
+
+        expected = self.graph.copy()
+        for name in ('enrich_protein_and_rna_origins', 'remove_isolated_nodes', 'prune_protein_rna_origins'):
+            get_transformation(name)(expected)
+
+        result = pipeline(self.graph)
+        self.check_original_unchanged()
+        self.assertEqual(set(expected), set(result))
+        self.assertEqual(set(expected.edges(keys=True)), set(result.edges(keys=True)))
+
+        self.assertEqual(1, pipeline.copies, msg='only the seed graph should be copied')
+        # the universe, the two later in-place transformations, and the result
+        self.assertEqual(4, pipeline.copies_avoided)
+
+        result = pipeline(self.graph, universe=self.graph)
+        self.assertEqual(1, pipeline.copies)
+        self.assertEqual(3, pipeline.copies_avoided)
+
+    def test_copies_view(self):
+        """Test that the result is copied if no transformation built a new graph."""
+        pipeline = Pipeline()
+        result = pipeline(self.graph)
+        self.assertEqual(1, pipeline.copies)
+        self.assertEqual(1, pipeline.copies_avoided)
+        self.assertIsNot(self.graph, result)
+
+    def test_meta_parallel(self):
+        """Test running the pipelines of meta-commands in worker processes."""
+        pipelines = [
+            Pipeline.from_functions(['enrich_protein_and_rna_origins']),
+            Pipeline.from_functions(['remove_isolated_nodes', 'remove_pathologies']),
+            Pipeline().append('remove_filtered_nodes', node_predicates=lambda graph, node: node.get('name') == 'EGF'),
+        ]
+
+        min_edges = pipeline_module.PARALLEL_MIN_EDGES
+        pipeline_module.PARALLEL_MIN_EDGES = 0
+        try:
+            for meta in (Pipeline.union, Pipeline.intersection):
+                for n in (2, 3):  # the last pipeline can't be pickled
+                    pipeline = meta(pipelines[:n])
+                    expected = pipeline(self.graph)
+
+                    pipeline = meta(pipelines[:n])
+                    self.assertEqual(n == 2, pipeline_module._is_picklable(pipeline.protocol[0]['pipelines']))
+                    result = pipeline(self.graph, processes=2)
+
+                    self.assertEqual(set(expected), set(result))
+                    self.assertEqual(set(expected.edges(keys=True)), set(result.edges(keys=True)))
+                    self.check_original_unchanged()
+        finally:
+            pipeline_module.PARALLEL_MIN_EDGES = min_edges
+
+    def test_profile(self):
+        """Test measuring each step of a pipeline."""
+        pipeline = Pipeline.from_functions(['enrich_protein_and_rna_origins', 'prune_protein_rna_origins'])
+        result = pipeline.run(self.graph, profile=True)
+        self.check_original_unchanged()
+
+        profile = pipeline.profile
+        self.assertIsInstance(profile, PipelineProfile)
+        self.assertEqual(['enrich_protein_and_rna_origins', 'prune_protein_rna_origins'], [s.name for s in profile])
+
+        enrich_step, prune_step = profile.steps
+        self.assertEqual(self.original_number_nodes, enrich_step.nodes_before)
+        self.assertEqual(self.original_number_edges, enrich_step.edges_before)
+        self.assertEqual(32, enrich_step.nodes_after)
+        self.assertEqual(32, prune_step.nodes_before)
+        self.assertEqual(result.number_of_nodes(), prune_step.nodes_after)
+        self.assertEqual(result.number_of_edges(), prune_step.edges_after)
+
+        for step in profile:
+            self.assertLessEqual(0, step.wall_time)
+            self.assertLessEqual(0, step.cpu_time)
+            self.assertLess(0, step.memory)
+
+        self.assertIn(profile.get_slowest_step(), profile.steps)
+
+        # the report survives a round trip through JSON
+        data = json.loads(json.dumps(profile.to_json()))
+        self.assertEqual(profile.to_json(), PipelineProfile.from_json(data).to_json())
+
+        lines = profile.to_table().split('\n')
+        self.assertEqual(5, len(lines))
+        self.assertTrue(lines[2].startswith('1  enrich_protein_and_rna_origins'))
+        self.assertIn('12 -> 32', lines[2])
+        self.assertTrue(lines[4].lstrip().startswith('total'))
+
+        pipeline.run(self.graph)
+        self.assertIsNone(pipeline.profile)
+
+    def test_profile_meta(self):
+        """Test that meta-commands are measured as one step."""
+        pipeline = Pipeline.union([
+            Pipeline.from_functions(['enrich_protein_and_rna_origins']),
+            Pipeline.from_functions(['remove_isolated_nodes']),
+        ])
+        pipeline.run(self.graph, profile=True)
+        self.assertEqual(['union'], [step.name for step in pipeline.profile])
+
 
 class TestDeprecation(unittest.TestCase):
 
@@ -194,3 +320,282 @@ class TestDeprecation(unittest.TestCase):
         self.assertNotIn('test_function_3_old', mapped)
         self.assertNotIn('test_function_3_old', universe_map)
         self.assertNotIn('test_function_3_old', in_place_map)
+
+
+_calls = []
+
+
+@register_pure
+@in_place_transformation
+def _test_remove_first_node(graph):
+    """Remove the first node in BEL order, counting the calls."""
+    _calls.append('remove_first')
+    graph.remove_node(min(graph, key=str))
+
+
+@in_place_transformation
+def _test_remove_last_node(graph):
+    """Remove the last node in BEL order, counting the calls, without being registered as pure."""
+    _calls.append('remove_last')
+    graph.remove_node(max(graph, key=str))
+
+
+class TestPipelineCache(TestEgfExample):
+    """Tests for caching the results of pipelines."""
+
+    def setUp(self):
+        super(TestPipelineCache, self).setUp()
+        del _calls[:]
+
+    def test_register_pure(self):
+        """Test registering functions as pure."""
+        self.assertTrue(is_pure('_test_remove_first_node'))
+        self.assertFalse(is_pure('_test_remove_last_node'))
+        self.assertFalse(is_pure('get_random_subgraph'))
+        self.assertTrue(is_pure('remove_pathologies'))
+        self.assertTrue(is_pure('enrich_protein_and_rna_origins'))
+        self.assertFalse(is_pure('missing function'))
+
+        with self.assertRaises(MissingPipelineFunctionError):
+            @register_pure
+            def test_function_4():
+                """Test bad usage of register_pure that throws a MissingPipelineFunctionError."""
+
+    def test_fingerprint(self):
+        """Test that the fingerprint of a graph doesn't depend on the order its nodes and edges were added."""
+        graph = BELGraph()
+        graph.add_nodes_from(sorted(self.graph, key=str, reverse=True))
+        graph.add_edges_from(reversed(list(self.graph.edges(keys=True, data=True))))
+
+        self.assertEqual(self.graph.get_fingerprint(), graph.get_fingerprint())
+
+        graph.remove_node(next(iter(self.graph)))
+        self.assertNotEqual(self.graph.get_fingerprint(), graph.get_fingerprint())
+
+    def test_fingerprint_memoized(self):
+        """Test that the fingerprint of a graph is kept until its nodes or edges are added or removed."""
+        graph = self.graph.copy()
+        calculate_fingerprint = graph._get_fingerprint
+        calls = []
+
+        def count_calculations():
+            calls.append(1)
+            return calculate_fingerprint()
+
+        graph._get_fingerprint = count_calculations
+
+        fingerprint = graph.get_fingerprint()
+        self.assertEqual(fingerprint, graph.get_fingerprint())
+        self.assertEqual(1, len(calls))
+
+        # running a pipeline with a cache reuses the fingerprint of the seed graph
+        Pipeline.from_functions(['_test_remove_first_node']).run(graph, cache=PipelineCache())
+        self.assertEqual(1, len(calls))
+
+        view = subgraph_view(graph)
+        self.assertEqual(fingerprint, view.get_fingerprint())
+
+        u, v, key, data = next(iter(graph.edges(keys=True, data=True)))
+        graph.remove_edge(u, v, key)
+        self.assertNotEqual(fingerprint, graph.get_fingerprint())
+        self.assertEqual(2, len(calls))
+        self.assertEqual(graph.get_fingerprint(), view.get_fingerprint(), msg='views should follow their graph')
+
+        graph.add_edge(u, v, key=key, **data)
+        self.assertEqual(fingerprint, graph.get_fingerprint())
+        self.assertEqual(3, len(calls))
+
+        graph.remove_node(u)
+        self.assertNotEqual(fingerprint, graph.get_fingerprint())
+        self.assertEqual(4, len(calls))
+
+    def test_prefix_cached(self):
+        """Test that the results of pure prefixes are reused."""
+        cache = PipelineCache()
+        pipeline = Pipeline.from_functions(['_test_remove_first_node', '_test_remove_first_node'])
+
+        result = pipeline(self.graph, cache=cache)
+        self.assertEqual(self.original_number_nodes - 2, result.number_of_nodes())
+        self.assertEqual(['remove_first', 'remove_first'], _calls)
+        self.assertEqual(2, len(cache))
+        self.check_original_unchanged()
+
+        # modifying the result doesn't change the cache
+        result.remove_nodes_from(list(result))
+
+        result = pipeline(self.graph, cache=cache)
+        self.assertEqual(self.original_number_nodes - 2, result.number_of_nodes())
+        self.assertEqual(['remove_first', 'remove_first'], _calls, msg='should have used the cache')
+        self.assertEqual(1, cache.hits)
+
+        # a longer pipeline starts from the longest cached prefix
+        longer_pipeline = Pipeline.from_functions(['_test_remove_first_node'] * 3)
+        result = longer_pipeline(self.graph, cache=cache)
+        self.assertEqual(self.original_number_nodes - 3, result.number_of_nodes())
+        self.assertEqual(['remove_first'] * 3, _calls)
+        self.assertEqual(3, len(cache))
+        self.check_original_unchanged()
+
+        # a different seed graph doesn't use the cache
+        graph = self.graph.copy()
+        graph.remove_node(max(graph, key=str))
+        result = pipeline(graph, cache=cache)
+        self.assertEqual(self.original_number_nodes - 3, result.number_of_nodes())
+        self.assertEqual(['remove_first'] * 5, _calls)
+
+    def test_impure_not_cached(self):
+        """Test that only the prefix before the first impure function is cached."""
+        cache = PipelineCache()
+        pipeline = Pipeline.from_functions([
+            '_test_remove_first_node',
+            '_test_remove_last_node',
+            '_test_remove_first_node',
+        ])
+
+        for _ in range(2):
+            result = pipeline(self.graph, cache=cache)
+            self.assertEqual(self.original_number_nodes - 3, result.number_of_nodes())
+
+        self.assertEqual(1, len(cache))
+        self.assertEqual(
+            ['remove_first', 'remove_last', 'remove_first', 'remove_last', 'remove_first'],
+            _calls,
+        )
+        self.check_original_unchanged()
+
+    def test_eviction(self):
+        """Test that the least recently used results are evicted."""
+        cache = PipelineCache(max_size=1)
+
+        Pipeline.from_functions(['_test_remove_first_node'] * 2)(self.graph, cache=cache)
+        self.assertEqual(1, len(cache))
+
+        # the result of the first step was evicted
+        Pipeline.from_functions(['_test_remove_first_node'])(self.graph, cache=cache)
+        self.assertEqual(['remove_first'] * 3, _calls)
+
+    def test_disk(self):
+        """Test that results evicted from memory are kept on disk."""
+        directory = tempfile.mkdtemp()
+        cache = PipelineCache(max_size=1, directory=directory, max_disk_size=1)
+
+        Pipeline.from_functions(['_test_remove_first_node'] * 3)(self.graph, cache=cache)
+        self.assertEqual(1, len(cache))
+        self.assertEqual(1, len(os.listdir(directory)), msg='the result of the first step should have been evicted')
+
+        result = Pipeline.from_functions(['_test_remove_first_node'] * 2)(self.graph, cache=cache)
+        self.assertEqual(self.original_number_nodes - 2, result.number_of_nodes())
+        self.assertEqual(['remove_first'] * 3, _calls, msg='should have used the disk')
+        self.assertEqual(1, len(os.listdir(directory)))
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, len(os.listdir(directory)))
+        os.rmdir(directory)
+
+
+class TestPipelineOptimizer(unittest.TestCase):
+    """Tests for fusing filters in pipelines."""
+
+    def setUp(self):
+        self.graph = BELGraph()
+        a, b, c = protein('HGNC', 'A'), protein('HGNC', 'B'), protein('HGNC', 'C')
+        d, e = pathology('MESH', 'D'), bioprocess('GO', 'E')
+        self.graph.add_edge(a, b, relation=ASSOCIATION)
+        self.graph.add_edge(a, c, relation=INCREASES)
+        self.graph.add_edge(b, c, relation=ASSOCIATION)
+        self.graph.add_edge(c, d, relation=INCREASES)
+        self.graph.add_edge(c, e, relation=INCREASES)
+        self.graph.add_edge(e, a, relation=INCREASES)
+
+        self.pipeline = Pipeline()
+        self.pipeline.append('remove_pathologies')
+        self.pipeline.append('remove_associations')
+        self.pipeline.append('remove_biological_processes')
+        self.pipeline.append('remove_isolated_nodes_op')
+        self.pipeline.append(
+            'remove_filtered_nodes',
+            node_predicates=[is_protein, lambda graph, node: node.name == 'C'],
+        )
+
+    def test_optimize(self):
+        """Test that consecutive filters are fused into one step that gives the same result."""
+        optimized = self.pipeline.optimize()
+
+        self.assertEqual(3, len(optimized))
+        self.assertEqual('remove_fused_filters', optimized.protocol[0]['function'])
+        self.assertEqual(1, len(optimized.protocol[0]['kwargs']['edge_filters']))
+        self.assertEqual(2, len(optimized.protocol[0]['kwargs']['node_filters']))
+        self.assertEqual('remove_isolated_nodes_op', optimized.protocol[1]['function'])
+        self.assertEqual('remove_filtered_nodes', optimized.protocol[2]['function'])
+
+        expected = self.pipeline(self.graph)
+        result = optimized(self.graph)
+        self.assertEqual(set(expected), set(result))
+        self.assertEqual(set(expected.edges(keys=True)), set(result.edges(keys=True)))
+        self.assertEqual({protein('HGNC', 'A')}, set(result))
+        self.assertEqual(0, result.number_of_edges())
+
+    def test_optimize_serializable(self):
+        """Test that an optimized pipeline can be serialized to JSON and cached."""
+        pipeline = Pipeline.from_functions([
+            'remove_pathologies',
+            'remove_associations',
+            'remove_biological_processes',
+            'remove_isolated_nodes_op',
+        ])
+        optimized = pipeline.optimize()
+
+        loaded = Pipeline.loads(optimized.dumps())
+        self.assertEqual(optimized.protocol, loaded.protocol)
+        self.assertIsNotNone(PipelineCache.get_key(self.graph.get_fingerprint(), None, loaded.protocol))
+
+        cache = PipelineCache()
+        expected = pipeline(self.graph)
+        result = loaded(self.graph, cache=cache)
+        self.assertEqual(set(expected), set(result))
+        self.assertEqual(set(expected.edges(keys=True)), set(result.edges(keys=True)))
+        self.assertEqual(2, len(cache))
+
+    def test_optimize_meta(self):
+        """Test that the filters in the pipelines of meta-commands are fused."""
+        pipeline = Pipeline.union([
+            Pipeline.from_functions(['remove_pathologies', 'remove_biological_processes']),
+            Pipeline.from_functions(['remove_associations']),
+        ])
+        optimized = pipeline.optimize()
+
+        subprotocols = optimized.protocol[0]['pipelines']
+        self.assertEqual(['remove_fused_filters'], [entry['function'] for entry in subprotocols[0]])
+        self.assertEqual(['remove_associations'], [entry['function'] for entry in subprotocols[1]])
+
+        expected = pipeline(self.graph)
+        result = optimized(self.graph)
+        self.assertEqual(set(expected), set(result))
+        self.assertEqual(set(expected.edges(keys=True)), set(result.edges(keys=True)))
+
+    def test_explain(self):
+        """Test describing the plan for running a pipeline."""
+        self.assertEqual(
+            [
+                '1. fused filter in one pass (3 steps):',
+                '   - remove_pathologies',
+                '   - remove_associations',
+                '   - remove_biological_processes',
+                '2. remove_isolated_nodes_op',
+                '3. remove_filtered_nodes',
+            ],
+            self.pipeline.explain().split('\n'),
+        )
+
+        sio = StringIO()
+        self.pipeline.print_explain(file=sio)
+        self.assertEqual(self.pipeline.explain() + '\n', sio.getvalue())
+
+    def test_register_filter_missing(self):
+        """Test that only in-place transformations can be registered as filters."""
+        with self.assertRaises(MissingPipelineFunctionError):
+            @register_node_filter(is_protein)
+            @transformation
+            def test_function_5(graph):
+                """Test bad usage of register_node_filter that throws a MissingPipelineFunctionError."""
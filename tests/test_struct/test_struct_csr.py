@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the CSR representation of BEL graphs."""
+
+import unittest
+
+from pybel import BELGraph
+from pybel.constants import CITATION_TYPE_PUBMED, DECREASES, INCREASES, TRANSCRIBED_TO
+from pybel.dsl import protein, rna
+from pybel.testing.utils import n
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+p1, p2, p3 = (protein(namespace='HGNC', name=name) for name in ('C', 'A', 'B'))
+r1 = rna(namespace='HGNC', name='C')
+
+
+@unittest.skipIf(np is None, 'Need numpy')
+class TestCSR(unittest.TestCase):
+    """Test converting BEL graphs to CSR arrays."""
+
+    def setUp(self):
+        self.graph = BELGraph()
+        self.graph.annotation_list['Test'] = {'a', 'b'}
+        self.k1 = self.graph.add_increases(p1, p2, citation='1', evidence=n(), annotations={'Test': {'a', 'b'}})
+        self.k2 = self.graph.add_decreases(p1, p2, citation='2', evidence=n())
+        self.k3 = self.graph.add_increases(p3, p1, citation='1', evidence=n(), annotations={'Test': {'b'}})
+        self.graph.add_transcription(r1, p1)
+
+    def test_nodes(self):
+        csr = self.graph.to_csr()
+        self.assertEqual(4, csr.number_of_nodes())
+        self.assertEqual(4, csr.number_of_edges())
+        self.assertEqual([p2, p3, p1, r1], csr.nodes)
+        self.assertEqual(2, csr.node_to_index[p1])
+
+    def test_adjacency(self):
+        csr = self.graph.to_csr()
+        i1, i2, i3, ir = (csr.node_to_index[node] for node in (p1, p2, p3, r1))
+
+        self.assertEqual([i2, i2], csr.get_successors(i1).tolist())
+        self.assertEqual({(p1, p2, self.k1), (p1, p2, self.k2)}, set(csr.get_edges(csr.get_out_edges(i1))))
+        self.assertEqual([i3, ir], csr.get_predecessors(i1).tolist())
+        self.assertEqual([(p3, p1, self.k3)], csr.get_edges(csr.get_in_edges(i1))[:1])
+        self.assertEqual([0, 1, 2, 1], csr.get_out_degrees().tolist())
+        self.assertEqual([2, 0, 2, 0], csr.get_in_degrees().tolist())
+
+        # round trip
+        self.assertEqual(set(self.graph.edges(keys=True)), set(csr.edges))
+        for edge_index, (u, v, key) in enumerate(csr.edges):
+            self.assertEqual(edge_index, csr.edge_to_index[u, v, key])
+            self.assertEqual(v, csr.nodes[csr.indices[edge_index]])
+
+    def test_edge_data(self):
+        csr = self.graph.to_csr()
+        self.assertEqual([DECREASES, INCREASES, TRANSCRIBED_TO], csr.relation_labels)
+        self.assertEqual([(CITATION_TYPE_PUBMED, '1'), (CITATION_TYPE_PUBMED, '2')], csr.citation_labels)
+        self.assertEqual([('Test', 'a'), ('Test', 'b')], csr.annotation_labels)
+
+        e1 = csr.edge_to_index[p1, p2, self.k1]
+        self.assertEqual(INCREASES, csr.relation_labels[csr.relations[e1]])
+        self.assertEqual((CITATION_TYPE_PUBMED, '1'), csr.citation_labels[csr.citations[e1]])
+        self.assertEqual([0, 1], csr.get_edge_annotations(e1).tolist())
+
+        e3 = csr.edge_to_index[p3, p1, self.k3]
+        self.assertEqual([1], csr.get_edge_annotations(e3).tolist())
+
+        transcription = csr.get_in_edges(csr.node_to_index[p1])[1]
+        self.assertEqual(-1, csr.citations[transcription])
+        self.assertEqual(0, len(csr.get_edge_annotations(transcription)))
+
+    def test_frozen(self):
+        self.assertIsNot(self.graph.to_csr(), self.graph.to_csr())
+        self.graph.freeze()
+        self.assertIs(self.graph.to_csr(), self.graph.to_csr())
@@ -3,12 +3,25 @@
 """Tests for data structures in PyBEL."""
 
 import unittest
+from collections import Counter
 
+import networkx as nx
 from six import StringIO, string_types
+from six.moves import cPickle as pickle
 
 from pybel import BELGraph
-from pybel.constants import CITATION_REFERENCE, CITATION_TYPE, CITATION_TYPE_PUBMED
-from pybel.dsl import hgvs, protein
+from pybel.constants import (
+    ABUNDANCE, CITATION_AUTHORS, CITATION_REFERENCE, CITATION_TYPE, CITATION_TYPE_PUBMED, COMPLEX, EQUIVALENT_TO, GENE,
+    PROTEIN, RELATION, RNA,
+)
+from pybel.dsl import abundance, complex_abundance, gene, hgvs, protein, rna
+from pybel.struct.filters import (
+    filter_nodes, function_inclusion_filter_builder, get_nodes_by_function, get_nodes_by_name, get_nodes_by_namespace,
+    name_inclusion_builder,
+)
+from pybel.struct.grouping import get_subgraphs_by_annotation
+from pybel.struct.mutation import get_subgraph_by_annotations, get_subgraph_by_authors, get_subgraph_by_pubmed
+from pybel.struct.summary import count_functions, iter_annotation_value_pairs
 from pybel.testing.utils import n
 
 
@@ -205,3 +218,319 @@ class TestGetGraphProperties(unittest.TestCase):
         graph.add_node_from_data(node)
 
         self.assertEqual(2, graph.number_of_nodes())
+
+
+class TestProvenanceIndex(unittest.TestCase):
+    """Test the index of edges by their annotations, citations, and authors."""
+
+    def setUp(self):
+        self.graph = BELGraph()
+        self.a, self.b, self.c, self.d = [protein(namespace='HGNC', name=n()) for _ in range(4)]
+
+        self.ab = self.graph.add_increases(
+            self.a, self.b, evidence=n(), annotations={'Species': '9606', 'Confidence': 'High'},
+            citation={CITATION_TYPE: CITATION_TYPE_PUBMED, CITATION_REFERENCE: '1', CITATION_AUTHORS: ['X', 'Y']},
+        )
+        self.bc = self.graph.add_increases(
+            self.b, self.c, evidence=n(), annotations={'Species': '9606'},
+            citation={CITATION_TYPE: CITATION_TYPE_PUBMED, CITATION_REFERENCE: '2', CITATION_AUTHORS: ['Y']},
+        )
+        self.cd = self.graph.add_decreases(
+            self.c, self.d, evidence=n(), annotations={'Species': '10090', 'Confidence': 'High'}, citation='3',
+        )
+        self.graph.add_has_variant(self.a, self.d)
+
+    def help_check_matches_scan(self):
+        """Check the indexed functions give the same results as scanning the edges."""
+        queries = [
+            lambda graph: get_subgraph_by_annotations(graph, {'Species': ['9606']}),
+            lambda graph: get_subgraph_by_annotations(graph, {'Species': ['9606', '10090']}),
+            lambda graph: get_subgraph_by_annotations(graph, {'Species': ['9606'], 'Confidence': ['High']}, or_=False),
+            lambda graph: get_subgraph_by_annotations(graph, {'Species': ['9606', '10090']}, or_=False),
+            lambda graph: get_subgraph_by_pubmed(graph, '1'),
+            lambda graph: get_subgraph_by_pubmed(graph, ['2', '3', '4']),
+            lambda graph: get_subgraph_by_authors(graph, 'Y'),
+            lambda graph: get_subgraph_by_authors(graph, ['X', 'Z']),
+        ]
+
+        index = self.graph.provenance_index
+        self.assertIsNotNone(index)
+        expected = []
+
+        self.graph.drop_provenance_index()
+        for query in queries:
+            expected.append(set(query(self.graph).edges(keys=True)))
+        expected_pairs = Counter(iter_annotation_value_pairs(self.graph))
+        expected_groups = get_subgraphs_by_annotation(self.graph, 'Species')
+        self.graph._provenance_index = index
+
+        for query, edges in zip(queries, expected):
+            self.assertEqual(edges, set(query(self.graph).edges(keys=True)))
+
+        self.assertEqual(expected_pairs, Counter(iter_annotation_value_pairs(self.graph)))
+
+        groups = get_subgraphs_by_annotation(self.graph, 'Species')
+        self.assertEqual(set(expected_groups), set(groups))
+        for value, subgraph in groups.items():
+            self.assertEqual(set(expected_groups[value].edges(keys=True)), set(subgraph.edges(keys=True)))
+
+    def test_build(self):
+        self.assertIsNone(self.graph.provenance_index)
+        index = self.graph.build_provenance_index()
+        self.assertEqual(3, len(index))
+        self.assertEqual({(self.a, self.b, self.ab)}, index.get_edges_by_citations(['1']))
+        self.help_check_matches_scan()
+
+    def test_add_edge(self):
+        index = self.graph.build_provenance_index()
+        key = self.graph.add_increases(self.d, self.a, evidence=n(), annotations={'Species': '9606'}, citation='4')
+        self.assertIn((self.d, self.a, key), index)
+        self.assertIn((self.d, self.a, key), index.get_edges_by_annotation('Species', '9606'))
+        self.help_check_matches_scan()
+
+    def test_add_edges_from(self):
+        index = self.graph.build_provenance_index()
+        other = BELGraph()
+        other.add_increases(self.d, self.a, evidence=n(), annotations={'Species': '9606'}, citation='4')
+        self.graph.add_edges_from(other.edges(keys=True, data=True))
+        self.assertEqual(4, len(index))
+        self.assertEqual(1, len(index.get_edges_by_citations(['4'])))
+        self.help_check_matches_scan()
+
+    def test_remove_edge(self):
+        index = self.graph.build_provenance_index()
+        self.graph.remove_edge(self.a, self.b, self.ab)
+        self.assertNotIn((self.a, self.b, self.ab), index)
+        self.assertEqual(set(), index.get_edges_by_citations(['1']))
+        self.assertEqual({'Y'}, set(index.authors))
+        self.help_check_matches_scan()
+
+    def test_remove_node(self):
+        index = self.graph.build_provenance_index()
+        self.graph.remove_node(self.c)
+        self.assertEqual(1, len(index))
+        self.assertNotIn('10090', index.annotations['Species'])
+        self.help_check_matches_scan()
+
+        self.graph.remove_nodes_from([self.a, self.d])
+        self.assertEqual(0, len(index))
+
+    def test_pickle(self):
+        """Test the index isn't pickled with the graph, but is built again after loading."""
+        expected = pickle.dumps(self.graph)
+        self.graph.build_provenance_index()
+        self.assertGreater(len(expected) + 64, len(pickle.dumps(self.graph)), msg='only a flag should be added')
+
+        self.graph = pickle.loads(pickle.dumps(self.graph))
+        self.help_check_matches_scan()
+
+    def test_clear(self):
+        index = self.graph.build_provenance_index()
+        self.graph.clear()
+        self.assertEqual(0, len(index))
+        self.assertEqual({}, index.annotations)
+
+
+class TestNodeIndex(unittest.TestCase):
+    """Test the index of nodes by their functions, namespaces, and names."""
+
+    def setUp(self):
+        self.graph = BELGraph()
+        self.akt1 = protein(namespace='HGNC', name='AKT1')
+        self.akt1_gene = gene(namespace='HGNC', name='AKT1')
+        self.egfr = protein(namespace='HGNC', name='EGFR')
+        self.complex = complex_abundance([self.akt1, self.egfr])
+        self.chemical = abundance(namespace='CHEBI', name='water')
+
+        self.graph.add_increases(self.akt1, self.egfr, evidence=n(), citation=n())
+        self.graph.add_transcription(self.akt1_gene, rna(namespace='HGNC', name='AKT1'))
+        self.graph.add_node_from_data(self.complex)
+        self.graph.add_node_from_data(self.chemical)
+
+    def test_lazy(self):
+        self.assertIsNone(self.graph._node_index)
+        index = self.graph.node_index
+        self.assertIs(index, self.graph.node_index)
+        self.assertEqual(self.graph.number_of_nodes(), len(index))
+
+    def test_lookups(self):
+        self.assertEqual({self.akt1, self.egfr}, set(get_nodes_by_function(self.graph, PROTEIN)))
+        self.assertEqual({self.chemical}, set(get_nodes_by_namespace(self.graph, 'CHEBI')))
+        self.assertEqual(
+            {self.akt1, self.akt1_gene, rna(namespace='HGNC', name='AKT1'), self.complex},
+            set(get_nodes_by_name(self.graph, 'HGNC', 'AKT1')),
+        )
+        self.assertEqual(
+            {self.akt1, self.complex},
+            set(filter_nodes(self.graph, [function_inclusion_filter_builder([PROTEIN, COMPLEX]),
+                                          name_inclusion_builder('HGNC', ['AKT1'])])),
+        )
+        self.assertEqual(Counter({PROTEIN: 2, GENE: 1, RNA: 1, COMPLEX: 1, ABUNDANCE: 1}), count_functions(self.graph))
+
+    def test_maintained(self):
+        index = self.graph.node_index
+
+        mapk1 = protein(namespace='HGNC', name='MAPK1')
+        self.graph.add_increases(self.egfr, mapk1, evidence=n(), citation=n())
+        self.assertIs(index, self.graph.node_index)
+        self.assertIn(mapk1, index.get_nodes_by_name('HGNC', 'MAPK1'))
+
+        self.graph.remove_node(self.complex)
+        self.assertIs(index, self.graph.node_index)
+        self.assertNotIn(COMPLEX, index.functions)
+        akt1_rna = rna(namespace='HGNC', name='AKT1')
+        self.assertEqual({self.akt1, self.akt1_gene, akt1_rna}, index.get_nodes_by_name('HGNC', 'AKT1'))
+
+        self.graph.remove_nodes_from([self.chemical])
+        self.assertNotIn('CHEBI', index.names)
+
+    def test_pickle(self):
+        """Test the index isn't pickled with the graph and is built again after loading."""
+        expected = pickle.dumps(self.graph)
+        self.assertIsNotNone(self.graph.node_index)
+        self.assertEqual(len(expected), len(pickle.dumps(self.graph)))
+
+        graph = pickle.loads(expected)
+        self.assertIsNone(graph._node_index)
+        self.assertEqual({self.chemical}, set(get_nodes_by_namespace(graph, 'CHEBI')))
+
+    def test_rebuilt(self):
+        """Test the index is rebuilt if nodes are added without going through BELGraph."""
+        index = self.graph.node_index
+        mapk1 = protein(namespace='HGNC', name='MAPK1')
+        nx.MultiDiGraph.add_node(self.graph, mapk1)
+        self.assertIsNot(index, self.graph.node_index)
+        self.assertEqual({mapk1}, set(get_nodes_by_name(self.graph, 'HGNC', 'MAPK1')))
+
+
+class TestEquivalenceIndex(unittest.TestCase):
+    """Test the union-find index of equivalent nodes."""
+
+    def setUp(self):
+        self.graph = BELGraph()
+        self.a, self.b, self.c, self.d, self.e = (protein(namespace=namespace, name='X') for namespace in 'ABCDE')
+
+        self.graph.add_equivalence(self.a, self.b)
+        self.graph.add_equivalence(self.b, self.c)
+        self.graph.add_increases(self.c, self.d, evidence=n(), citation=n())
+        self.graph.add_node_from_data(self.e)
+
+    def test_classes(self):
+        self.assertEqual({self.a, self.b, self.c}, self.graph.get_equivalent_nodes(self.a))
+        self.assertEqual({self.a, self.b, self.c}, self.graph.get_equivalent_nodes(self.c))
+        self.assertEqual({self.d}, self.graph.get_equivalent_nodes(self.d))
+        self.assertEqual(self.a, next(self.graph.iter_equivalent_nodes(self.a)))
+        self.assertEqual([{self.a, self.b, self.c}], self.graph.get_equivalence_classes())
+
+    def test_large_class(self):
+        """Test a long chain of equivalences, which would have hit the recursion limit when searched recursively."""
+        nodes = [protein(namespace='HGNC', name=str(i)) for i in range(2000)]
+        for u, v in zip(nodes, nodes[1:]):
+            self.graph.add_equivalence(u, v)
+
+        self.assertEqual(set(nodes), self.graph.get_equivalent_nodes(nodes[-1]))
+
+    def test_maintained(self):
+        index = self.graph.equivalence_index
+
+        self.graph.add_equivalence(self.d, self.e)
+        self.assertIs(index, self.graph.equivalence_index)
+        self.assertEqual({self.d, self.e}, self.graph.get_equivalent_nodes(self.e))
+
+        self.graph.add_edges_from([(self.e, self.a, {RELATION: EQUIVALENT_TO})])
+        self.assertEqual({self.a, self.b, self.c, self.d, self.e}, self.graph.get_equivalent_nodes(self.e))
+
+        self.graph.remove_node(self.e)
+        self.assertEqual({self.a, self.b, self.c}, self.graph.get_equivalent_nodes(self.a))
+        self.assertEqual({self.d}, self.graph.get_equivalent_nodes(self.d))
+
+        # the equivalence is still there in the other direction
+        self.graph.remove_edge(self.a, self.b)
+        self.assertEqual({self.a, self.b, self.c}, self.graph.get_equivalent_nodes(self.a))
+
+        self.graph.remove_edge(self.b, self.a)
+        self.assertEqual({self.a}, self.graph.get_equivalent_nodes(self.a))
+        self.assertEqual({self.b, self.c}, self.graph.get_equivalent_nodes(self.c))
+
+        self.graph.clear()
+        self.assertEqual(0, len(index))
+
+    def test_pickle(self):
+        """Test the index isn't pickled with the graph and is built again after loading."""
+        expected = pickle.dumps(self.graph)
+        self.assertIsNotNone(self.graph.equivalence_index)
+        self.assertEqual(len(expected), len(pickle.dumps(self.graph)))
+
+        graph = pickle.loads(expected)
+        self.assertIsNone(graph._equivalence_index)
+        self.assertEqual({self.a, self.b, self.c}, graph.get_equivalent_nodes(self.a))
+
+
+class TestFrozenGraph(unittest.TestCase):
+    """Test freezing graphs and memoizing the structures derived from them."""
+
+    def setUp(self):
+        self.graph = BELGraph()
+        self.akt1 = protein(namespace='HGNC', name='AKT1')
+        self.akt1_alt = protein(namespace='ALT', name='AKT1')
+        self.egfr = protein(namespace='HGNC', name='EGFR')
+        self.mapk1 = protein(namespace='HGNC', name='MAPK1')
+
+        self.graph.add_increases(self.akt1, self.egfr, evidence=n(), citation=n())
+        self.graph.add_equivalence(self.akt1, self.akt1_alt)
+        self.graph.add_node_from_data(self.mapk1)
+
+    def test_immutable(self):
+        self.assertIs(self.graph, self.graph.freeze())
+        self.assertTrue(nx.is_frozen(self.graph))
+
+        with self.assertRaises(nx.NetworkXError):
+            self.graph.add_increases(self.egfr, self.mapk1, evidence=n(), citation=n())
+
+        with self.assertRaises(nx.NetworkXError):
+            self.graph.remove_node(self.akt1)
+
+        self.assertIs(self.graph, self.graph.thaw())
+        self.assertFalse(nx.is_frozen(self.graph))
+        self.graph.add_increases(self.egfr, self.mapk1, evidence=n(), citation=n())
+        self.assertIn(self.mapk1, self.graph[self.egfr])
+
+    def test_memoized(self):
+        self.graph.freeze()
+
+        components = self.graph.get_weakly_connected_components()
+        self.assertEqual(2, len(components))
+        self.assertIs(components, self.graph.get_weakly_connected_components())
+
+        degrees = self.graph.get_degrees()
+        self.assertEqual(3, degrees[self.akt1])
+        self.assertIs(degrees, self.graph.get_degrees())
+
+        undirected = self.graph.get_undirected_graph()
+        self.assertTrue(nx.is_frozen(undirected))
+        self.assertIs(undirected, self.graph.get_undirected_graph())
+
+        self.assertEqual({self.akt1, self.akt1_alt}, self.graph.get_equivalent_nodes(self.akt1))
+        self.assertEqual(2, self.graph.summary_dict()['Number of Components'])
+
+        self.graph.thaw()
+        self.assertIsNone(self.graph._frozen_cache)
+        self.assertIsNot(components, self.graph.get_weakly_connected_components())
+        self.assertIsNot(self.graph.get_degrees(), self.graph.get_degrees())
+
+    def test_pickle(self):
+        """Test the memoized structures aren't pickled with a frozen graph, but it stays frozen."""
+        self.graph.freeze()
+        expected = pickle.dumps(self.graph)
+        self.graph.get_weakly_connected_components()
+        self.graph.get_degrees()
+        self.assertEqual(len(expected), len(pickle.dumps(self.graph)))
+
+        graph = pickle.loads(expected)
+        self.assertTrue(nx.is_frozen(graph))
+        self.assertEqual({}, graph._frozen_cache)
+        self.assertEqual(2, len(graph.get_weakly_connected_components()))
+
+        graph.thaw()
+        self.assertFalse(nx.is_frozen(graph))
+        graph.add_increases(self.egfr, self.mapk1, evidence=n(), citation=n())
@@ -4,10 +4,15 @@
 
 import unittest
 
+import networkx as nx
+
 from pybel import BELGraph
+from pybel.constants import ANNOTATIONS, CITATION, EVIDENCE
 from pybel.dsl import protein
+from pybel.struct.mutation import add_annotation_value, remove_annotation_value
 from pybel.struct.operations import (
-    left_full_join, left_node_intersection_join, left_outer_join, node_intersection, union,
+    is_graph_view, left_full_join, left_node_intersection_join, left_outer_join, materialize, node_intersection,
+    subgraph_view, union,
 )
 from pybel.testing.utils import n
 
@@ -115,6 +120,29 @@ class TestLeftFullJoin(unittest.TestCase):
         self.help_check_initial_g(self.g)
         self.help_check_initial_h(self.h)
 
+    def test_union_many(self):
+        """Test that the union of many graphs is the same as successive full joins."""
+        k = BELGraph()
+        k.annotation_list['Test'] = {'a'}
+        k.add_increases(p1, p2, citation='PMID2', evidence='Evidence 2', annotations={'Test': 'a'})
+        k.add_decreases(p3, p4, citation='PMID3', evidence='Evidence 4')
+        k.nodes[p1][self.tag] = 'overridden'
+
+        expected = self.g.fast_copy()
+        for graph in (self.h, self.h, k):
+            left_full_join(expected, graph)
+
+        for processes in (None, 2):
+            j = union([self.g, self.h, self.h, k], processes=processes)
+            self.assertEqual(set(expected.edges(keys=True)), set(j.edges(keys=True)))
+            self.assertEqual(expected.number_of_edges(), j.number_of_edges())
+            self.assertEqual(dict(expected.nodes(data=True)), dict(j.nodes(data=True)))
+            self.assertEqual('overridden', j.nodes[p1][self.tag])
+            self.assertEqual({'a'}, j.annotation_list['Test'])
+
+        self.help_check_initial_g(self.g)
+        self.help_check_initial_h(self.h)
+
 
 class TestLeftFullOuterJoin(unittest.TestCase):
     def setUp(self):
@@ -258,5 +286,106 @@ class TestInnerJoin(unittest.TestCase):
         self.assertEqual(self.g, res)
 
 
+class TestSubgraphView(unittest.TestCase):
+    """Test read-only views of graphs."""
+
+    def setUp(self):
+        self.graph = BELGraph(name='test', version='1.0.0')
+        self.k12 = self.graph.add_increases(p1, p2, citation=n(), evidence=n())
+        self.k23 = self.graph.add_decreases(p2, p3, citation=n(), evidence=n())
+        self.k34 = self.graph.add_increases(p3, p4, citation=n(), evidence=n())
+
+    def test_full_view(self):
+        view = subgraph_view(self.graph)
+        self.assertTrue(is_graph_view(view))
+        self.assertFalse(is_graph_view(self.graph))
+        self.assertIsInstance(view, BELGraph)
+        self.assertEqual('test', view.name)
+        self.assertEqual(set(self.graph.edges(keys=True)), set(view.edges(keys=True)))
+        self.assertIs(self.graph[p1][p2][self.k12], view[p1][p2][self.k12], msg='data should not be copied')
+        self.assertIs(view, subgraph_view(view))
+
+        with self.assertRaises(nx.NetworkXError):
+            view.add_node(p5)
+
+        with self.assertRaises(nx.NetworkXError):
+            view.remove_node(p1)
+
+    def test_filtered_view(self):
+        view = subgraph_view(self.graph, nodes={p1, p2, p3, p5})
+        self.assertEqual({p1, p2, p3}, set(view))
+        self.assertEqual({(p1, p2, self.k12), (p2, p3, self.k23)}, set(view.edges(keys=True)))
+
+        chained = subgraph_view(view, edges=[(p1, p2, self.k12), (p3, p4, self.k34)])
+        self.assertIs(self.graph, chained._graph)
+        self.assertEqual({(p1, p2, self.k12)}, set(chained.edges(keys=True)))
+
+    def test_materialize(self):
+        self.assertIs(self.graph, materialize(self.graph))
+
+        view = subgraph_view(self.graph, nodes={p1, p2})
+        graph = materialize(view)
+        self.assertFalse(is_graph_view(graph))
+        self.assertEqual({(p1, p2, self.k12)}, set(graph.edges(keys=True)))
+
+        graph.remove_node(p1)
+        self.assertIn(p1, self.graph)
+        self.assertIn(p1, view)
+
+
+class TestFastCopy(unittest.TestCase):
+    """Test copying graphs with :meth:`pybel.BELGraph.fast_copy`."""
+
+    def setUp(self):
+        self.graph = BELGraph(name='test', version='1.0.0')
+        self.graph.annotation_list['Test'] = {'a', 'b'}
+        self.k12 = self.graph.add_increases(p1, p2, citation=n(), evidence=n(), annotations={'Test': {'a': True}})
+        self.k23 = self.graph.add_decreases(p2, p3, citation=n(), evidence=n())
+
+    def test_copy(self):
+        graph = self.graph.fast_copy()
+        self.assertEqual('test', graph.name)
+        self.assertEqual(set(self.graph), set(graph))
+        self.assertEqual(set(self.graph.edges(keys=True)), set(graph.edges(keys=True)))
+        self.assertEqual(self.graph[p1][p2][self.k12], graph[p1][p2][self.k12])
+
+        # nested metadata is shared, but the edge data dictionaries are not
+        self.assertIsNot(self.graph[p1][p2][self.k12], graph[p1][p2][self.k12])
+        self.assertIs(self.graph[p1][p2][self.k12][CITATION], graph[p1][p2][self.k12][CITATION])
+        self.assertIs(graph._succ[p1][p2], graph._pred[p2][p1])
+
+        graph.remove_node(p1)
+        graph.add_increases(p3, p4, citation=n(), evidence=n())
+        graph[p2][p3][self.k23][EVIDENCE] = 'changed'
+        graph.annotation_list['Other'] = {'c'}
+
+        self.assertIn(p1, self.graph)
+        self.assertNotIn(p4, self.graph)
+        self.assertNotEqual('changed', self.graph[p2][p3][self.k23][EVIDENCE])
+        self.assertNotIn('Other', self.graph.annotation_list)
+
+    def test_copy_on_write(self):
+        graph = self.graph.fast_copy()
+
+        add_annotation_value(graph, 'Test', 'b')
+        self.assertEqual({'a': True, 'b': True}, graph[p1][p2][self.k12][ANNOTATIONS]['Test'])
+        self.assertEqual({'a': True}, self.graph[p1][p2][self.k12][ANNOTATIONS]['Test'])
+
+        remove_annotation_value(graph, 'Test', 'a')
+        self.assertEqual({'b': True}, graph[p1][p2][self.k12][ANNOTATIONS]['Test'])
+        self.assertEqual({'a': True}, self.graph[p1][p2][self.k12][ANNOTATIONS]['Test'])
+
+    def test_operator_copy_on_write(self):
+        other = BELGraph()
+        other.annotation_list['Test'] = {'c'}
+        other.add_increases(p3, p4, citation=n(), evidence=n())
+
+        result = self.graph + other
+        self.assertEqual({'a', 'b', 'c'}, result.annotation_list['Test'])
+        self.assertEqual({'a', 'b'}, self.graph.annotation_list['Test'])
+        self.assertEqual(3, result.number_of_edges())
+        self.assertEqual(2, self.graph.number_of_edges())
+
+
 if __name__ == '__main__':
     unittest.main()
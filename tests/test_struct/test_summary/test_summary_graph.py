@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for summarizing whole graphs in a single pass."""
+
+import unittest
+
+from six import StringIO
+
+from pybel.examples import egf_graph, sialic_acid_graph
+from pybel.struct.summary import (
+    count_annotations, count_citations, count_functions, count_namespaces, count_relations, count_variants,
+    get_top_hubs, print_summary, summary_dict,
+)
+
+
+class TestGraphSummary(unittest.TestCase):
+    """Test the single-pass graph summary."""
+
+    def help_test_consistent(self, graph):
+        """Test the summary has the same statistics as the individual summary functions.
+
+        :param pybel.BELGraph graph: A BEL graph
+        """
+        summary = graph.get_summary()
+
+        self.assertEqual(graph.number_of_nodes(), summary.number_of_nodes)
+        self.assertEqual(graph.number_of_edges(), summary.number_of_edges)
+        self.assertEqual(count_functions(graph), summary.functions)
+        self.assertEqual(count_namespaces(graph), summary.namespaces)
+        self.assertEqual(count_variants(graph), summary.variants)
+        self.assertEqual(count_relations(graph), summary.relations)
+        self.assertEqual(count_annotations(graph), summary.annotations)
+        self.assertEqual(count_citations(graph), summary.number_of_citations)
+        self.assertEqual(dict(graph.degree()), dict(summary.degrees))
+        self.assertEqual(
+            [degree for _, degree in get_top_hubs(graph, count=5)],
+            [degree for _, degree in summary.get_top_hubs(count=5)],
+        )
+
+    def test_sialic(self):
+        self.help_test_consistent(sialic_acid_graph)
+
+    def test_egf(self):
+        self.help_test_consistent(egf_graph)
+
+    def test_summary_dict(self):
+        result = summary_dict(sialic_acid_graph)
+        self.assertEqual(sialic_acid_graph.number_of_nodes(), result['nodes'])
+        self.assertEqual(sialic_acid_graph.number_of_edges(), result['edges'])
+        self.assertEqual(1, result['components'])
+        self.assertEqual(count_citations(sialic_acid_graph), result['citations'])
+        self.assertAlmostEqual(11 / 9.0, result['average degree'])
+
+        result = sialic_acid_graph.summary_dict()
+        self.assertEqual(sialic_acid_graph.number_of_edges(), result['Number of Edges'])
+
+        sio = StringIO()
+        print_summary(sialic_acid_graph, file=sio)
+        self.assertIn('Nodes: 9', sio.getvalue())
@@ -6,11 +6,12 @@ import unittest
 
 from pybel import BELGraph
 from pybel.constants import COMPLEX, FUNCTION
+from pybel.dsl import protein
 from pybel.examples.sialic_acid_example import (
     cd33, cd33_phosphorylated, shp1, shp2, sialic_acid, sialic_acid_cd33_complex, sialic_acid_graph, syk,
 )
 from pybel.struct.mutation.expansion.neighborhood import (
-    expand_node_neighborhood, expand_node_predecessors,
+    expand_all_node_neighborhoods, expand_node_neighborhood, expand_node_predecessors,
     expand_node_successors, expand_nodes_neighborhoods,
 )
 
@@ -77,4 +78,32 @@ class TestExpansion(unittest.TestCase):
         self.assertIn(sialic_acid_cd33_complex, graph)
         self.assertIn(cd33_phosphorylated, graph)
 
+    def test_neighborhoods_shared_neighbor(self):
+        """Test that the edges to a neighbor shared by the expanded nodes are added regardless of their order."""
+        a, b, c = protein('HGNC', 'A'), protein('HGNC', 'B'), protein('HGNC', 'C')
+
+        universe = BELGraph()
+        universe.add_increases(a, b, evidence='1', citation='1')
+        universe.add_increases(c, b, evidence='2', citation='2')
+
+        for nodes in ([a, c], [c, a]):
+            graph = BELGraph()
+            graph.add_node_from_data(a)
+            graph.add_node_from_data(c)
+
+            expand_nodes_neighborhoods(universe, graph, nodes)
+
+            self.assertEqual(3, graph.number_of_nodes())
+            self.assertEqual(2, graph.number_of_edges())
+            self.assertIn(b, graph[a])
+            self.assertIn(b, graph[c])
+
+        graph = BELGraph()
+        graph.add_node_from_data(a)
+        graph.add_node_from_data(c)
+
+        expand_all_node_neighborhoods(universe, graph)
+
+        self.assertEqual(2, graph.number_of_edges())
+
     # TODO test that if new nodes with metadata that's missing (namespace_url definition, etc) then that gets added too
@@ -2,9 +2,13 @@
 
 """Tests for PyBEL induction functions."""
 
+import itertools as itt
+import random
 import string
 import unittest
 
+import networkx as nx
+
 from pybel import BELGraph
 from pybel.constants import (
     ASSOCIATION, CITATION_AUTHORS, CITATION_REFERENCE, CITATION_TYPE, CITATION_TYPE_PUBMED, DECREASES, INCREASES,
@@ -16,6 +20,7 @@ from pybel.struct.mutation.induction.citation import get_subgraph_by_authors, ge
 from pybel.struct.mutation.induction.paths import get_nodes_in_all_shortest_paths, get_subgraph_by_all_shortest_paths
 from pybel.struct.mutation.induction.upstream import get_upstream_causal_subgraph
 from pybel.struct.mutation.induction.utils import get_subgraph_by_induction
+from pybel.testing.generate import generate_random_graph
 from pybel.testing.utils import n
 
 trem2_gene = gene(namespace='HGNC', name='TREM2')
@@ -105,6 +110,28 @@ class TestInduction(TestGraphMixin):
         self.assertNotIn(e, subgraph)
         self.assertNotIn(f, subgraph)
 
+    def test_get_nodes_in_all_shortest_paths_random(self):
+        """Test the nodes in shortest paths are the same as when enumerating the paths between each pair of nodes."""
+        random.seed(5)
+        graph = generate_random_graph(60, 150)
+        for u, v, k in graph.edges(keys=True):
+            graph[u][v][k]['weight'] = random.randint(1, 4)
+
+        query_nodes = random.sample(sorted(graph, key=str), 8)
+
+        for weight in (None, 'weight'):
+            expected = set()
+            for source, target in itt.product(query_nodes, repeat=2):
+                try:
+                    for path in nx.all_shortest_paths(graph, source, target, weight=weight):
+                        expected.update(path)
+                except nx.NetworkXNoPath:
+                    continue
+
+            for processes in (None, 2):
+                result = get_nodes_in_all_shortest_paths(graph, query_nodes, weight=weight, processes=processes)
+                self.assertEqual(expected, result, msg='weight={}, processes={}'.format(weight, processes))
+
     def test_get_upstream_causal_subgraph(self):
         """Test get_upstream_causal_subgraph."""
         a, b, c, d, e, f = [protein(namespace='test', name=n()) for _ in range(6)]
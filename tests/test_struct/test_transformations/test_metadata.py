@@ -8,7 +8,9 @@ from pybel import BELGraph
 from pybel.constants import ANNOTATIONS, INCREASES
 from pybel.dsl import protein
 from pybel.examples import sialic_acid_graph
-from pybel.struct.mutation import add_annotation_value, remove_annotation_value, strip_annotations
+from pybel.struct.mutation import (
+    add_annotation_value, get_subgraph_by_annotation_value, remove_annotation_value, strip_annotations,
+)
 from pybel.testing.utils import n
 
 
@@ -75,3 +77,34 @@ class TestMetadata(unittest.TestCase):
                 continue
 
             self.assertNotIn(value, annotation_values)
+
+    def test_strip_annotations_index(self):
+        """Test that stripping annotations updates the provenance index."""
+        graph = sialic_acid_graph.copy()
+        graph.build_provenance_index()
+        self.assertLess(0, get_subgraph_by_annotation_value(graph, 'Species', '9606').number_of_edges())
+
+        strip_annotations(graph)
+
+        self.assertEqual({}, graph.provenance_index.annotations)
+        self.assertEqual(0, get_subgraph_by_annotation_value(graph, 'Species', '9606').number_of_edges())
+
+    def test_add_and_remove_annotation_index(self):
+        """Test that adding and removing annotations updates the provenance index."""
+        graph = sialic_acid_graph.copy()
+        graph.annotation_url['test-annotation'] = n()
+        graph.build_provenance_index()
+
+        add_annotation_value(graph, 'test-annotation', 'test-value')
+
+        annotated = {
+            (u, v, k)
+            for u, v, k, d in graph.edges(keys=True, data=True)
+            if ANNOTATIONS in d
+        }
+        self.assertEqual(annotated, graph.provenance_index.annotations['test-annotation']['test-value'])
+
+        remove_annotation_value(graph, 'test-annotation', 'test-value')
+
+        self.assertNotIn('test-annotation', graph.provenance_index.annotations)
+        self.assertEqual(0, get_subgraph_by_annotation_value(graph, 'test-annotation', 'test-value').number_of_edges())
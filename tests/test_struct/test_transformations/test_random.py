@@ -2,6 +2,8 @@
 
 """Test for functions for inducing random sub-graphs."""
 
+from __future__ import division
+
 import random
 import sys
 import unittest
@@ -12,7 +14,7 @@ import networkx as nx
 from pybel.examples import sialic_acid_graph, statin_graph
 from pybel.struct.mutation.induction.paths import get_random_path
 from pybel.struct.mutation.induction.random_subgraph import (
-    _helper, get_graph_with_random_edges, get_random_node, get_random_subgraph,
+    FenwickRandomGenerator, _helper, get_graph_with_random_edges, get_random_node, get_random_subgraph,
 )
 from pybel.testing.generate import generate_random_graph
 
@@ -107,6 +109,52 @@ class TestRandom(unittest.TestCase):
         self.assertEqual(graph.number_of_edges(), sg_2.number_of_edges(),
                          msg='since graph is too small, the subgraph should contain the whole thing')
 
+    def test_random_sample_seed(self):
+        """Test that sampling with the same seed gives the same subgraph."""
+        graph = generate_random_graph(n_nodes=50, n_edges=500)
+
+        sg_1 = get_random_subgraph(graph, number_edges=100, seed=5)
+        sg_2 = get_random_subgraph(graph, number_edges=100, seed=5)
+
+        self.assertEqual(100, sg_1.number_of_edges())
+        self.assertEqual(set(sg_1.edges(keys=True)), set(sg_2.edges(keys=True)))
+
+    def test_fenwick_generator(self):
+        """Test the weighted random generator stays correct while its weights change."""
+        generator = FenwickRandomGenerator()
+        self.assertIsNone(generator.next())
+
+        for value, weight in zip('abcde', [1, 2, 3, 4, 0]):
+            generator.set_weight(value, weight)
+
+        self.assertEqual(4, len(generator))
+        self.assertIn('e', generator)
+        self.assertEqual(10, generator.total)
+
+        generator.set_weight('a', 0)
+        generator.set_weight('d', 1)
+        generator.set_weight('f', 4)
+
+        self.assertEqual(4, len(generator))
+        self.assertEqual(10, generator.total)
+
+        random.seed(127)
+        n = 30000
+        r = Counter(generator.next() for _ in range(n))
+
+        self.assertNotIn('a', r)
+        self.assertNotIn('e', r)
+        self.assertAlmostEqual(0.2, r['b'] / n, delta=0.015)
+        self.assertAlmostEqual(0.3, r['c'] / n, delta=0.015)
+        self.assertAlmostEqual(0.1, r['d'] / n, delta=0.015)
+        self.assertAlmostEqual(0.4, r['f'] / n, delta=0.015)
+
+        for value in 'bcdf':
+            generator.set_weight(value, 0)
+
+        self.assertEqual(0, len(generator))
+        self.assertIsNone(generator.next())
+
     def test_helper_failure(self):
         graph = nx.MultiDiGraph()
         graph.add_edge(1, 2)